@@ -12,6 +12,7 @@ from .version import __version__
 from .job.job import *
 from .job.session import *
 from .workspace import *
+from .results_store import ResultsStore
 
 from ._client.models._enums import JobStatus, SessionStatus, SessionJobFailurePolicy, ItemType
 
@@ -0,0 +1,150 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Conditional GET of workspace item details.
+
+Refreshing a job or session re-downloads its details. Deserializing them
+into a model is most of the client-side cost of polling, so unchanged
+details are detected and the current model is kept:
+
+- If the service returned an ETag (or Last-Modified) for the previous
+  details, the request carries If-None-Match (or If-Modified-Since) and a
+  304 response keeps the current details.
+- Otherwise the raw response body is hashed and compared to the hash of
+  the body the current details were deserialized from. SAS tokens are
+  masked before hashing since the service may re-sign the URIs on every
+  request; blob URIs with an expired SAS token are re-signed on use.
+"""
+
+import logging
+import re
+
+from typing import Callable, Optional, Union
+
+from azure.core.exceptions import (
+    ClientAuthenticationError,
+    HttpResponseError,
+    ResourceNotFoundError,
+    map_error,
+)
+from azure.core.rest import HttpRequest
+
+from azure.quantum._client.models import JobDetails, RestError, SessionDetails
+
+logger = logging.getLogger(__name__)
+
+# Query string of a URI that carries a SAS signature, within a JSON string
+_SAS_QUERY_PATTERN = re.compile(rb'\?[^"?]*\bsig=[^"]*')
+
+
+class DetailsValidator:
+    """Validators of the response the details of a workspace item
+    were deserialized from.
+
+    :param details: Deserialized details
+    :type details: Union[JobDetails, SessionDetails]
+    :param etag: ETag header of the response
+    :type etag: Optional[str]
+    :param last_modified: Last-Modified header of the response
+    :type last_modified: Optional[str]
+    :param body_hash: Hash of the response body
+    :type body_hash: int
+    """
+
+    __slots__ = ("details", "etag", "last_modified", "body_hash")
+
+    def __init__(
+        self,
+        details: Union[JobDetails, SessionDetails],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body_hash: int
+    ):
+        self.details = details
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body_hash = body_hash
+
+
+def get_details_if_modified(
+    operations,
+    build_request: Callable[..., HttpRequest],
+    model_name: str,
+    item_id: str,
+    details: Optional[Union[JobDetails, SessionDetails]],
+    validator: Optional[DetailsValidator]
+) -> DetailsValidator:
+    """Gets the details of a workspace item, deserializing them only if they
+    changed since the given validator was captured.
+
+    :param operations: Generated operations group of the item (jobs or sessions)
+    :param build_request: Generated request builder of the get operation,
+        called with the item id and the workspace path parameters
+    :type build_request: Callable[..., HttpRequest]
+    :param model_name: Name of the details model, e.g. "JobDetails"
+    :type model_name: str
+    :param item_id: Id of the item
+    :type item_id: str
+    :param details: Current details of the item
+    :type details: Union[JobDetails, SessionDetails]
+    :param validator: Validator captured when the current details were fetched
+    :type validator: Optional[DetailsValidator]
+    :return: Validator of the latest details; its `details` is the given
+        details object if they did not change
+    :rtype: DetailsValidator
+    """
+    # Validators only apply to the details object they were captured for,
+    # the details may have been replaced since
+    if validator is not None and validator.details is not details:
+        validator = None
+
+    config = operations._config
+    request = build_request(
+        item_id,
+        subscription_id=config.subscription_id,
+        resource_group_name=config.resource_group_name,
+        workspace_name=config.workspace_name,
+        api_version=config.api_version,
+    )
+    request.url = operations._client.format_url(
+        request.url,
+        azureRegion=operations._serialize.url(
+            "self._config.azure_region", config.azure_region, "str", skip_quote=True
+        ),
+    )
+    if validator is not None:
+        if validator.etag:
+            request.headers["If-None-Match"] = validator.etag
+        elif validator.last_modified:
+            request.headers["If-Modified-Since"] = validator.last_modified
+
+    pipeline_response = operations._client._pipeline.run(request, stream=False)
+    response = pipeline_response.http_response
+
+    if response.status_code == 304 and validator is not None:
+        logger.debug(f"{model_name} of {item_id} not modified")
+        return validator
+
+    if response.status_code != 200:
+        map_error(
+            status_code=response.status_code,
+            response=response,
+            error_map={401: ClientAuthenticationError, 404: ResourceNotFoundError},
+        )
+        error = operations._deserialize.failsafe_deserialize(RestError, pipeline_response)
+        raise HttpResponseError(response=response, model=error)
+
+    body_hash = hash(_SAS_QUERY_PATTERN.sub(b"?", response.body()))
+    if validator is not None and validator.body_hash == body_hash:
+        logger.debug(f"{model_name} of {item_id} unchanged")
+    else:
+        details = operations._deserialize(model_name, pipeline_response)
+
+    return DetailsValidator(
+        details,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        body_hash,
+    )
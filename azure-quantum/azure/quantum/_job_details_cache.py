@@ -0,0 +1,93 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import copy
+import threading
+
+from collections import OrderedDict
+from typing import Optional, Tuple, Type, TYPE_CHECKING
+
+from azure.quantum._client.models import JobDetails
+
+if TYPE_CHECKING:
+    from azure.quantum.job.job import Job
+
+# Statuses after which the details of a job no longer change
+TERMINAL_JOB_STATUSES = frozenset(["Succeeded", "Failed", "Cancelled"])
+
+
+class JobDetailsCache:
+    """Bounded least-recently-used cache of the details of finished jobs,
+    along with the job class resolved for their target.
+
+    Only jobs in a terminal status are cached, since their details
+    never change. Details are copied in and out of the cache, since
+    jobs may modify their details (e.g. decode their metadata).
+
+    :param max_size: Maximum number of cached jobs, 0 disables the cache
+    :type max_size: int
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[JobDetails, Optional[Type[Job]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, job_id: str) -> Optional[Tuple[JobDetails, Optional[Type["Job"]]]]:
+        """Returns a copy of the cached details and the job class of the given job, if any.
+
+        :param job_id: Job id
+        :type job_id: str
+        :return: Details and job class (None if not resolved yet)
+        :rtype: Optional[Tuple[JobDetails, Optional[Type[Job]]]]
+        """
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(job_id)
+        details, job_cls = entry
+        return copy.deepcopy(details), job_cls
+
+    def put(self, details: JobDetails, job_cls: Optional[Type["Job"]] = None) -> None:
+        """Caches a copy of the given details if the job is in a terminal status.
+
+        If the job is already cached, the job class is recorded if it was
+        not resolved yet.
+
+        :param details: Job details
+        :type details: JobDetails
+        :param job_cls: Job class resolved for the job's target, defaults to None
+        :type job_cls: Type[Job]
+        """
+        if self.max_size <= 0 or details.status not in TERMINAL_JOB_STATUSES:
+            return
+
+        details = copy.deepcopy(details)
+        with self._lock:
+            entry = self._entries.get(details.id)
+            if entry is not None:
+                job_cls = job_cls or entry[1]
+            self._entries[details.id] = (details, job_cls)
+            self._entries.move_to_end(details.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def remove(self, job_id: str) -> None:
+        """Removes the given job from the cache.
+
+        :param job_id: Job id
+        :type job_id: str
+        """
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Removes all jobs from the cache."""
+        with self._lock:
+            self._entries.clear()
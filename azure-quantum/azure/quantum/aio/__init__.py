@@ -0,0 +1,19 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+
+"""Azure Quantum asyncio API"""
+
+try:
+    import aiohttp  # noqa: F401 pylint: disable=unused-import
+except ImportError:
+    raise ImportError(
+        "Missing optional 'aio' dependencies. \
+To install run: pip install azure-quantum[aio]"
+    )
+
+from .workspace import AsyncWorkspace
+from .job import AsyncJob
+
+__all__ = ["AsyncWorkspace", "AsyncJob"]
@@ -0,0 +1,278 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+"""
+Asynchronous REST API client for the subset of the Azure Quantum
+data-plane operations used by :class:`~azure.quantum.aio.AsyncWorkspace`.
+
+The requests are built with the same request builders and (de)serializers
+as the generated synchronous `QuantumClient`, and are sent through an
+azure-core `AsyncPipelineClient`.
+"""
+
+import urllib.parse
+from typing import Any, AsyncIterator, Iterable
+
+from azure.core import AsyncPipelineClient
+from azure.core.async_paging import AsyncItemPaged, AsyncList
+from azure.core.exceptions import (
+    ClientAuthenticationError,
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+    ResourceNotModifiedError,
+    map_error,
+)
+from azure.core.pipeline import PipelineResponse
+from azure.core.pipeline import policies
+from azure.core.rest import HttpRequest
+from azure.core.utils import case_insensitive_dict
+
+from azure.quantum._client import models as _models
+from azure.quantum._client._configuration import QuantumClientConfiguration
+from azure.quantum._client._serialization import Deserializer, Serializer
+from azure.quantum._client.operations._operations import (
+    build_jobs_cancel_request,
+    build_jobs_create_request,
+    build_jobs_get_request,
+    build_jobs_list_request,
+    build_storage_sas_uri_request,
+)
+
+_ERROR_MAP = {
+    401: ClientAuthenticationError,
+    404: ResourceNotFoundError,
+    409: ResourceExistsError,
+    304: ResourceNotModifiedError,
+}
+
+
+class _AsyncOperationsBase:
+    def __init__(
+        self,
+        client: AsyncPipelineClient,
+        config: QuantumClientConfiguration,
+        serializer: Serializer,
+        deserializer: Deserializer,
+    ):
+        self._client = client
+        self._config = config
+        self._serialize = serializer
+        self._deserialize = deserializer
+
+    def _format_url(self, request: HttpRequest) -> HttpRequest:
+        request.url = self._client.format_url(
+            request.url,
+            azureRegion=self._serialize.url(
+                "self._config.azure_region", self._config.azure_region, "str", skip_quote=True
+            ),
+        )
+        return request
+
+    async def _run(
+        self,
+        request: HttpRequest,
+        expected_status_codes: Iterable[int] = (200,),
+        **kwargs: Any
+    ) -> PipelineResponse:
+        pipeline_response = await self._client._pipeline.run(  # pylint: disable=protected-access
+            self._format_url(request), stream=False, **kwargs
+        )
+        response = pipeline_response.http_response
+        if response.status_code not in expected_status_codes:
+            map_error(status_code=response.status_code, response=response, error_map=_ERROR_MAP)
+            error = self._deserialize.failsafe_deserialize(_models.RestError, pipeline_response)
+            raise HttpResponseError(response=response, model=error)
+        return pipeline_response
+
+
+class AsyncJobsOperations(_AsyncOperationsBase):
+    """Asynchronous counterpart of the generated `JobsOperations`."""
+
+    def list(self, **kwargs: Any) -> AsyncIterator[_models.JobDetails]:
+        """List jobs.
+
+        :return: An async iterator like instance of JobDetails
+        :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.quantum._client.models.JobDetails]
+        """
+        def prepare_request(next_link=None):
+            if not next_link:
+                return build_jobs_list_request(
+                    subscription_id=self._config.subscription_id,
+                    resource_group_name=self._config.resource_group_name,
+                    workspace_name=self._config.workspace_name,
+                    api_version=self._config.api_version,
+                )
+            parsed_next_link = urllib.parse.urlparse(next_link)
+            next_request_params = case_insensitive_dict(
+                {
+                    key: [urllib.parse.quote(v) for v in value]
+                    for key, value in urllib.parse.parse_qs(parsed_next_link.query).items()
+                }
+            )
+            next_request_params["api-version"] = self._config.api_version
+            return HttpRequest(
+                "GET", urllib.parse.urljoin(next_link, parsed_next_link.path), params=next_request_params
+            )
+
+        async def extract_data(pipeline_response):
+            deserialized = self._deserialize(
+                _models._models.JobDetailsList, pipeline_response  # pylint: disable=protected-access
+            )
+            return deserialized.next_link or None, AsyncList(deserialized.value)
+
+        async def get_next(next_link=None):
+            return await self._run(prepare_request(next_link), **kwargs)
+
+        return AsyncItemPaged(get_next, extract_data)
+
+    async def get(self, job_id: str, **kwargs: Any) -> _models.JobDetails:
+        """Get job by id.
+
+        :param job_id: Id of the job. Required.
+        :type job_id: str
+        :return: JobDetails
+        :rtype: ~azure.quantum._client.models.JobDetails
+        """
+        request = build_jobs_get_request(
+            job_id=job_id,
+            subscription_id=self._config.subscription_id,
+            resource_group_name=self._config.resource_group_name,
+            workspace_name=self._config.workspace_name,
+            api_version=self._config.api_version,
+        )
+        pipeline_response = await self._run(request, **kwargs)
+        return self._deserialize("JobDetails", pipeline_response)
+
+    async def create(self, job_id: str, job: _models.JobDetails, **kwargs: Any) -> _models.JobDetails:
+        """Create a job.
+
+        :param job_id: Id of the job. Required.
+        :type job_id: str
+        :param job: The complete metadata of the job to submit. Required.
+        :type job: ~azure.quantum._client.models.JobDetails
+        :return: JobDetails
+        :rtype: ~azure.quantum._client.models.JobDetails
+        """
+        request = build_jobs_create_request(
+            job_id=job_id,
+            subscription_id=self._config.subscription_id,
+            resource_group_name=self._config.resource_group_name,
+            workspace_name=self._config.workspace_name,
+            content_type="application/json",
+            api_version=self._config.api_version,
+            json=self._serialize.body(job, "JobDetails"),
+        )
+        pipeline_response = await self._run(request, expected_status_codes=(200, 201), **kwargs)
+        return self._deserialize("JobDetails", pipeline_response)
+
+    async def cancel(self, job_id: str, **kwargs: Any) -> None:
+        """Cancel a job.
+
+        :param job_id: Id of the job. Required.
+        :type job_id: str
+        """
+        request = build_jobs_cancel_request(
+            job_id=job_id,
+            subscription_id=self._config.subscription_id,
+            resource_group_name=self._config.resource_group_name,
+            workspace_name=self._config.workspace_name,
+            api_version=self._config.api_version,
+        )
+        await self._run(request, expected_status_codes=(204,), **kwargs)
+
+
+class AsyncStorageOperations(_AsyncOperationsBase):
+    """Asynchronous counterpart of the generated `StorageOperations`."""
+
+    async def sas_uri(self, blob_details: _models.BlobDetails, **kwargs: Any) -> _models.SasUriResponse:
+        """Gets a URL with SAS token for a container/blob in the storage account associated with the
+        workspace.
+
+        :param blob_details: The details (name and container) of the blob. Required.
+        :type blob_details: ~azure.quantum._client.models.BlobDetails
+        :return: SasUriResponse
+        :rtype: ~azure.quantum._client.models.SasUriResponse
+        """
+        request = build_storage_sas_uri_request(
+            subscription_id=self._config.subscription_id,
+            resource_group_name=self._config.resource_group_name,
+            workspace_name=self._config.workspace_name,
+            content_type="application/json",
+            api_version=self._config.api_version,
+            json=self._serialize.body(blob_details, "BlobDetails"),
+        )
+        pipeline_response = await self._run(request, **kwargs)
+        return self._deserialize("SasUriResponse", pipeline_response)
+
+
+class AsyncQuantumClient:
+    """Asynchronous Azure Quantum REST API client.
+
+    Accepts the same parameters as the generated
+    :class:`~azure.quantum._client.QuantumClient`.
+
+    :ivar jobs: AsyncJobsOperations operations
+    :vartype jobs: azure.quantum.aio._client.AsyncJobsOperations
+    :ivar storage: AsyncStorageOperations operations
+    :vartype storage: azure.quantum.aio._client.AsyncStorageOperations
+    """
+
+    def __init__(
+        self,
+        azure_region: str,
+        subscription_id: str,
+        resource_group_name: str,
+        workspace_name: str,
+        credential: Any,
+        **kwargs: Any
+    ) -> None:
+        endpoint = kwargs.pop("endpoint", f"https://{azure_region}.quantum.azure.com")
+        authentication_policy = kwargs.pop("authentication_policy", None)
+        self._config = QuantumClientConfiguration(
+            azure_region=azure_region,
+            subscription_id=subscription_id,
+            resource_group_name=resource_group_name,
+            workspace_name=workspace_name,
+            credential=credential,
+            **kwargs
+        )
+        if authentication_policy is None:
+            authentication_policy = policies.AsyncBearerTokenCredentialPolicy(
+                credential, *self._config.credential_scopes
+            )
+        pipeline_policies = [
+            policies.RequestIdPolicy(**kwargs),
+            self._config.headers_policy,
+            self._config.user_agent_policy,
+            self._config.proxy_policy,
+            policies.ContentDecodePolicy(**kwargs),
+            policies.AsyncRedirectPolicy(**kwargs),
+            policies.AsyncRetryPolicy(**kwargs),
+            authentication_policy,
+            self._config.custom_hook_policy,
+            self._config.logging_policy,
+            policies.DistributedTracingPolicy(**kwargs),
+            policies.SensitiveHeaderCleanupPolicy(**kwargs),
+            self._config.http_logging_policy,
+        ]
+        self._client = AsyncPipelineClient(base_url=endpoint, policies=pipeline_policies, **kwargs)
+
+        client_models = {k: v for k, v in _models._models.__dict__.items() if isinstance(v, type)}
+        client_models.update({k: v for k, v in _models.__dict__.items() if isinstance(v, type)})
+        self._serialize = Serializer(client_models)
+        self._deserialize = Deserializer(client_models)
+        self._serialize.client_side_validation = False
+        self.jobs = AsyncJobsOperations(self._client, self._config, self._serialize, self._deserialize)
+        self.storage = AsyncStorageOperations(self._client, self._config, self._serialize, self._deserialize)
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def __aenter__(self) -> "AsyncQuantumClient":
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self._client.__aexit__(*exc_details)
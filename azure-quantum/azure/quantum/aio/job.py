@@ -0,0 +1,540 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import asyncio
+import logging
+import time
+
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+
+from azure.storage.blob import BlobClient
+from azure.storage.blob.aio import BlobClient as AsyncBlobClient
+
+from azure.quantum._client.models import JobDetails
+from azure.quantum.job.base_job import ContentType, DEFAULT_TIMEOUT
+from azure.quantum.job.job import Job
+from azure.quantum.job.job_failed_with_results_error import JobFailedWithResultsError
+from azure.quantum.job.poll_policy import PollPolicy
+from azure.quantum.job.results_export import export_job_results, resolve_export_format
+from azure.quantum.job.shots_array import ShotsArray
+from azure.quantum.aio.storage import (
+    upload_blob,
+    download_blob,
+    download_blob_if_modified,
+    download_blob_properties,
+    ContainerClient,
+)
+
+if TYPE_CHECKING:
+    from azure.quantum.aio.workspace import AsyncWorkspace
+
+__all__ = ["AsyncJob"]
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=invalid-overridden-method
+class AsyncJob(Job):
+    """Azure Quantum Job that is submitted to a given AsyncWorkspace.
+
+    Exposes the service and storage operations of :class:`~azure.quantum.Job`
+    as coroutines. Job details, status checks and results decoding are shared
+    with the synchronous Job. The operations of the synchronous Job that
+    stream the results or poll in a background thread are not supported
+    and raise :class:`TypeError`.
+
+    :param workspace: AsyncWorkspace instance to submit job to
+    :type workspace: AsyncWorkspace
+    :param job_details: Job details model,
+            contains Job ID, name and other details
+    :type job_details: JobDetails
+    """
+
+    def __init__(self, workspace: "AsyncWorkspace", job_details: JobDetails, **kwargs):
+        super().__init__(
+            workspace=workspace,
+            job_details=job_details,
+            **kwargs
+        )
+
+    @classmethod
+    async def from_input_data(
+        cls,
+        workspace: "AsyncWorkspace",
+        name: str,
+        target: str,
+        input_data: bytes,
+        content_type: ContentType = ContentType.json,
+        blob_name: str = "inputData",
+        encoding: str = "",
+        job_id: str = None,
+        container_name: str = None,
+        provider_id: str = None,
+        input_data_format: str = None,
+        output_data_format: str = None,
+        input_params: Dict[str, Any] = None,
+        session_id: Optional[str] = None,
+        **kwargs
+    ) -> "AsyncJob":
+        """Create a new Azure Quantum job based on a raw input_data payload.
+
+        See :meth:`azure.quantum.job.BaseJob.from_input_data` for the
+        description of the parameters.
+
+        :return: Azure Quantum Job
+        :rtype: AsyncJob
+        """
+        # Generate job ID if not specified
+        if job_id is None:
+            job_id = cls.create_job_id()
+
+        # Create container if it does not yet exist
+        container_uri = await workspace.get_container_uri(
+            job_id=job_id,
+            container_name=container_name
+        )
+        logger.debug(f"Container URI: {container_uri}")
+
+        # Upload data to container
+        input_data_uri = await cls.upload_input_data(
+            container_uri=container_uri,
+            input_data=input_data,
+            content_type=content_type,
+            blob_name=blob_name,
+            encoding=encoding,
+        )
+
+        # Create and submit job
+        return await cls.from_storage_uri(
+            workspace=workspace,
+            job_id=job_id,
+            target=target,
+            input_data_uri=input_data_uri,
+            container_uri=container_uri,
+            name=name,
+            input_data_format=input_data_format,
+            output_data_format=output_data_format,
+            provider_id=provider_id,
+            input_params=input_params,
+            session_id=session_id,
+            **kwargs
+        )
+
+    @classmethod
+    async def from_storage_uri(
+        cls,
+        workspace: "AsyncWorkspace",
+        name: str,
+        target: str,
+        input_data_uri: str,
+        provider_id: str,
+        input_data_format: str,
+        output_data_format: str,
+        container_uri: str = None,
+        job_id: str = None,
+        input_params: Dict[str, Any] = None,
+        submit_job: bool = True,
+        session_id: Optional[str] = None,
+        **kwargs
+    ) -> "AsyncJob":
+        """Create new Job from URI if input data is already uploaded
+        to blob storage
+
+        See :meth:`azure.quantum.job.BaseJob.from_storage_uri` for the
+        description of the parameters.
+
+        :return: Job instance
+        :rtype: AsyncJob
+        """
+        if job_id is None:
+            job_id = cls.create_job_id()
+        if input_params is None:
+            input_params = {}
+
+        if container_uri is None:
+            container_uri = await workspace.get_container_uri(job_id=job_id)
+
+        details = JobDetails(
+            id=job_id,
+            name=name,
+            container_uri=container_uri,
+            input_data_format=input_data_format,
+            output_data_format=output_data_format,
+            input_data_uri=input_data_uri,
+            provider_id=provider_id,
+            target=target,
+            input_params=input_params,
+            session_id=session_id,
+            **kwargs
+        )
+        job = cls(workspace, details, **kwargs)
+
+        logger.info(
+            f"Submitting job '{name}'. \
+                Using payload from: '{job.details.input_data_uri}'"
+        )
+
+        if submit_job:
+            logger.debug(f"==> submitting: {job.details}")
+            await job.submit()
+
+        return job
+
+    @staticmethod
+    async def upload_input_data(
+        container_uri: str,
+        input_data: bytes,
+        content_type: Optional[ContentType] = ContentType.json,
+        blob_name: str = "inputData",
+        encoding: str = "",
+        return_sas_token: bool = False
+    ) -> str:
+        """Upload input data file
+
+        :param container_uri: Container URI
+        :type container_uri: str
+        :param input_data: Input data in binary format
+        :type input_data: bytes
+        :param content_type: Content type, e.g. "application/json"
+        :type content_type: Optional, ContentType
+        :param blob_name: Blob name, defaults to "inputData"
+        :type blob_name: str
+        :param encoding: Encoding, e.g. "gzip", defaults to ""
+        :type encoding: str
+        :param return_sas_token: Flag to return SAS token as part of URI, defaults to False
+        :type return_sas_token: bool
+        :return: Uploaded data URI
+        :rtype: str
+        """
+        async with ContainerClient.from_container_url(
+            container_uri
+        ) as container_client:
+            return await upload_blob(
+                container_client,
+                blob_name,
+                content_type,
+                encoding,
+                input_data,
+                return_sas_token=return_sas_token
+            )
+
+    async def submit(self):
+        """Submit a job to Azure Quantum."""
+        logger.debug(f"Submitting job with ID {self.id}")
+        job = await self.workspace.submit_job(self)
+        self.details = job.details
+
+    async def refresh(self):
+        """Refreshes the Job's details by querying the workspace."""
+        self.details = (await self.workspace.get_job(self.id)).details
+
+    async def wait_until_completed(
+        self,
+        max_poll_wait_secs=None,
+        timeout_secs=None,
+        print_progress=False,
+        poll_policy: Optional[PollPolicy] = None
+    ) -> None:
+        """Keeps refreshing the Job's details
+        until it reaches a finished status.
+
+        See :meth:`azure.quantum.Job.wait_until_completed`.
+
+        :param max_poll_wait_secs: Maximum poll wait time, defaults to None,
+            in which case the poll policy picks the maximum
+        :type max_poll_wait_secs: int
+        :param timeout_secs: Timeout in seconds, defaults to None
+        :type timeout_secs: int
+        :param print_progress: Print "." to stdout to display progress
+        :type print_progress: bool
+        :param poll_policy: Policy that schedules the refreshes, defaults to
+            the job's `poll_policy`
+        :type poll_policy: PollPolicy
+        :raises: :class:`TimeoutError` If the total poll time exceeds timeout, raise.
+        """
+        await self.refresh()
+        if poll_policy is None:
+            poll_policy = self.poll_policy
+        poll_waits = poll_policy.poll_waits(self, max_poll_wait_secs)
+        start_time = time.time()
+        while not self.has_completed():
+            elapsed_time = time.time() - start_time
+            if timeout_secs is not None and elapsed_time >= timeout_secs:
+                raise TimeoutError(f"The wait time has exceeded {timeout_secs} seconds.")
+
+            logger.debug(
+                f"Waiting for job {self.id},"
+                + f"it is in status '{self.details.status}'"
+            )
+            if print_progress:
+                print(".", end="", flush=True)
+            poll_wait = next(poll_waits)
+            if timeout_secs is not None:
+                poll_wait = min(poll_wait, timeout_secs - elapsed_time)
+            await asyncio.sleep(poll_wait)
+            await self.refresh()
+
+    async def _download_output(self, timeout_secs: float):
+        if not self.has_completed():
+            await self.wait_until_completed(timeout_secs=timeout_secs)
+
+        if not self.details.status == "Succeeded":
+            if self.details.status == "Failed" and self._allow_failure_results():
+                job_blob_properties = await self.download_blob_properties(self.details.output_data_uri)
+                if job_blob_properties.size > 0:
+                    job_failure_data = await self.download_data(self.details.output_data_uri)
+                    raise JobFailedWithResultsError("An error occurred during job execution.", job_failure_data)
+
+            raise self._results_unavailable_error()
+
+        payload = self._get_cached_output_data()
+        if payload is None:
+            payload = await self.download_data(self.details.output_data_uri)
+            self._set_cached_output_data(payload)
+        return payload
+
+    async def get_results(self, timeout_secs: float = DEFAULT_TIMEOUT, as_histogram: bool = False):
+        """Get job results by downloading the results blob from the
+        storage container linked via the workspace.
+
+        See :meth:`azure.quantum.Job.get_results`.
+
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :param as_histogram: Return the probabilities as a compact
+            :class:`azure.quantum.results.Histogram`, defaults to False
+        :type as_histogram: bool
+        :return: Results dictionary with histogram shots, or raw results if not a json object.
+        :rtype: typing.Any
+        """
+        if self.results is not None:
+            return self.results
+
+        payload = await self._download_output(timeout_secs)
+        if as_histogram:
+            return self._decode_histogram(payload, counts=False)
+        return self._decode_results(payload)
+
+    async def get_results_histogram(self, timeout_secs: float = DEFAULT_TIMEOUT, as_histogram: bool = False):
+        """Get job results histogram by downloading the results blob from the storage container linked via the workspace.
+
+        See :meth:`azure.quantum.Job.get_results_histogram`.
+
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :param as_histogram: Return the counts as a compact
+            :class:`azure.quantum.results.Histogram`, defaults to False
+        :type as_histogram: bool
+        :return: Results dictionary with histogram shots, or raw results if not a json object.
+        :rtype: typing.Any
+        """
+        if self.results is not None:
+            return self.results
+
+        payload = await self._download_output(timeout_secs)
+        if as_histogram:
+            return self._decode_histogram(payload, counts=True)
+        return self._decode_results_histogram(payload)
+
+    async def get_results_shots(self, timeout_secs: float = DEFAULT_TIMEOUT):
+        """Get job results per shot data by downloading the results blob from the
+        storage container linked via the workspace.
+
+        See :meth:`azure.quantum.Job.get_results_shots`.
+
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Results dictionary with histogram shots, or raw results if not a json object.
+        :rtype: typing.Any
+        """
+        if self.results is not None:
+            return self.results
+
+        payload = await self._download_output(timeout_secs)
+        return self._decode_results_shots(payload)
+
+    async def get_results_shots_array(
+        self,
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> Union[ShotsArray, List[ShotsArray]]:
+        """Get job results per shot data as a bit-packed matrix
+        (shots x measured bits) by downloading the results blob from the
+        storage container linked via the workspace.
+
+        See :meth:`azure.quantum.Job.get_results_shots_array`.
+
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Shots array, or one shots array per result for jobs with several results (batch results)
+        :rtype: Union[ShotsArray, List[ShotsArray]]
+        """
+        payload = await self._download_output(timeout_secs)
+        return self._decode_results_shots_array(payload)
+
+    async def export_results(
+        self,
+        directory: str,
+        format: Optional[str] = None,  # pylint: disable=redefined-builtin
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> List[str]:
+        """Export the job results histogram and per shot data as columnar tables.
+
+        See :meth:`azure.quantum.Job.export_results`.
+
+        :param directory: Directory to write the files to, created if it does not exist
+        :type directory: str
+        :param format: "parquet", "arrow" (Arrow IPC file) or "npz", defaults to
+            "parquet" if pyarrow is installed and "npz" otherwise
+        :type format: str
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Paths of the written files
+        :rtype: List[str]
+        """
+        format = resolve_export_format(format)
+        payload = await self._download_output(timeout_secs)
+        return export_job_results(self, directory, format, payload=payload)
+
+    def iter_results_shots(self, *args, **kwargs):
+        """Not supported by AsyncJob, see :meth:`get_results_shots`."""
+        raise self._unsupported_error("iter_results_shots", "get_results_shots")
+
+    def iter_results_histogram(self, *args, **kwargs):
+        """Not supported by AsyncJob, see :meth:`get_results_histogram`."""
+        raise self._unsupported_error("iter_results_histogram", "get_results_histogram")
+
+    def get_results_shots_store(self, *args, **kwargs):
+        """Not supported by AsyncJob, see :meth:`get_results_shots_array`."""
+        raise self._unsupported_error("get_results_shots_store", "get_results_shots_array")
+
+    def as_future(self, *args, **kwargs):
+        """Not supported by AsyncJob, see :meth:`wait_until_completed`."""
+        raise self._unsupported_error("as_future", "wait_until_completed")
+
+    def _prefetch_output(self) -> None:
+        # The output data of async jobs is not prefetched in background threads
+        pass
+
+    @staticmethod
+    def _unsupported_error(name: str, alternative: str) -> TypeError:
+        return TypeError(f"AsyncJob does not support {name}(), use the coroutine {alternative}() instead.")
+
+    async def download_data(self, blob_uri: str) -> bytes:
+        """Download file from blob uri
+
+        :param blob_uri: Blob URI
+        :type blob_uri: str
+        :return: Payload from blob
+        :rtype: bytes
+        """
+        blob_uri_with_sas_token = await self._get_blob_uri_with_sas_token(blob_uri)
+        if self._get_results_store() is None:
+            return await download_blob(blob_uri_with_sas_token)
+
+        async with AsyncBlobClient.from_blob_url(blob_uri_with_sas_token) as blob_client:
+            return await self._download_blob_using_store(blob_client)
+
+    async def _download_blob_using_store(self, blob_client: AsyncBlobClient) -> bytes:
+        """Downloads a blob, unless the results store has the same version of it.
+        The store is accessed in the default executor, not to block the event loop."""
+        store = self._get_results_store()
+        loop = asyncio.get_running_loop()
+        blob_name = f"{blob_client.container_name}/{blob_client.blob_name}"
+        stored = await loop.run_in_executor(None, store.get, self.id, blob_name)
+        etag, stored_data = stored if stored is not None else (None, None)
+
+        data, etag = await download_blob_if_modified(blob_client, etag)
+        if data is None:
+            logger.debug(f"Using stored blob {blob_name} of job {self.id}")
+            return stored_data
+
+        await loop.run_in_executor(None, store.put, self.id, blob_name, etag, data)
+        return data
+
+    async def download_blob_properties(self, blob_uri: str):
+        """Download Blob properties
+
+        :param blob_uri: Blob URI
+        :type blob_uri: str
+        :return: Blob properties
+        :rtype: BlobProperties
+        """
+        blob_uri_with_sas_token = await self._get_blob_uri_with_sas_token(blob_uri)
+        return await download_blob_properties(blob_uri_with_sas_token)
+
+    async def upload_attachment(
+        self,
+        name: str,
+        data: bytes,
+        container_uri: str = None,
+        **kwargs
+    ) -> str:
+        """Uploads an attachment to the job's container file. Attachment's are identified by name.
+        Uploading to an existing attachment overrides its previous content.
+
+        :param name: Attachment name
+        :type name: str
+        :param data: Attachment data in binary format
+        :type input_data: bytes
+        :param container_uri: Container URI, defaults to the job's linked container.
+        :type container_uri: str
+
+        :return: Uploaded data URI
+        :rtype: str
+        """
+        if container_uri is None:
+            container_uri = await self.workspace.get_container_uri(job_id=self.id)
+
+        return await self.upload_input_data(
+            container_uri = container_uri,
+            blob_name = name,
+            input_data = data,
+            **kwargs
+        )
+
+    async def download_attachment(
+        self,
+        name: str,
+        container_uri: str = None
+    ):
+        """ Downloads an attachment from job's container in Azure Storage.
+
+        :param name: Attachment name
+        :type name: str
+        :param container_uri: Container URI, defaults to the job's linked container.
+        :type container_uri: str
+
+        :return: Attachment data
+        :rtype: bytes
+        """
+        if container_uri is None:
+            container_uri = await self.workspace.get_container_uri(job_id=self.id)
+
+        async with ContainerClient.from_container_url(container_uri) as container_client:
+            blob_client = container_client.get_blob_client(name)
+            if self._get_results_store() is not None:
+                return await self._download_blob_using_store(blob_client)
+
+            stream = await blob_client.download_blob()
+            return await stream.readall()
+
+    async def _get_blob_uri_with_sas_token(self, blob_uri: str) -> str:
+        """Get Blob URI with SAS-token if one was not specified in blob_uri parameter
+        :param blob_uri: Blob URI
+        :type blob_uri: str
+        :return: Blob URI with SAS-token
+        :rtype: str
+        """
+        if not self._has_valid_sas_token(blob_uri):
+            # blob_uri does not contains SAS token or it is expired,
+            # get sas url from service
+            blob_client = BlobClient.from_blob_url(
+                blob_uri
+            )
+            blob_uri = await self.workspace._get_linked_storage_sas_uri(
+                blob_client.container_name, blob_client.blob_name
+            )
+
+        return blob_uri
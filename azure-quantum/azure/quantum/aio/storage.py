@@ -0,0 +1,164 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+import logging
+from typing import Any, Optional, Tuple
+from datetime import datetime, timedelta
+from azure.core import exceptions, MatchConditions
+from azure.storage.blob import (
+    BlobProperties,
+    BlobSasPermissions,
+    ContentSettings,
+    generate_container_sas,
+)
+from azure.storage.blob.aio import BlobClient, BlobServiceClient, ContainerClient
+
+from azure.quantum.storage import get_blob_uri_with_sas_token, remove_sas_token
+
+logger = logging.getLogger(__name__)
+
+
+async def create_container_using_client(container_client: ContainerClient):
+    """
+    Creates the container if it doesn't already exist.
+    """
+    if not await container_client.exists():
+        logger.debug(
+            f'{"  - uploading to **new** container:"}'
+            f"{container_client.container_name}"
+        )
+        await container_client.create_container()
+
+
+async def get_container_uri(connection_string: str, container_name: str) -> str:
+    """
+    Creates and initialize a container;
+    returns a URI with a SAS read/write token to access it.
+    """
+    async with BlobServiceClient.from_connection_string(
+        connection_string
+    ) as blob_service_client:
+        container = blob_service_client.get_container_client(container_name)
+        await create_container_using_client(container)
+
+    logger.info(
+        f'{"Creating SAS token for container"}'
+        + f"'{container_name}' on account: '{container.account_name}'"
+    )
+
+    sas_token = generate_container_sas(
+        container.account_name,
+        container.container_name,
+        account_key=container.credential.account_key,
+        permission=BlobSasPermissions(
+            read=True, add=True, write=True, create=True
+        ),
+        expiry=datetime.utcnow() + timedelta(days=14),
+    )
+
+    uri = container.url + "?" + sas_token
+    logger.debug(f"  - container url: '{uri}'.")
+    return uri
+
+
+async def upload_blob(
+    container: ContainerClient,
+    blob_name: str,
+    content_type: str,
+    content_encoding: str,
+    data: Any,
+    return_sas_token: bool = True,
+) -> str:
+    """
+    Uploads the given data to a blob record.
+    If a blob with the given name already exist, it throws an error.
+
+    Returns a uri with a SAS token to access the newly created blob.
+    """
+    await create_container_using_client(container)
+    logger.info(
+        f"Uploading blob '{blob_name}'"
+        + f"to container '{container.container_name}'"
+        + f"on account: '{container.account_name}'"
+    )
+
+    content_settings = ContentSettings(
+        content_type=content_type, content_encoding=content_encoding
+    )
+
+    blob = container.get_blob_client(blob_name)
+
+    await blob.upload_blob(data, content_settings=content_settings)
+    logger.debug(f"  - blob '{blob_name}' uploaded. generating sas token.")
+
+    if return_sas_token:
+        uri = get_blob_uri_with_sas_token(blob)
+    else:
+        uri = remove_sas_token(blob.url)
+    logger.debug(f"  - blob access url: '{uri}'.")
+
+    return uri
+
+
+async def download_blob(blob_url: str) -> Any:
+    """
+    Downloads the given blob from the container.
+    """
+    async with BlobClient.from_blob_url(blob_url) as blob_client:
+        logger.info(
+            f"Downloading blob '{blob_client.blob_name}'"
+            + f"from container '{blob_client.container_name}'"
+            + f"on account: '{blob_client.account_name}'"
+        )
+
+        stream = await blob_client.download_blob()
+        response = await stream.readall()
+    logger.debug(response)
+
+    return response
+
+
+async def download_blob_if_modified(
+    blob_client: BlobClient,
+    etag: Optional[str] = None
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Downloads the given blob, unless its ETag matches the given ETag.
+    Returns the content of the blob (None if it was not modified) and its ETag.
+    """
+    logger.info(
+        f"Downloading blob '{blob_client.blob_name}'"
+        + f"from container '{blob_client.container_name}'"
+        + f"on account: '{blob_client.account_name}'"
+    )
+
+    try:
+        if etag:
+            downloader = await blob_client.download_blob(
+                etag=etag, match_condition=MatchConditions.IfModified
+            )
+        else:
+            downloader = await blob_client.download_blob()
+    except exceptions.HttpResponseError as e:
+        if e.status_code == 304:
+            logger.debug(f"Blob '{blob_client.blob_name}' not modified")
+            return None, etag
+        raise
+
+    return await downloader.readall(), downloader.properties.etag
+
+
+async def download_blob_properties(blob_url: str) -> BlobProperties:
+    """Downloads the blob properties from Azure for the given blob URI"""
+    async with BlobClient.from_blob_url(blob_url) as blob_client:
+        logger.info(
+            f"Downloading blob properties '{blob_client.blob_name}'"
+            + f"from container '{blob_client.container_name}'"
+            + f"on account: '{blob_client.account_name}'"
+        )
+
+        response = await blob_client.get_blob_properties()
+    logger.debug(response)
+
+    return response
@@ -0,0 +1,452 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+"""
+Module providing the AsyncWorkspace class, used to connect to
+an Azure Quantum Workspace from asyncio code.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+import logging
+from typing import (
+    Any,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+from azure.identity.aio import DefaultAzureCredential
+from azure.quantum._client.models import (
+    BlobDetails,
+    JobStatus,
+)
+from azure.quantum._workspace_connection_params import (
+    WorkspaceConnectionParams
+)
+from azure.quantum._constants import (
+    ConnectionConstants,
+)
+from azure.quantum.results_store import ResultsStore
+from azure.quantum.aio._client import AsyncQuantumClient
+from azure.quantum.aio.storage import (
+    create_container_using_client,
+    get_container_uri,
+    ContainerClient,
+)
+if TYPE_CHECKING:
+    from azure.quantum.aio.job import AsyncJob
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["AsyncWorkspace"]
+
+
+class AsyncWorkspace:
+    """
+    Represents an Azure Quantum workspace, exposing its job operations
+    as coroutines so that many jobs can be driven from a single event loop.
+
+    Accepts the same parameters as :class:`~azure.quantum.Workspace`.
+    Use it as an async context manager, or call :meth:`close`,
+    to release the underlying connections.
+
+    :param subscription_id:
+        The Azure subscription ID.
+        Ignored if resource_id is specified.
+
+    :param resource_group:
+        The Azure resource group name.
+        Ignored if resource_id is specified.
+
+    :param name:
+        The Azure Quantum workspace name.
+        Ignored if resource_id is specified.
+
+    :param storage:
+        The Azure storage account connection string.
+        Required only if the specified Azure Quantum
+        workspace does not have linked storage.
+
+    :param resource_id:
+        The resource ID of the Azure Quantum workspace.
+
+    :param location:
+        The Azure region where the Azure Quantum workspace is provisioned.
+
+    :param credential:
+        The credential to use to connect to Azure services.
+        Both synchronous and asynchronous (`azure.identity.aio`) credentials are supported.
+
+        Defaults to the asynchronous `azure.identity.aio.DefaultAzureCredential`,
+        so that fetching tokens does not block the event loop; its tenant
+        is set by the `AZURE_TENANT_ID` environment variable.
+
+    :param user_agent:
+        Add the specified value as a prefix to the HTTP User-Agent header
+        when communicating to the Azure Quantum service.
+
+    :param results_store:
+        Local store of the job results and attachments downloaded from
+        Azure Storage, which are then only downloaded again if they changed.
+        Defaults to `None`, which disables the store.
+    """
+    def __init__(
+        self,
+        subscription_id: Optional[str] = None,
+        resource_group: Optional[str] = None,
+        name: Optional[str] = None,
+        storage: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        location: Optional[str] = None,
+        credential: Optional[object] = None,
+        user_agent: Optional[str] = None,
+        results_store: Optional[ResultsStore] = None,
+        **kwargs: Any,
+    ) -> None:
+        connection_params = WorkspaceConnectionParams(
+            location=location,
+            subscription_id=subscription_id,
+            resource_group=resource_group,
+            workspace_name=name,
+            credential=credential,
+            resource_id=resource_id,
+            user_agent=user_agent,
+            **kwargs
+        ).default_from_env_vars()
+
+        logger.info("Using %s environment.", connection_params.environment)
+
+        connection_params.assert_complete()
+
+        self._connection_params = connection_params
+        self._storage = storage
+        self._results_store = results_store
+        # Default credential created by the workspace, closed with it
+        self._default_credential = None
+
+        # Create AsyncQuantumClient
+        self._client = self._create_client()
+
+    @property
+    def location(self) -> str:
+        """
+        Returns the Azure location of the Quantum Workspace.
+
+        :return: Azure location name.
+        :rtype: str
+        """
+        return self._connection_params.location
+
+    @property
+    def subscription_id(self) -> str:
+        """
+        Returns the Azure Subscription ID of the Quantum Workspace.
+
+        :return: Azure Subscription ID.
+        :rtype: str
+        """
+        return self._connection_params.subscription_id
+
+    @property
+    def resource_group(self) -> str:
+        """
+        Returns the Azure Resource Group of the Quantum Workspace.
+
+        :return: Azure Resource Group name.
+        :rtype: str
+        """
+        return self._connection_params.resource_group
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the Name of the Quantum Workspace.
+
+        :return: Azure Quantum Workspace name.
+        :rtype: str
+        """
+        return self._connection_params.workspace_name
+
+    @property
+    def credential(self) -> Any:
+        """
+        Returns the Credential used to connect to the Quantum Workspace.
+
+        :return: Azure SDK Credential.
+        :rtype: typing.Any
+        """
+        return self._connection_params.credential
+
+    @property
+    def storage(self) -> str:
+        """
+        Returns the Azure Storage account connection string associated with the Quantum Workspace.
+
+        :return: Azure Storage account connection string.
+        :rtype: str
+        """
+        return self._storage
+
+    @property
+    def results_store(self) -> Optional[ResultsStore]:
+        """
+        Returns the local store of the job results and attachments, if any.
+
+        :return: Local results store.
+        :rtype: Optional[ResultsStore]
+        """
+        return self._results_store
+
+    @results_store.setter
+    def results_store(self, value: Optional[ResultsStore]) -> None:
+        """
+        Sets the local store of the job results and attachments.
+
+        :param value: Local results store, `None` to disable it.
+        :type value: Optional[ResultsStore]
+        """
+        self._results_store = value
+
+    @property
+    def user_agent(self) -> str:
+        """
+        Returns the Workspace's UserAgent string that is sent to
+        the service via the UserAgent header.
+
+        :return: User Agent string.
+        :rtype: str
+        """
+        return self._connection_params.get_full_user_agent()
+
+    def _create_client(self) -> AsyncQuantumClient:
+        """"
+        An internal method to create the underlying asynchronous REST API client.
+
+        :return: Asynchronous REST API client for Azure Quantum.
+        :rtype: AsyncQuantumClient
+        """
+        connection_params = self._connection_params
+        kwargs = {}
+        if connection_params.api_version:
+            kwargs["api_version"] = connection_params.api_version
+        return AsyncQuantumClient(
+            credential=self._get_credential_or_default(),
+            subscription_id=connection_params.subscription_id,
+            resource_group_name=connection_params.resource_group,
+            workspace_name=connection_params.workspace_name,
+            azure_region=connection_params.location,
+            user_agent=connection_params.get_full_user_agent(),
+            credential_scopes = [ConnectionConstants.DATA_PLANE_CREDENTIAL_SCOPE],
+            endpoint=connection_params.quantum_endpoint,
+            authentication_policy=connection_params.get_auth_policy(),
+            **kwargs
+        )
+
+    def _get_credential_or_default(self) -> Any:
+        """
+        Returns the credential if one was set, or a new asynchronous
+        `DefaultAzureCredential`, in the authority of the workspace's environment.
+        """
+        connection_params = self._connection_params
+        if connection_params.credential is not None:
+            return connection_params.credential
+
+        authority = (
+            ConnectionConstants.DOGFOOD_AUTHORITY
+            if connection_params.arm_endpoint == ConnectionConstants.ARM_DOGFOOD_ENDPOINT
+            else ConnectionConstants.AUTHORITY
+        )
+        self._default_credential = DefaultAzureCredential(authority=authority)
+        return self._default_credential
+
+    @classmethod
+    def from_connection_string(cls, connection_string: str, **kwargs) -> AsyncWorkspace:
+        """
+        Creates a new Azure Quantum AsyncWorkspace client from a connection string.
+
+        :param connection_string:
+            A valid connection string, usually obtained from the
+            `Quantum Workspace -> Operations -> Access Keys` blade in the Azure Portal.
+
+        :return: New Azure Quantum AsyncWorkspace client.
+        :rtype: AsyncWorkspace
+        """
+        connection_params = WorkspaceConnectionParams(connection_string=connection_string)
+        return cls(
+            subscription_id=connection_params.subscription_id,
+            resource_group=connection_params.resource_group,
+            name=connection_params.workspace_name,
+            location=connection_params.location,
+            credential=connection_params.credential,
+            **kwargs)
+
+    async def close(self) -> None:
+        """
+        Closes the connections of the underlying REST API client.
+        """
+        await self._client.close()
+        if self._default_credential is not None:
+            await self._default_credential.close()
+
+    async def __aenter__(self) -> AsyncWorkspace:
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_details: Any) -> None:
+        await self._client.__aexit__(*exc_details)
+        if self._default_credential is not None:
+            await self._default_credential.close()
+
+    async def _get_linked_storage_sas_uri(
+        self,
+        container_name: str,
+        blob_name: Optional[str] = None
+    ) -> str:
+        """
+        Calls the service and returns a container/blob SAS URL
+        for the Storage associated with the Quantum Workspace.
+
+        :param container_name:
+            The name of the storage container.
+
+        :param blob_name:
+            Optional name of the blob. Defaults to `None`.
+
+        :return: Storage Account SAS URL to a container or blob.
+        :rtype: str
+        """
+        blob_details = BlobDetails(
+            container_name=container_name, blob_name=blob_name
+        )
+        container_uri = await self._client.storage.sas_uri(blob_details=blob_details)
+
+        logger.debug("Container URI from service: %s", container_uri)
+        return container_uri.sas_uri
+
+    async def submit_job(self, job: AsyncJob) -> AsyncJob:
+        """
+        Submits a job to be processed in the Workspace.
+
+        :param job:
+            Job to submit.
+
+        :return: Azure Quantum Job that was submitted, with an updated status.
+        :rtype: AsyncJob
+        """
+        # pylint: disable=import-outside-toplevel
+        from azure.quantum.aio.job import AsyncJob
+
+        details = await self._client.jobs.create(
+            job.details.id, job.details
+        )
+        return AsyncJob(self, details)
+
+    async def cancel_job(self, job: AsyncJob) -> AsyncJob:
+        """
+        Requests the Workspace to cancel the
+        execution of a job.
+
+        :param job:
+            Job to cancel.
+
+        :return: Azure Quantum Job that was requested to be cancelled, with an updated status.
+        :rtype: AsyncJob
+        """
+        await self._client.jobs.cancel(job.details.id)
+        return await self.get_job(job.id)
+
+    async def get_job(self, job_id: str) -> AsyncJob:
+        """
+        Returns the job corresponding to the given id.
+
+        :param job_id:
+            Id of a job to fetch.
+
+        :return: Azure Quantum Job.
+        :rtype: AsyncJob
+        """
+        # pylint: disable=import-outside-toplevel
+        from azure.quantum.aio.job import AsyncJob
+
+        details = await self._client.jobs.get(job_id)
+        return AsyncJob(self, details)
+
+    async def list_jobs(
+        self,
+        name_match: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+        created_after: Optional[datetime] = None
+    ) -> List[AsyncJob]:
+        """
+        Returns list of jobs that meet optional (limited) filter criteria.
+
+        :param name_match:
+            Optional Regular Expression for job name matching. Defaults to `None`.
+
+        :param status:
+            Optional filter by job status. Defaults to `None`.
+
+        :param created_after:
+            Optional filter by jobs that were created after the given time. Defaults to `None`.
+
+        :return: Jobs that matched the search criteria.
+        :rtype: typing.List[AsyncJob]
+        """
+        # pylint: disable=import-outside-toplevel
+        from azure.quantum.aio.job import AsyncJob
+
+        result = []
+        async for details in self._client.jobs.list():
+            job = AsyncJob(self, details)
+            if job.matches_filter(name_match, status, created_after):
+                result.append(job)
+
+        return result
+
+    async def get_container_uri(
+        self,
+        job_id: Optional[str] = None,
+        container_name: Optional[str] = None,
+        container_name_format: Optional[str] = "job-{job_id}"
+    ) -> str:
+        """
+        Get container URI based on job ID or container name.
+        Creates a new container if it does not yet exist.
+
+        :param job_id:
+            Job ID, defaults to `None`.
+
+        :param container_name:
+            Container name, defaults to `None`.
+
+        :param container_name_format:
+            Container name format, defaults to "job-{job_id}".
+
+        :return: Container URI.
+        :rtype: str
+        """
+        if container_name is None:
+            if job_id is not None:
+                container_name = container_name_format.format(job_id=job_id)
+            elif job_id is None:
+                container_name = f"{self.name}-data"
+        # Create container URI and get container client
+        if self.storage is None:
+            # Get linked storage account from the service, create
+            # a new container if it does not yet exist
+            container_uri = await self._get_linked_storage_sas_uri(
+                container_name
+            )
+            async with ContainerClient.from_container_url(
+                container_uri
+            ) as container_client:
+                await create_container_using_client(container_client)
+        else:
+            # Use the storage acount specified to generate container URI,
+            # create a new container if it does not yet exist
+            container_uri = await get_container_uri(
+                self.storage, container_name
+            )
+        return container_uri
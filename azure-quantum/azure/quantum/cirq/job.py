@@ -76,6 +76,11 @@ class Job:
         """Poll the Azure Quantum API for results."""
         return self._azure_job.get_results(timeout_secs=timeout_seconds)
 
+    def as_future(self):
+        """Returns a concurrent.futures.Future that resolves to this job
+        once it reaches a finished status."""
+        return self._azure_job.as_future(result_factory=lambda _: self)
+
     def cancel(self):
         """Cancel the given job."""
         self._azure_job.workspace.cancel_job(self._azure_job)
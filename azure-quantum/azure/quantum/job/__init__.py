@@ -10,6 +10,11 @@ from .base_job import BaseJob
 from .filtered_job import FilteredJob
 from .job import Job, ContentType
 from .job_failed_with_results_error import JobFailedWithResultsError
+from .job_watcher import JobWatcher
+from .job_future import JobFuture
+from .poll_policy import PollPolicy, ExponentialBackoffPollPolicy, AdaptivePollPolicy
+from .shots_array import ShotsArray
+from .shot_store import ShotStore
 from .workspace_item import WorkspaceItem
 from .workspace_item_factory import WorkspaceItemFactory
 from .session import Session, SessionHost, SessionDetails, SessionStatus, SessionJobFailurePolicy
@@ -26,5 +31,12 @@ __all__ = [
     "SessionDetails",
     "SessionStatus",
     "SessionJobFailurePolicy",
-    "JobFailedWithResultsError"
+    "JobFailedWithResultsError",
+    "JobWatcher",
+    "JobFuture",
+    "PollPolicy",
+    "ExponentialBackoffPollPolicy",
+    "AdaptivePollPolicy",
+    "ShotsArray",
+    "ShotStore",
     ]
\ No newline at end of file
@@ -0,0 +1,184 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Incremental decoding of "microsoft.quantum-results.v2" output data.
+
+The output data is read chunk by chunk and only one item of the
+`Results[*].Shots` and `Results[*].Histogram` arrays is decoded at a time,
+so the output of jobs with many shots can be consumed in constant memory.
+"""
+
+import codecs
+import json
+
+from typing import Any, Iterable, Iterator, Tuple
+
+V2_DATA_FORMAT = "microsoft.quantum-results.v2"
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JsonStream:
+    """Reads JSON tokens and values from an iterable of UTF-8 encoded chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8_decoder = codecs.getincrementaldecoder("utf8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Appends the next chunk to the buffer, dropping the consumed part.
+        Returns False at the end of the data."""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._utf8_decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._utf8_decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character, or "" at the end of the data."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed output data: expected '{char}' but found '{found}'.")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decodes the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"Malformed output data: {e}") from e
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        """Skips the next JSON value, array items one at a time."""
+        if self.peek() == "[":
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+    def items(self) -> Iterator[Any]:
+        """Decodes the items of the next JSON array one at a time."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+            else:
+                self.expect("]")
+                return
+
+    def keys(self) -> Iterator[str]:
+        """Decodes the keys of the next JSON object. The value of each key
+        must be consumed before resuming the iteration."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Malformed output data: expected an object key.")
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self._pos += 1
+            else:
+                self.expect("}")
+                return
+
+
+def iter_v2_results(chunks: Iterable[bytes], field: str, result_index: int = 0) -> Iterator[Any]:
+    """Decodes the items of the `field` array ("Shots" or "Histogram") of
+    result `result_index` of "microsoft.quantum-results.v2" output data,
+    one at a time.
+
+    :param chunks: Output data, as UTF-8 encoded chunks
+    :type chunks: Iterable[bytes]
+    :param field: Name of the array to decode
+    :type field: str
+    :param result_index: Index of the result in the "Results" array, defaults to 0
+    :type result_index: int
+    :return: Items of the array
+    :rtype: Iterator[Any]
+    """
+    stream = _JsonStream(chunks)
+    data_format = None
+    results_count = None
+    field_found = False
+
+    if stream.peek() != "{":
+        raise ValueError(f"\"DataFormat\" was expected to be \"{V2_DATA_FORMAT}\" in the Job results for \"{V2_DATA_FORMAT}\" output format.")
+
+    for key in stream.keys():
+        if key == "DataFormat":
+            data_format = stream.value()
+            if data_format != V2_DATA_FORMAT:
+                raise ValueError(f"\"DataFormat\" was expected to be \"{V2_DATA_FORMAT}\" in the Job results for \"{V2_DATA_FORMAT}\" output format.")
+        elif key == "Results" and stream.peek() == "[":
+            results_count = 0
+            stream.expect("[")
+            while stream.peek() != "]":
+                if results_count > 0:
+                    stream.expect(",")
+                if results_count != result_index:
+                    stream.skip()
+                else:
+                    if stream.peek() != "{":
+                        raise ValueError(f"Result {result_index} was expected to be an object.")
+                    for result_key in stream.keys():
+                        if result_key == field and stream.peek() == "[":
+                            field_found = True
+                            yield from stream.items()
+                        else:
+                            stream.skip()
+                results_count += 1
+            stream.expect("]")
+        else:
+            stream.skip()
+
+    if data_format is None:
+        raise ValueError(f"\"DataFormat\" was expected to be \"{V2_DATA_FORMAT}\" in the Job results for \"{V2_DATA_FORMAT}\" output format.")
+    if results_count is None:
+        raise ValueError(f"\"Results\" field was expected to be in the Job results for \"{V2_DATA_FORMAT}\" output format.")
+    if results_count <= result_index:
+        raise ValueError(f"\"Results\" array was expected to contain at least {result_index + 1} item(s)")
+    if not field_found:
+        raise ValueError(f"\"{field}\" array was expected to be in the Job results for result {result_index} of \"{V2_DATA_FORMAT}\" output format.")
@@ -0,0 +1,129 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Conversion of the tuples of "microsoft.quantum-results.v2" outputs.
+
+Tuples are encoded as `{"Item1": ..., "ItemN": ...}` objects. All the
+shots and histogram outcomes of a result usually have the same layout, so
+the layout is inferred once from the first record and compiled into a
+converter made of closures specialised for it. Records that do not match
+the compiled layout are converted by the generic recursive converter,
+so the results are the same as converting every record generically.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, List
+
+_SCALAR_TYPES = frozenset([int, float, str, bool, type(None)])
+
+Converter = Callable[[Any], Any]
+
+
+def convert_tuples(data: Any) -> Any:
+    """Converts the tuples of a record, rediscovering its layout."""
+    if isinstance(data, dict):
+        # Check if the dictionary represents a tuple
+        if all(isinstance(k, str) and k.startswith("Item") for k in data.keys()):
+            # Convert the dictionary to a tuple
+            return tuple(convert_tuples(data[f"Item{i+1}"]) for i in range(len(data)))
+        else:
+            raise ValueError("Malformed tuple output")
+    elif isinstance(data, list):
+        # Recursively process list elements
+        return [convert_tuples(item) for item in data]
+    else:
+        # Return the data as is (int, string, etc.)
+        return data
+
+
+def compile_converter(sample: Any) -> Converter:
+    """Returns a converter specialised for the layout of the given record.
+
+    :param sample: Record the layout is inferred from
+    :type sample: Any
+    :return: Converter of records
+    :rtype: Callable[[Any], Any]
+    """
+    sample_type = type(sample)
+
+    if sample_type in _SCALAR_TYPES:
+        def convert_scalar(data):
+            if type(data) in _SCALAR_TYPES:
+                return data
+            return convert_tuples(data)
+        return convert_scalar
+
+    if sample_type is list:
+        if set(map(type, sample)) <= _SCALAR_TYPES:
+            def convert_register(data):
+                if type(data) is list and set(map(type, data)) <= _SCALAR_TYPES:
+                    return data[:]
+                return convert_tuples(data)
+            return convert_register
+
+        convert_item = compile_converter(sample[0])
+
+        def convert_array(data):
+            if type(data) is list:
+                return [convert_item(item) for item in data]
+            return convert_tuples(data)
+        return convert_array
+
+    if sample_type is dict:
+        keys = tuple(f"Item{i+1}" for i in range(len(sample)))
+        if sample.keys() != set(keys):
+            return convert_tuples
+
+        key_set = frozenset(keys)
+        items = tuple((key, compile_converter(sample[key])) for key in keys)
+
+        if len(items) == 2:
+            (key1, convert1), (key2, convert2) = items
+
+            def convert_pair(data):
+                if type(data) is dict and data.keys() == key_set:
+                    return (convert1(data[key1]), convert2(data[key2]))
+                return convert_tuples(data)
+            return convert_pair
+
+        def convert_tuple(data):
+            if type(data) is dict and data.keys() == key_set:
+                return tuple([convert(data[key]) for key, convert in items])
+            return convert_tuples(data)
+        return convert_tuple
+
+    return convert_tuples
+
+
+def convert_all(records: Iterable[Any]) -> List[Any]:
+    """Converts the tuples of records that usually share the same layout,
+    such as the shots of a result.
+
+    :param records: Records to convert
+    :type records: Iterable[Any]
+    :return: Converted records
+    :rtype: List[Any]
+    """
+    converted = []
+    convert = None
+    for record in records:
+        if convert is None:
+            convert = compile_converter(record)
+        converted.append(convert(record))
+    return converted
+
+
+def iter_convert_all(records: Iterable[Any]) -> Iterator[Any]:
+    """Lazy version of :func:`convert_all`.
+
+    :param records: Records to convert
+    :type records: Iterable[Any]
+    :return: Converted records
+    :rtype: Iterator[Any]
+    """
+    convert = None
+    for record in records:
+        if convert is None:
+            convert = compile_converter(record)
+        yield convert(record)
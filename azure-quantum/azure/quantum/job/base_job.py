@@ -12,7 +12,14 @@ from urllib.parse import urlparse, parse_qs
 from typing import Any, Dict, Optional, TYPE_CHECKING
 from azure.storage.blob import BlobClient
 
-from azure.quantum.storage import upload_blob, download_blob, download_blob_properties, ContainerClient
+from azure.quantum.storage import (
+    upload_blob,
+    download_blob,
+    download_blob_if_modified,
+    download_blob_properties,
+    ContainerClient,
+)
+from azure.quantum.results_store import ResultsStore
 from azure.quantum._client.models import JobDetails
 from azure.quantum.job.workspace_item import WorkspaceItem
 
@@ -282,9 +289,10 @@ class BaseJob(WorkspaceItem):
         """
         
         blob_uri_with_sas_token = self._get_blob_uri_with_sas_token(blob_uri)
-        payload = download_blob(blob_uri_with_sas_token)
+        if self._get_results_store() is None:
+            return download_blob(blob_uri_with_sas_token)
 
-        return payload
+        return self._download_blob_using_store(BlobClient.from_blob_url(blob_uri_with_sas_token))
 
 
     def download_blob_properties(self, blob_uri: str):
@@ -357,9 +365,31 @@ class BaseJob(WorkspaceItem):
         
         container_client = ContainerClient.from_container_url(container_uri)
         blob_client = container_client.get_blob_client(name)
+        if self._get_results_store() is not None:
+            return self._download_blob_using_store(blob_client)
+
         response = blob_client.download_blob().readall()
         return response
 
+    def _get_results_store(self) -> Optional[ResultsStore]:
+        """Returns the local results store of the workspace, if any."""
+        return getattr(self.workspace, "results_store", None)
+
+    def _download_blob_using_store(self, blob_client: BlobClient) -> bytes:
+        """Downloads a blob, unless the results store has the same version of it."""
+        store = self._get_results_store()
+        blob_name = f"{blob_client.container_name}/{blob_client.blob_name}"
+        stored = store.get(self.id, blob_name)
+        etag, stored_data = stored if stored is not None else (None, None)
+
+        data, etag = download_blob_if_modified(blob_client, etag)
+        if data is None:
+            logger.debug(f"Using stored blob {blob_name} of job {self.id}")
+            return stored_data
+
+        store.put(self.id, blob_name, etag, data)
+        return data
+
 
     def _get_blob_uri_with_sas_token(self, blob_uri: str) -> str:
         """Get Blob URI with SAS-token if one was not specified in blob_uri parameter
@@ -368,6 +398,26 @@ class BaseJob(WorkspaceItem):
         :return: Blob URI with SAS-token
         :rtype: str
         """
+        if not self._has_valid_sas_token(blob_uri):
+            # blob_uri does not contains SAS token or it is expired,
+            # get sas url from service
+            blob_client = BlobClient.from_blob_url(
+                blob_uri
+            )
+            blob_uri = self.workspace._get_linked_storage_sas_uri(
+                blob_client.container_name, blob_client.blob_name
+            )
+
+        return blob_uri
+
+    @staticmethod
+    def _has_valid_sas_token(blob_uri: str) -> bool:
+        """Check if the blob URI contains a SAS-token that is not about to expire
+        :param blob_uri: Blob URI
+        :type blob_uri: str
+        :return: True if the SAS-token can still be used
+        :rtype: bool
+        """
         url = urlparse(blob_uri)
         query_params = parse_qs(url.query)
         token_expire_query_param = query_params.get("se")
@@ -388,14 +438,4 @@ class BaseJob(WorkspaceItem):
             token_expire_time = token_expire_time - timedelta(minutes=5)
 
         current_utc_time = datetime.now(tz=timezone.utc)
-        if token_expire_time is None or current_utc_time >= token_expire_time:
-            # blob_uri does not contains SAS token or it is expired,
-            # get sas url from service
-            blob_client = BlobClient.from_blob_url(
-                blob_uri
-            )
-            blob_uri = self.workspace._get_linked_storage_sas_uri(
-                blob_client.container_name, blob_client.blob_name
-            )
-
-        return blob_uri
\ No newline at end of file
+        return token_expire_time is not None and current_utc_time < token_expire_time
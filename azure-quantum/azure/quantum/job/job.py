@@ -4,16 +4,27 @@
 ##
 
 
+import ast
 import logging
+import threading
 import time
 import json
 
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from azure.quantum._client.models import JobDetails
 from azure.quantum.job.job_failed_with_results_error import JobFailedWithResultsError
 from azure.quantum.job.base_job import BaseJob, ContentType, DEFAULT_TIMEOUT
 from azure.quantum.job.filtered_job import FilteredJob
+from azure.quantum.job.poll_policy import PollPolicy, AdaptivePollPolicy
+from azure.quantum.job.shots_array import ShotsArray
+from azure.quantum.job.shot_store import DEFAULT_BLOCK_SIZE, ShotStore
+from azure.quantum.job.results_export import export_job_results, resolve_export_format
+from azure.quantum.job._tuple_converter import compile_converter, convert_all, convert_tuples, iter_convert_all
+from azure.quantum.job._results_stream import V2_DATA_FORMAT, iter_v2_results
+from azure.quantum.storage import download_blob_chunks
 
 __all__ = ["Job", "JobDetails"]
 
@@ -21,10 +32,37 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from azure.quantum.workspace import Workspace
+    from azure.quantum.job.job_future import JobFuture
 
 
 _log = logging.getLogger(__name__)
 
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool that prefetches the output data of jobs."""
+    global _prefetch_executor  # pylint: disable=global-statement
+    with _prefetch_executor_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="azure-quantum-prefetch"
+            )
+        return _prefetch_executor
+
+
+def _iter_blocks(items: Iterator[Any], block_size: int) -> Iterator[List[Any]]:
+    """Yields the items in lists of up to `block_size` items."""
+    block = []
+    for item in items:
+        block.append(item)
+        if len(block) == block_size:
+            yield block
+            block = []
+    if block:
+        yield block
+
 
 class Job(BaseJob, FilteredJob):
     """Azure Quantum Job that is submitted to a given Workspace.
@@ -36,10 +74,27 @@ class Job(BaseJob, FilteredJob):
     :type job_details: JobDetails
     """
 
-    _default_poll_wait = 0.2
+    # Policy that schedules the refreshes of wait_until_completed,
+    # and by default of JobWatcher and JobFuture
+    poll_policy: PollPolicy = AdaptivePollPolicy()
+
+    # Download the results in the background as soon as polling
+    # sees the job finishing, see _prefetch_output
+    prefetch_results: bool = False
 
     def __init__(self, workspace: "Workspace", job_details: JobDetails, **kwargs):
         self.results = None
+        # Average queue time of the target when the job was submitted, if known
+        self._average_queue_time: Optional[float] = None
+        # Output data URI and background SAS resolution and download of the output
+        self._prefetch_uri: Optional[str] = None
+        self._prefetch_sas_uri: Optional[Future] = None
+        self._prefetch_data: Optional[Future] = None
+        # Output data downloaded for _output_data_uri, and its parsed JSON
+        # document, shared by the results accessors
+        self._output_data_uri: Optional[str] = None
+        self._output_data: Optional[bytes] = None
+        self._parsed_output: Optional[Tuple[bytes, Any]] = None
         super().__init__(
             workspace=workspace,
             details=job_details,
@@ -54,7 +109,7 @@ class Job(BaseJob, FilteredJob):
 
     def refresh(self):
         """Refreshes the Job's details by querying the workspace."""
-        self.details = self.workspace.get_job(self.id).details
+        self.workspace._refresh_job(self)
 
     def has_completed(self) -> bool:
         """Check if the job has completed."""
@@ -66,26 +121,44 @@ class Job(BaseJob, FilteredJob):
 
     def wait_until_completed(
         self,
-        max_poll_wait_secs=30,
+        max_poll_wait_secs=None,
         timeout_secs=None,
-        print_progress=True
+        print_progress=True,
+        poll_policy: Optional[PollPolicy] = None,
+        prefetch_results: bool = False
     ) -> None:
         """Keeps refreshing the Job's details
         until it reaches a finished status.
 
-        :param max_poll_wait_secs: Maximum poll wait time, defaults to 30
+        :param max_poll_wait_secs: Maximum poll wait time, defaults to None,
+            in which case the poll policy picks the maximum (30 seconds for
+            running jobs, longer for jobs waiting in a long queue)
         :type max_poll_wait_secs: int
         :param timeout_secs: Timeout in seconds, defaults to None
         :type timeout_secs: int
         :param print_progress: Print "." to stdout to display progress
         :type print_progress: bool
+        :param poll_policy: Policy that schedules the refreshes, defaults to
+            the job's `poll_policy`
+        :type poll_policy: PollPolicy
+        :param prefetch_results: Start downloading the results in the background
+            as soon as the job is finishing, so that a later call to `get_results`
+            does not wait for the download, defaults to False
+        :type prefetch_results: bool
         :raises: :class:`TimeoutError` If the total poll time exceeds timeout, raise.
         """
+        if prefetch_results:
+            self.prefetch_results = True
+            self._prefetch_output()
         self.refresh()
-        poll_wait = Job._default_poll_wait
+        self._prefetch_output()
+        if poll_policy is None:
+            poll_policy = self.poll_policy
+        poll_waits = poll_policy.poll_waits(self, max_poll_wait_secs)
         start_time = time.time()
         while not self.has_completed():
-            if timeout_secs is not None and (time.time() - start_time) >= timeout_secs:
+            elapsed_time = time.time() - start_time
+            if timeout_secs is not None and elapsed_time >= timeout_secs:
                 raise TimeoutError(f"The wait time has exceeded {timeout_secs} seconds.")
 
             logger.debug(
@@ -94,15 +167,125 @@ class Job(BaseJob, FilteredJob):
             )
             if print_progress:
                 print(".", end="", flush=True)
+            poll_wait = next(poll_waits)
+            if timeout_secs is not None:
+                poll_wait = min(poll_wait, timeout_secs - elapsed_time)
             time.sleep(poll_wait)
             self.refresh()
-            poll_wait = (
-                max_poll_wait_secs
-                if poll_wait >= max_poll_wait_secs
-                else poll_wait * 1.5
+            self._prefetch_output()
+
+    def _prefetch_output(self) -> None:
+        """Starts resolving the output data SAS URI once the job is finishing,
+        and downloading the output data once the job has succeeded,
+        if `prefetch_results` is set.
+
+        The output data is not downloaded while the job is finishing
+        since the output blob may not be complete yet.
+        """
+        if (not self.prefetch_results
+                or self.results is not None
+                or self._get_cached_output_data() is not None):
+            return
+
+        status = self.details.status
+        output_data_uri = self.details.output_data_uri
+        if status not in ("Finishing", "Succeeded") or not output_data_uri:
+            return
+
+        if self._prefetch_uri != output_data_uri:
+            self._prefetch_uri = output_data_uri
+            self._prefetch_data = None
+            self._prefetch_sas_uri = _get_prefetch_executor().submit(
+                self._get_blob_uri_with_sas_token, output_data_uri
             )
 
-    def get_results(self, timeout_secs: float = DEFAULT_TIMEOUT):
+        if status == "Succeeded" and self._prefetch_data is None:
+            sas_uri = self._prefetch_sas_uri
+            self._prefetch_data = _get_prefetch_executor().submit(
+                lambda: self.download_data(sas_uri.result())
+            )
+
+    def _download_output_data(self) -> bytes:
+        """Returns the output data of the job.
+
+        The output data is downloaded once per output data URI (or taken
+        from the prefetched download if there is one) and cached by the job.
+        """
+        payload = self._get_cached_output_data()
+        if payload is not None:
+            return payload
+
+        output_data_uri = self.details.output_data_uri
+        if self._prefetch_data is not None and self._prefetch_uri == output_data_uri:
+            try:
+                payload = self._prefetch_data.result()
+            except Exception as e:
+                logger.debug(f"Failed to prefetch the output data of job {self.id}: {e}")
+                self._prefetch_uri = None
+                self._prefetch_data = None
+
+        if payload is None:
+            payload = self.download_data(output_data_uri)
+        self._set_cached_output_data(payload)
+        return payload
+
+    def _get_cached_output_data(self) -> Optional[bytes]:
+        """Returns the cached output data, if it was downloaded
+        for the current output data URI."""
+        if self._output_data_uri is not None and self._output_data_uri == self.details.output_data_uri:
+            return self._output_data
+        return None
+
+    def _set_cached_output_data(self, payload: bytes) -> None:
+        """Caches the output data downloaded for the current output data URI."""
+        self._output_data_uri = self.details.output_data_uri
+        self._output_data = payload
+        self._parsed_output = None
+
+    def _parse_output(self, payload):
+        """Returns the JSON document of the given output data.
+
+        The document of the last parsed payload is cached, so that the
+        results accessors parse the output data once. It must not be modified,
+        nor returned to callers: accessors return structures built from it.
+        """
+        if self._parsed_output is None or self._parsed_output[0] is not payload:
+            self._parsed_output = (payload, json.loads(payload.decode("utf8")))
+        return self._parsed_output[1]
+
+    def as_future(
+        self,
+        result_factory: Optional[Callable[["Job"], Any]] = None,
+        prefetch_results: bool = False
+    ) -> "JobFuture":
+        """Returns a :class:`concurrent.futures.Future` that completes
+        when the job reaches a finished status.
+
+        The status of the job is refreshed by a background poller shared by
+        all job futures, so the future can be used with
+        :func:`concurrent.futures.as_completed`, :func:`concurrent.futures.wait`
+        and :meth:`~concurrent.futures.Future.add_done_callback`.
+
+        :param result_factory: Callable that receives the finished job and returns
+            the result of the future, defaults to returning the job itself
+        :type result_factory: Callable[[Job], Any]
+        :param prefetch_results: Start downloading the results in the background
+            as soon as the job is finishing, defaults to False
+        :type prefetch_results: bool
+        :return: Future of the job
+        :rtype: JobFuture
+        """
+        # pylint: disable=import-outside-toplevel
+        from azure.quantum.job.job_future import JobFuture, _JobPoller
+
+        if prefetch_results:
+            self.prefetch_results = True
+            self._prefetch_output()
+        future = JobFuture(self, result_factory=result_factory)
+        _JobPoller.instance().track(future)
+        return future
+
+    def get_results(self, timeout_secs: float = DEFAULT_TIMEOUT, as_histogram: bool = False):
         """Get job results by downloading the results blob from the
         storage container linked via the workspace.
         
@@ -115,6 +298,10 @@ class Job(BaseJob, FilteredJob):
 
         :param timeout_secs: Timeout in seconds, defaults to 300
         :type timeout_secs: float
+        :param as_histogram: Return the probabilities as a compact :class:`azure.quantum.results.Histogram`
+            of integer outcomes, which behaves as the results dictionary, defaults to False.
+            Supported for the "microsoft.quantum-results.v1" and "microsoft.quantum-results.v2" output formats
+        :type as_histogram: bool
         :return: Results dictionary with histogram shots, or raw results if not a json object.
         :rtype: typing.Any
         """
@@ -124,23 +311,21 @@ class Job(BaseJob, FilteredJob):
         if not self.has_completed():
             self.wait_until_completed(timeout_secs=timeout_secs)
 
-        if not self.details.status == "Succeeded":
-            if self.details.status == "Failed" and self._allow_failure_results():
-                job_blob_properties = self.download_blob_properties(self.details.output_data_uri)
-                if job_blob_properties.size > 0:
-                    job_failure_data = self.download_data(self.details.output_data_uri)
-                    raise JobFailedWithResultsError("An error occurred during job execution.", job_failure_data)
+        self._check_results_available()
 
-            raise RuntimeError(
-                f'{"Cannot retrieve results as job execution failed"}'
-                + f"(status: {self.details.status}."
-                + f"error: {self.details.error_data})"
-            )
+        payload = self._download_output_data()
+        if as_histogram:
+            return self._decode_histogram(payload, counts=False)
+        return self._decode_results(payload)
 
-        payload = self.download_data(self.details.output_data_uri)
+    def _decode_results(self, payload):
+        """Decodes the job output payload returned by `get_results`."""
         try:
-            payload = payload.decode("utf8")
-            results = json.loads(payload)
+            if self.details.output_data_format not in ("microsoft.quantum-results.v1", "microsoft.quantum-results.v2"):
+                # The document is returned as is, so it is not the shared parsed output
+                return json.loads(payload.decode("utf8"))
+
+            results = self._parse_output(payload)
 
             if self.details.output_data_format == "microsoft.quantum-results.v1":
                 if "Histogram" not in results:
@@ -181,9 +366,12 @@ class Job(BaseJob, FilteredJob):
             return results
         except:
             # If errors decoding the data, return the raw payload:
-            return payload
+            try:
+                return payload.decode("utf8")
+            except:
+                return payload
 
-    def get_results_histogram(self, timeout_secs: float = DEFAULT_TIMEOUT):
+    def get_results_histogram(self, timeout_secs: float = DEFAULT_TIMEOUT, as_histogram: bool = False):
         """Get job results histogram by downloading the results blob from the storage container linked via the workspace.
         
         Raises :class:`RuntimeError` if job execution fails.
@@ -195,6 +383,10 @@ class Job(BaseJob, FilteredJob):
 
         :param timeout_secs: Timeout in seconds, defaults to 300
         :type timeout_secs: float
+        :param as_histogram: Return the counts as a compact :class:`azure.quantum.results.Histogram`
+            of integer outcomes (one per result for batch results), which behaves as the
+            results dictionary, defaults to False
+        :type as_histogram: bool
         :return: Results dictionary with histogram shots, or raw results if not a json object.
         :rtype: typing.Any
         """
@@ -204,23 +396,17 @@ class Job(BaseJob, FilteredJob):
         if not self.has_completed():
             self.wait_until_completed(timeout_secs=timeout_secs)
 
-        if not self.details.status == "Succeeded":
-            if self.details.status == "Failed" and self._allow_failure_results():
-                job_blob_properties = self.download_blob_properties(self.details.output_data_uri)
-                if job_blob_properties.size > 0:
-                    job_failure_data = self.download_data(self.details.output_data_uri)
-                    raise JobFailedWithResultsError("An error occurred during job execution.", job_failure_data)
+        self._check_results_available()
 
-            raise RuntimeError(
-                f'{"Cannot retrieve results as job execution failed"}'
-                + f"(status: {self.details.status}."
-                + f"error: {self.details.error_data})"
-            )
+        payload = self._download_output_data()
+        if as_histogram:
+            return self._decode_histogram(payload, counts=True)
+        return self._decode_results_histogram(payload)
 
-        payload = self.download_data(self.details.output_data_uri)
+    def _decode_results_histogram(self, payload):
+        """Decodes the job output payload returned by `get_results_histogram`."""
         try:
-            payload = payload.decode("utf8")
-            results = json.loads(payload)
+            results = self._parse_output(payload)
 
             if self.details.output_data_format == "microsoft.quantum-results.v2":
                 if "DataFormat" not in results or results["DataFormat"] != "microsoft.quantum-results.v2":
@@ -265,6 +451,67 @@ class Job(BaseJob, FilteredJob):
         except Exception as e:
             raise e
 
+    def _decode_histogram(self, payload, counts: bool):
+        """Decodes the job output payload as compact histograms, of counts
+        as `get_results_histogram` or of probabilities as `get_results`.
+        The dictionary form of a histogram is only built when accessed."""
+        from azure.quantum.results.histogram import Histogram
+
+        output_data_format = self.details.output_data_format
+        results = self._parse_output(payload)
+
+        if output_data_format == "microsoft.quantum-results.v1" and not counts:
+            if "Histogram" not in results:
+                raise ValueError(f"\"Histogram\" array was expected to be in the Job results for \"{output_data_format}\" output format.")
+            histogram_values = results["Histogram"]
+            if len(histogram_values) % 2 != 0:
+                raise ValueError(f"\"Histogram\" array has invalid format. Even number of items is expected.")
+            displays = histogram_values[0::2]
+            probabilities = histogram_values[1::2]
+            return Histogram.from_outcomes(
+                (ast.literal_eval(display) for display in displays),
+                probabilities,
+                kind="probabilities",
+                dict_factory=lambda: dict(zip(displays, probabilities)),
+            )
+
+        if output_data_format != "microsoft.quantum-results.v2":
+            raise ValueError(f"Getting the results as a histogram is not supported for jobs using the \"{output_data_format}\" output format.")
+        if results.get("DataFormat") != "microsoft.quantum-results.v2":
+            raise ValueError(f"\"DataFormat\" was expected to be \"microsoft.quantum-results.v2\" in the Job results for \"{output_data_format}\" output format.")
+        if len(results.get("Results", [])) < 1:
+            raise ValueError("\"Results\" array was expected to contain at least one item")
+        for i, result in enumerate(results["Results"]):
+            if "Histogram" not in result:
+                raise ValueError(f"\"Histogram\" array was expected to be in the Job results for result {i} for \"{output_data_format}\" output format.")
+
+        if not counts:
+            result = results["Results"][0]
+            if "Shots" not in result:
+                raise ValueError(f"\"Shots\" array was expected to be in the Job results for \"{output_data_format}\" output format.")
+            histogram_values = result["Histogram"]
+            total_count = len(result["Shots"])
+            return Histogram.from_outcomes(
+                (value["Outcome"] for value in histogram_values),
+                (value["Count"] / total_count for value in histogram_values),
+                kind="probabilities",
+                dict_factory=lambda: {value["Display"]: value["Count"] / total_count for value in histogram_values},
+            )
+
+        def counts_histogram(histogram_values):
+            return Histogram.from_outcomes(
+                (value["Outcome"] for value in histogram_values),
+                (value["Count"] for value in histogram_values),
+                kind="counts",
+                dict_factory=lambda: {
+                    value["Display"]: {"outcome": outcome, "count": value["Count"]}
+                    for outcome, value in zip(self._process_outcome(histogram_values), histogram_values)
+                },
+            )
+
+        histograms = [counts_histogram(result["Histogram"]) for result in results["Results"]]
+        return histograms[0] if len(histograms) == 1 else histograms
+
     def get_results_shots(self, timeout_secs: float = DEFAULT_TIMEOUT):
         """Get job results per shot data by downloading the results blob from the
         storage container linked via the workspace.
@@ -287,23 +534,15 @@ class Job(BaseJob, FilteredJob):
         if not self.has_completed():
             self.wait_until_completed(timeout_secs=timeout_secs)
 
-        if not self.details.status == "Succeeded":
-            if self.details.status == "Failed" and self._allow_failure_results():
-                job_blob_properties = self.download_blob_properties(self.details.output_data_uri)
-                if job_blob_properties.size > 0:
-                    job_failure_data = self.download_data(self.details.output_data_uri)
-                    raise JobFailedWithResultsError("An error occurred during job execution.", job_failure_data)
+        self._check_results_available()
 
-            raise RuntimeError(
-                f'{"Cannot retrieve results as job execution failed"}'
-                + f"(status: {self.details.status}."
-                + f"error: {self.details.error_data})"
-            )
+        payload = self._download_output_data()
+        return self._decode_results_shots(payload)
 
-        payload = self.download_data(self.details.output_data_uri)
+    def _decode_results_shots(self, payload):
+        """Decodes the job output payload returned by `get_results_shots`."""
         try:
-            payload = payload.decode("utf8")
-            results = json.loads(payload)
+            results = self._parse_output(payload)
 
             if self.details.output_data_format == "microsoft.quantum-results.v2":
                 if "DataFormat" not in results or results["DataFormat"] != "microsoft.quantum-results.v2":
@@ -321,14 +560,14 @@ class Job(BaseJob, FilteredJob):
                     if "Shots" not in result:
                         raise ValueError(f"\"Shots\" array was expected to be in the Job results for \"{self.details.output_data_format}\" output format.")
                     
-                    return [self._convert_tuples(shot) for shot in result["Shots"]]
+                    return convert_all(result["Shots"])
                 else:
                     # This is handling the BatchResults edge case
                     shotsArray = []
                     for i, result in enumerate(results):
                         if "Shots" not in result:
                             raise ValueError(f"\"Shots\" array was expected to be in the Job results for result {i} of \"{self.details.output_data_format}\" output format.")
-                        shotsArray.append([self._convert_tuples(shot) for shot in result["Shots"]])
+                        shotsArray.append(convert_all(result["Shots"]))
                     
                     return shotsArray
             else:   
@@ -336,23 +575,246 @@ class Job(BaseJob, FilteredJob):
         except Exception as e:
             raise e
 
+    def get_results_shots_array(self, timeout_secs: float = DEFAULT_TIMEOUT) -> Union[ShotsArray, List[ShotsArray]]:
+        """Get job results per shot data as a bit-packed matrix
+        (shots x measured bits) by downloading the results blob from the
+        storage container linked via the workspace.
+
+        The layout of the shots (registers and tuples) is described by the
+        `layout` of the returned :class:`ShotsArray`.
+
+        Raises :class:`RuntimeError` if job execution fails.
+
+        Raises :class:`ValueError` if job output is malformed or output format is not compatible,
+                or if the shots contain values other than bits.
+
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Shots array, or one shots array per result for jobs with several results (batch results)
+        :rtype: Union[ShotsArray, List[ShotsArray]]
+        """
+        if not self.has_completed():
+            self.wait_until_completed(timeout_secs=timeout_secs)
+
+        self._check_results_available()
+
+        payload = self._download_output_data()
+        return self._decode_results_shots_array(payload)
+
+    def _decode_results_shots_array(self, payload) -> Union[ShotsArray, List[ShotsArray]]:
+        """Decodes the job output payload returned by `get_results_shots_array`."""
+        if self.details.output_data_format != V2_DATA_FORMAT:
+            raise ValueError(f"Individual shot results are not supported for jobs using the \"{self.details.output_data_format}\" output format.")
+
+        results = self._parse_output(payload)
+        if "DataFormat" not in results or results["DataFormat"] != V2_DATA_FORMAT:
+            raise ValueError(f"\"DataFormat\" was expected to be \"{V2_DATA_FORMAT}\" in the Job results for \"{self.details.output_data_format}\" output format.")
+        if "Results" not in results:
+            raise ValueError(f"\"Results\" field was expected to be in the Job results for \"{self.details.output_data_format}\" output format.")
+
+        results = results["Results"]
+        if len(results) < 1:
+            raise ValueError("\"Results\" array was expected to contain at least one item")
+
+        shots_arrays = []
+        for i, result in enumerate(results):
+            if "Shots" not in result:
+                raise ValueError(f"\"Shots\" array was expected to be in the Job results for result {i} of \"{self.details.output_data_format}\" output format.")
+            shots_arrays.append(ShotsArray.from_shots(result["Shots"]))
+
+        return shots_arrays[0] if len(shots_arrays) == 1 else shots_arrays
+
+    def get_results_shots_store(
+        self,
+        path: Optional[str] = None,
+        result_index: int = 0,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> ShotStore:
+        """Get job results per shot data as a bit-packed file, accessed
+        through a memory map, for outputs too large to be decoded in memory.
+
+        The output data is streamed and decoded block by block (see
+        :meth:`iter_results_shots`), so memory use does not depend on the
+        number of shots.
+
+        Raises :class:`RuntimeError` if job execution fails.
+
+        Raises :class:`ValueError` if job output is malformed or output format is not compatible,
+                or if the shots contain values other than bits.
+
+        :param path: Path of the file to write, defaults to a temporary file
+            deleted when the store is closed
+        :type path: str
+        :param result_index: Index of the result to store, for jobs
+            with several results (batch results), defaults to 0
+        :type result_index: int
+        :param block_size: Number of shots decoded at once, defaults to 65536
+        :type block_size: int
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Shot store
+        :rtype: ShotStore
+        """
+        shots = self._iter_v2_results("Shots", result_index, timeout_secs)
+        return ShotStore.from_shots(shots, path=path, block_size=block_size)
+
+    def export_results(
+        self,
+        directory: str,
+        format: Optional[str] = None,  # pylint: disable=redefined-builtin
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> List[str]:
+        """Export the job results histogram and per shot data as columnar
+        tables, so that they can be loaded by analytics tools without
+        decoding the results again.
+
+        Writes `histogram.<format>` and, for jobs using the
+        "microsoft.quantum-results.v2" output format, one `shots_<i>.<format>`
+        file per result (entry point), with job id, entry point, result index
+        and register columns. See :func:`azure.quantum.job.results_export.export_job_results`.
+
+        Raises :class:`RuntimeError` if job execution fails.
+
+        Raises :class:`ValueError` if job output is malformed or output format is not compatible.
+
+        :param directory: Directory to write the files to, created if it does not exist
+        :type directory: str
+        :param format: "parquet", "arrow" (Arrow IPC file) or "npz", defaults to
+            "parquet" if pyarrow is installed and "npz" otherwise
+        :type format: str
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Paths of the written files
+        :rtype: List[str]
+        """
+        format = resolve_export_format(format)
+
+        if not self.has_completed():
+            self.wait_until_completed(timeout_secs=timeout_secs)
+
+        self._check_results_available()
+
+        return export_job_results(self, directory, format)
+
+    def iter_results_shots(
+        self,
+        result_index: int = 0,
+        block_size: Optional[int] = None,
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> Iterator[Any]:
+        """Iterate over the per shot data of the job results, decoding the
+        results blob incrementally as it is downloaded.
+
+        Unlike :meth:`get_results_shots`, the results are neither loaded nor
+        decoded at once, so the shots of large jobs can be consumed in
+        constant memory. The job is waited for when the iteration starts.
+
+        Raises :class:`RuntimeError` if job execution fails.
+
+        Raises :class:`ValueError` if job output is malformed or output format is not compatible.
+
+        :param result_index: Index of the result to iterate over, for jobs
+            with several results (batch results), defaults to 0
+        :type result_index: int
+        :param block_size: If set, shots are yielded in lists of up to `block_size` shots
+        :type block_size: int
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Iterator of the shots, or of blocks of shots
+        :rtype: Iterator[Any]
+        """
+        if block_size is not None and block_size < 1:
+            raise ValueError("block_size must be at least 1.")
+
+        shots = iter_convert_all(self._iter_v2_results("Shots", result_index, timeout_secs))
+        if block_size is None:
+            return shots
+        return _iter_blocks(shots, block_size)
+
+    def iter_results_histogram(
+        self,
+        result_index: int = 0,
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over the histogram of the job results, decoding the
+        results blob incrementally as it is downloaded.
+
+        Yields the items of :meth:`get_results_histogram` one at a time, as
+        `(display, {"outcome": outcome, "count": count})` pairs.
+        The job is waited for when the iteration starts.
+
+        Raises :class:`RuntimeError` if job execution fails.
+
+        Raises :class:`ValueError` if job output is malformed or output format is not compatible.
+
+        :param result_index: Index of the result to iterate over, for jobs
+            with several results (batch results), defaults to 0
+        :type result_index: int
+        :param timeout_secs: Timeout in seconds, defaults to 300
+        :type timeout_secs: float
+        :return: Iterator of the histogram items
+        :rtype: Iterator[Tuple[str, Dict[str, Any]]]
+        """
+        convert = None
+        for hist_val in self._iter_v2_results("Histogram", result_index, timeout_secs):
+            if convert is None:
+                convert = compile_converter(hist_val["Outcome"])
+            yield hist_val["Display"], {
+                "outcome": convert(hist_val["Outcome"]),
+                "count": hist_val["Count"],
+            }
+
+    def _iter_v2_results(self, field: str, result_index: int, timeout_secs: float) -> Iterator[Any]:
+        """Waits for the job and decodes the items of the given array
+        of its "microsoft.quantum-results.v2" output incrementally."""
+        if self.details.output_data_format != V2_DATA_FORMAT:
+            raise ValueError(f"Streaming results is not supported for jobs using the \"{self.details.output_data_format}\" output format.")
+
+        if not self.has_completed():
+            self.wait_until_completed(timeout_secs=timeout_secs)
+
+        self._check_results_available()
+
+        yield from iter_v2_results(self._iter_output_data_chunks(), field, result_index)
+
+    def _iter_output_data_chunks(self) -> Iterable[bytes]:
+        """Returns the output data of the job as chunks.
+
+        The output data is streamed from the blob unless it was already
+        downloaded (or prefetched) by the job.
+        """
+        payload = self._get_cached_output_data()
+        if payload is None and self._prefetch_data is not None and self._prefetch_uri == self.details.output_data_uri:
+            payload = self._download_output_data()
+        if payload is not None:
+            return [payload]
+
+        return download_blob_chunks(self._get_blob_uri_with_sas_token(self.details.output_data_uri))
+
+    def _check_results_available(self):
+        """Raises if the job did not succeed and its results cannot be retrieved."""
+        if not self.details.status == "Succeeded":
+            if self.details.status == "Failed" and self._allow_failure_results():
+                job_blob_properties = self.download_blob_properties(self.details.output_data_uri)
+                if job_blob_properties.size > 0:
+                    job_failure_data = self.download_data(self.details.output_data_uri)
+                    raise JobFailedWithResultsError("An error occurred during job execution.", job_failure_data)
+
+            raise self._results_unavailable_error()
+
+    def _results_unavailable_error(self) -> RuntimeError:
+        return RuntimeError(
+            f'{"Cannot retrieve results as job execution failed"}'
+            + f"(status: {self.details.status}."
+            + f"error: {self.details.error_data})"
+        )
+
     def _process_outcome(self, histogram_results):
-        return [self._convert_tuples(v['Outcome']) for v in histogram_results]
+        return convert_all(v['Outcome'] for v in histogram_results)
 
     def _convert_tuples(self, data):
-        if isinstance(data, dict):
-            # Check if the dictionary represents a tuple
-            if all(isinstance(k, str) and k.startswith("Item") for k in data.keys()):
-                # Convert the dictionary to a tuple
-                return tuple(self._convert_tuples(data[f"Item{i+1}"]) for i in range(len(data)))
-            else:
-                raise "Malformed tuple output"
-        elif isinstance(data, list):
-            # Recursively process list elements
-            return [self._convert_tuples(item) for item in data]
-        else:
-            # Return the data as is (int, string, etc.)
-            return data
+        return convert_tuples(data)
 
     @classmethod
     def _allow_failure_results(cls) -> bool: 
@@ -364,4 +826,4 @@ class Job(BaseJob, FilteredJob):
 
         The default is False.
         """
-        return False
\ No newline at end of file
+        return False
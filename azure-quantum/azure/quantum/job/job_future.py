@@ -0,0 +1,226 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import logging
+import threading
+
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from azure.quantum.job.job import Job
+from azure.quantum.job.job_watcher import JobWatcher
+from azure.quantum.job.poll_policy import PollPolicy
+
+__all__ = ["JobFuture"]
+
+logger = logging.getLogger(__name__)
+
+_result_executor: Optional[ThreadPoolExecutor] = None
+_result_executor_lock = threading.Lock()
+
+
+def _get_result_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool that runs the result factories of job futures.
+
+    It is not the pool that prefetches the output data of jobs, since
+    result factories wait for the prefetched output data."""
+    global _result_executor  # pylint: disable=global-statement
+    with _result_executor_lock:
+        if _result_executor is None:
+            _result_executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="azure-quantum-job-future"
+            )
+        return _result_executor
+
+
+class JobFuture(Future):
+    """A :class:`concurrent.futures.Future` that completes when an
+    Azure Quantum job reaches a finished status.
+
+    Job futures are completed by a single background poller that is shared
+    by all job futures of the process, so they can be combined with
+    :func:`concurrent.futures.as_completed` and :func:`concurrent.futures.wait`
+    without a thread per job.
+
+    Cancelling the future stops tracking the job, it does not cancel the job itself.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+       futures = [target.submit(circuit).as_future() for circuit in circuits]
+       for future in concurrent.futures.as_completed(futures):
+            print(future.result().get_results())
+
+    :param job: Job to track
+    :type job: Job
+    :param result_factory: Callable that receives the finished job and returns
+        the result of the future, defaults to returning the job itself.
+        It runs in a thread pool, so slow factories (e.g. downloading the
+        results) do not delay the completion of the other futures
+    :type result_factory: Callable[[Job], Any]
+    """
+
+    def __init__(
+        self,
+        job: "Job",
+        result_factory: Optional[Callable[["Job"], Any]] = None
+    ):
+        super().__init__()
+        self._job = job
+        self._result_factory = result_factory
+
+    @property
+    def job(self) -> "Job":
+        """Tracked job"""
+        return self._job
+
+    def _complete(self) -> None:
+        """Sets the result of the future from the finished job, the result
+        factory being run in the result thread pool."""
+        if self.cancelled():
+            return
+        if self._result_factory is None:
+            self._set_result(self._job)
+        else:
+            _get_result_executor().submit(self._run_result_factory)
+
+    def _run_result_factory(self) -> None:
+        if self.cancelled():
+            return
+        try:
+            result = self._result_factory(self._job)
+        except Exception as e:
+            self._fail(e)
+        else:
+            self._set_result(result)
+
+    def _set_result(self, result: Any) -> None:
+        try:
+            self.set_result(result)
+        except InvalidStateError:
+            # The future was cancelled in the meantime
+            pass
+
+    def _fail(self, exception: Exception) -> None:
+        """Sets the exception of the future, e.g. when the job can no longer be tracked."""
+        if self.cancelled():
+            return
+        try:
+            self.set_exception(exception)
+        except InvalidStateError:
+            # The future was cancelled in the meantime
+            pass
+
+
+class _JobPoller:
+    """Background thread that completes the JobFutures of the process.
+
+    The jobs of each workspace are refreshed together with a JobWatcher,
+    on the schedule of `poll_policy` (the `poll_policy` of :class:`Job`
+    if None). The thread only runs while there are pending futures.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    poll_policy: Optional[PollPolicy] = None
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        # Futures registered since the last poll, added to the watchers by the poller thread
+        self._new_futures: List[JobFuture] = []
+        # Watcher and tracked futures (by job id) per workspace
+        self._watchers: Dict[int, Tuple[JobWatcher, Dict[str, List[JobFuture]]]] = {}
+
+    @classmethod
+    def instance(cls) -> "_JobPoller":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def track(self, future: JobFuture) -> None:
+        """Starts tracking the job of the given future."""
+        if future.job.has_completed():
+            future._complete()
+            return
+
+        with self._condition:
+            self._new_futures.append(future)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="azure-quantum-job-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _register_new_futures(self) -> None:
+        with self._condition:
+            new_futures, self._new_futures = self._new_futures, []
+
+        for future in new_futures:
+            workspace = future.job.workspace
+            watcher, futures = self._watchers.setdefault(
+                id(workspace), (JobWatcher(workspace), {})
+            )
+            watcher.add(future.job)
+            futures.setdefault(future.job.id, []).append(future)
+
+    def _poll(self) -> None:
+        for key, (watcher, futures) in list(self._watchers.items()):
+            # Stop tracking jobs whose futures were all cancelled
+            for job_id, job_futures in list(futures.items()):
+                active_futures = [f for f in job_futures if not f.cancelled()]
+                if active_futures:
+                    futures[job_id] = active_futures
+                else:
+                    del futures[job_id]
+                    watcher.remove(job_futures[0].job)
+
+            try:
+                completed = watcher.refresh()
+            except Exception as e:
+                # The jobs refreshed before the error are completed by the next poll
+                logger.warning(f"Failed to refresh the status of {len(futures)} jobs: {e}")
+                completed = []
+
+            for job, error in watcher.pop_failures():
+                for future in futures.pop(job.id, []):
+                    future._fail(error)
+
+            for job in completed:
+                watcher.remove(job)
+                for future in futures.pop(job.id, []):
+                    if future.job is not job:
+                        future.job.details = job.details
+                        future.job._prefetch_output()
+                    future._complete()
+
+            if not futures:
+                del self._watchers[key]
+
+    def _poll_waits(self) -> Iterator[float]:
+        poll_policy = self.poll_policy if self.poll_policy is not None else Job.poll_policy
+        return poll_policy.poll_waits(None)
+
+    def _run(self) -> None:
+        poll_waits = self._poll_waits()
+        while True:
+            self._register_new_futures()
+            self._poll()
+
+            with self._condition:
+                if not self._watchers and not self._new_futures:
+                    self._thread = None
+                    return
+                if not self._new_futures:
+                    self._condition.wait(next(poll_waits))
+                if self._new_futures:
+                    # Restart the schedule, so that new jobs are refreshed soon
+                    poll_waits = self._poll_waits()
+
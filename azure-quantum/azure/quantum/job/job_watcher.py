@@ -0,0 +1,304 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import itertools
+import logging
+import time
+
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from azure.core.exceptions import HttpResponseError
+
+from azure.quantum.job.job import Job
+from azure.quantum.job.poll_policy import PollPolicy
+
+if TYPE_CHECKING:
+    from azure.quantum.workspace import Workspace
+
+__all__ = ["JobWatcher"]
+
+logger = logging.getLogger(__name__)
+
+# Client errors after which refreshing the job again is expected to succeed,
+# any other client error is expected to fail the same way
+_RETRYABLE_STATUS_CODES = frozenset([408, 429])
+
+# Number of pages of the jobs list read by a refresh, the pending jobs that
+# were not found in them being refreshed individually
+DEFAULT_MAX_LIST_PAGES = 5
+
+
+def _is_permanent_error(error: Exception) -> bool:
+    """Whether refreshing a job failed with a non-retryable client error (e.g. 404)."""
+    status_code = getattr(error, "status_code", None)
+    return (
+        isinstance(error, HttpResponseError)
+        and status_code is not None
+        and 400 <= status_code < 500
+        and status_code not in _RETRYABLE_STATUS_CODES
+    )
+
+
+class JobWatcher:
+    """Tracks a set of jobs of a Workspace and refreshes all of them
+    at once, using the paged `jobs` list API instead of one request per job.
+
+    The details of each tracked job are updated in place. Jobs whose
+    individual refresh fails with a non-retryable error (e.g. the job
+    was not found) stop being tracked, see :meth:`pop_failures`.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+       watcher = JobWatcher(workspace, jobs)
+       for job in watcher.as_completed():
+            print(job.id, job.details.status)
+
+    :param workspace: Workspace the jobs were submitted to
+    :type workspace: Workspace
+    :param jobs: Jobs to track, defaults to None
+    :type jobs: Iterable[Job]
+    :param prefetch_results: Start downloading the results of each job in the
+        background as soon as it is finishing, defaults to False
+    :type prefetch_results: bool
+    :param poll_policy: Policy that schedules the refreshes, defaults to
+        the `poll_policy` of :class:`Job`
+    :type poll_policy: PollPolicy
+    :param max_list_pages: Maximum number of pages of the jobs list read
+        by a refresh, defaults to 5
+    :type max_list_pages: int
+    """
+
+    def __init__(
+        self,
+        workspace: "Workspace",
+        jobs: Optional[Iterable[Job]] = None,
+        prefetch_results: bool = False,
+        poll_policy: Optional[PollPolicy] = None,
+        max_list_pages: int = DEFAULT_MAX_LIST_PAGES
+    ):
+        self._workspace = workspace
+        self._prefetch_results = prefetch_results
+        self._poll_policy = poll_policy
+        self._max_list_pages = max_list_pages
+        self._jobs: Dict[str, Job] = {}
+        # Ids of the completed jobs that were already returned as completed
+        self._reported: Set[str] = set()
+        # Jobs whose refresh failed with a non-retryable error, and the error
+        self._failures: List[Tuple[Job, Exception]] = []
+        for job in jobs or []:
+            self.add(job)
+
+    @property
+    def workspace(self) -> "Workspace":
+        """Workspace of the tracked jobs"""
+        return self._workspace
+
+    @property
+    def poll_policy(self) -> PollPolicy:
+        """Policy that schedules the refreshes"""
+        return self._poll_policy if self._poll_policy is not None else Job.poll_policy
+
+    @property
+    def jobs(self) -> List[Job]:
+        """All tracked jobs"""
+        return list(self._jobs.values())
+
+    @property
+    def pending(self) -> List[Job]:
+        """Tracked jobs that have not completed yet"""
+        return [job for job in self._jobs.values() if not job.has_completed()]
+
+    def add(self, job: Job) -> None:
+        """Starts tracking a job.
+
+        :param job: Job to track
+        :type job: Job
+        """
+        if self._prefetch_results:
+            job.prefetch_results = True
+        self._jobs[job.id] = job
+        self._reported.discard(job.id)
+
+    def remove(self, job: Job) -> None:
+        """Stops tracking a job.
+
+        :param job: Job to stop tracking
+        :type job: Job
+        """
+        self._jobs.pop(job.id, None)
+        self._reported.discard(job.id)
+
+    def refresh(self) -> List[Job]:
+        """Refreshes the details of all pending jobs.
+
+        Pages through the workspace jobs list until every pending job was
+        seen, reading at most `max_list_pages` pages. Jobs that are not
+        found in them (e.g. jobs that were just submitted, or old jobs of
+        a large workspace) are refreshed individually: if that fails with a
+        retryable error, the job is refreshed again by the next call, else
+        it stops being tracked and is returned by :meth:`pop_failures`.
+
+        :raises: The error of the jobs list request, if any. The jobs
+            refreshed before the error are returned by the next call.
+        :return: Tracked jobs that completed and were not returned as
+            completed before.
+        :rtype: typing.List[Job]
+        """
+        pending = {job.id: job for job in self.pending}
+        if pending:
+            client = self._workspace._get_jobs_client()
+            for page in itertools.islice(client.list().by_page(), self._max_list_pages):
+                for details in page:
+                    job = pending.pop(details.id, None)
+                    if job is not None:
+                        job.details = details
+                        job._prefetch_output()
+                if not pending:
+                    break
+
+        for job in pending.values():
+            logger.debug(f"Job {job.id} not found in jobs list, refreshing it individually")
+            try:
+                job.refresh()
+            except Exception as e:
+                if _is_permanent_error(e):
+                    logger.warning(f"Failed to refresh job {job.id}, it is no longer tracked: {e}")
+                    self.remove(job)
+                    self._failures.append((job, e))
+                else:
+                    logger.warning(f"Failed to refresh job {job.id}, retrying at the next refresh: {e}")
+                continue
+            job._prefetch_output()
+
+        return self._take_completed()
+
+    def pop_failures(self) -> List[Tuple[Job, Exception]]:
+        """Returns the jobs that stopped being tracked since the previous call
+        because their refresh failed with a non-retryable error, with the error.
+
+        :return: Failed jobs and their errors
+        :rtype: typing.List[typing.Tuple[Job, Exception]]
+        """
+        failures, self._failures = self._failures, []
+        return failures
+
+    def _take_completed(self) -> List[Job]:
+        """Returns the completed jobs that were not returned before, and marks them as returned."""
+        completed = [
+            job for job in self._jobs.values()
+            if job.id not in self._reported and job.has_completed()
+        ]
+        self._reported.update(job.id for job in completed)
+        return completed
+
+    def as_completed(
+        self,
+        max_poll_wait_secs=None,
+        timeout_secs=None,
+        print_progress=False
+    ) -> Iterator[Job]:
+        """Yields the tracked jobs as they complete.
+        Jobs that have already completed are yielded first.
+
+        :param max_poll_wait_secs: Maximum poll wait time, defaults to None,
+            in which case the poll policy picks the maximum
+        :type max_poll_wait_secs: int
+        :param timeout_secs: Timeout in seconds, defaults to None
+        :type timeout_secs: int
+        :param print_progress: Print "." to stdout to display progress
+        :type print_progress: bool
+        :raises: :class:`TimeoutError` If the total poll time exceeds timeout, raise.
+        :raises: The error of the first job whose refresh failed with a non-retryable error.
+        """
+        for job in self.jobs:
+            if job.has_completed():
+                self._reported.add(job.id)
+                yield job
+
+        poll_waits = self.poll_policy.poll_waits(None, max_poll_wait_secs)
+        start_time = time.time()
+        while True:
+            for job in self.refresh():
+                yield job
+
+            failures = self.pop_failures()
+            if failures:
+                raise failures[0][1]
+
+            pending = self.pending
+            if not pending:
+                return
+
+            elapsed_time = time.time() - start_time
+            if timeout_secs is not None and elapsed_time >= timeout_secs:
+                raise TimeoutError(f"The wait time has exceeded {timeout_secs} seconds.")
+
+            logger.debug(f"Waiting for {len(pending)} jobs to complete")
+            if print_progress:
+                print(".", end="", flush=True)
+            poll_wait = next(poll_waits)
+            if timeout_secs is not None:
+                poll_wait = min(poll_wait, timeout_secs - elapsed_time)
+            time.sleep(poll_wait)
+
+    def wait_all(
+        self,
+        max_poll_wait_secs=None,
+        timeout_secs=None,
+        print_progress=True
+    ) -> List[Job]:
+        """Keeps refreshing the tracked jobs until all of them
+        reach a finished status.
+
+        :param max_poll_wait_secs: Maximum poll wait time, defaults to None,
+            in which case the poll policy picks the maximum
+        :type max_poll_wait_secs: int
+        :param timeout_secs: Timeout in seconds, defaults to None
+        :type timeout_secs: int
+        :param print_progress: Print "." to stdout to display progress
+        :type print_progress: bool
+        :raises: :class:`TimeoutError` If the total poll time exceeds timeout, raise.
+        :return: All tracked jobs.
+        :rtype: typing.List[Job]
+        """
+        for _ in self.as_completed(
+            max_poll_wait_secs=max_poll_wait_secs,
+            timeout_secs=timeout_secs,
+            print_progress=print_progress
+        ):
+            pass
+        return self.jobs
+
+    def wait_any(
+        self,
+        max_poll_wait_secs=None,
+        timeout_secs=None,
+        print_progress=True
+    ) -> Optional[Job]:
+        """Keeps refreshing the tracked jobs until at least one of them
+        reaches a finished status.
+
+        :param max_poll_wait_secs: Maximum poll wait time, defaults to None,
+            in which case the poll policy picks the maximum
+        :type max_poll_wait_secs: int
+        :param timeout_secs: Timeout in seconds, defaults to None
+        :type timeout_secs: int
+        :param print_progress: Print "." to stdout to display progress
+        :type print_progress: bool
+        :raises: :class:`TimeoutError` If the total poll time exceeds timeout, raise.
+        :return: The first completed job, or None if no job is tracked.
+        :rtype: typing.Optional[Job]
+        """
+        return next(
+            self.as_completed(
+                max_poll_wait_secs=max_poll_wait_secs,
+                timeout_secs=timeout_secs,
+                print_progress=print_progress
+            ),
+            None
+        )
@@ -0,0 +1,211 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import abc
+import logging
+import random
+import time
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from azure.quantum.job.job import Job
+
+__all__ = ["PollPolicy", "ExponentialBackoffPollPolicy", "AdaptivePollPolicy"]
+
+logger = logging.getLogger(__name__)
+
+
+class PollPolicy(abc.ABC):
+    """Base class of the policies that schedule the status refreshes
+    of :meth:`Job.wait_until_completed`, :class:`JobWatcher` and
+    :class:`JobFuture`.
+
+    A policy yields the number of seconds to wait before each refresh of
+    the job. The job details are refreshed between two consecutive
+    values, so a policy can adapt the schedule to the job status.
+    When several jobs are refreshed together, no job is given.
+    """
+
+    @abc.abstractmethod
+    def poll_waits(
+        self,
+        job: Optional["Job"],
+        max_poll_wait_secs: Optional[float] = None
+    ) -> Iterator[float]:
+        """Yields the wait time before each refresh of the given job.
+
+        :param job: Job that is being waited for, or None if several
+            jobs are refreshed together
+        :type job: Optional[Job]
+        :param max_poll_wait_secs: Maximum poll wait time requested by the caller,
+            defaults to None, in which case the policy picks its own maximum
+        :type max_poll_wait_secs: float
+        :return: Wait times in seconds
+        :rtype: Iterator[float]
+        """
+
+
+class ExponentialBackoffPollPolicy(PollPolicy):
+    """Polls with a wait time that starts at `initial_poll_wait` seconds
+    and is multiplied by `backoff_factor` after each refresh,
+    up to `max_poll_wait_secs`.
+
+    :param initial_poll_wait: First wait time in seconds, defaults to 0.2
+    :type initial_poll_wait: float
+    :param backoff_factor: Growth factor of the wait time, defaults to 1.5
+    :type backoff_factor: float
+    :param max_poll_wait_secs: Maximum wait time in seconds, defaults to 30
+    :type max_poll_wait_secs: float
+    """
+
+    def __init__(
+        self,
+        initial_poll_wait: float = 0.2,
+        backoff_factor: float = 1.5,
+        max_poll_wait_secs: float = 30
+    ):
+        self.initial_poll_wait = initial_poll_wait
+        self.backoff_factor = backoff_factor
+        self.max_poll_wait_secs = max_poll_wait_secs
+
+    def poll_waits(
+        self,
+        job: Optional["Job"],
+        max_poll_wait_secs: Optional[float] = None
+    ) -> Iterator[float]:
+        if max_poll_wait_secs is None:
+            max_poll_wait_secs = self.max_poll_wait_secs
+        poll_wait = self.initial_poll_wait
+        while True:
+            yield poll_wait
+            poll_wait = (
+                max_poll_wait_secs
+                if poll_wait >= max_poll_wait_secs
+                else poll_wait * self.backoff_factor
+            )
+
+
+class AdaptivePollPolicy(ExponentialBackoffPollPolicy):
+    """Default poll policy, which adapts the exponential backoff to the
+    status of the job and to the average queue time of its target.
+
+    - While the job is "Waiting" and the average queue time reported by the
+      target is known, the policy waits for half of the estimated remaining
+      queue time, up to `max_queued_poll_wait_secs`. Once the estimate is
+      exceeded, it falls back to the exponential backoff.
+    - The backoff restarts at `initial_poll_wait` whenever the job status
+      changes, so that short jobs are picked up with low latency once
+      they start executing.
+    - While the job is "Finishing", the wait time is capped at
+      `finishing_poll_wait`, since the results are about to be available.
+    - Each wait time is shortened by a random factor of up to `jitter`, so
+      that many clients waiting for jobs do not refresh in lockstep.
+
+    The average queue time is recorded on the jobs submitted with
+    :meth:`Target.submit`. For other jobs, the policy looks it up once
+    from the workspace if `lookup_queue_time` is set. When several jobs
+    are refreshed together, the policy is the exponential backoff with jitter.
+
+    :param initial_poll_wait: First wait time in seconds, defaults to 0.2
+    :type initial_poll_wait: float
+    :param backoff_factor: Growth factor of the wait time, defaults to 1.5
+    :type backoff_factor: float
+    :param max_poll_wait_secs: Maximum wait time in seconds, defaults to 30
+    :type max_poll_wait_secs: float
+    :param max_queued_poll_wait_secs: Maximum wait time in seconds while the job
+        is queued and its remaining queue time is estimated, defaults to 600
+    :type max_queued_poll_wait_secs: float
+    :param finishing_poll_wait: Maximum wait time in seconds while the job
+        is finishing, defaults to 1
+    :type finishing_poll_wait: float
+    :param jitter: Maximum fraction by which each wait is shortened, defaults to 0.1
+    :type jitter: float
+    :param lookup_queue_time: Query the target status for the average queue time
+        of jobs that were not submitted with a Target, defaults to False
+    :type lookup_queue_time: bool
+    :param seed: Seed of the jitter random generator, defaults to None
+    :type seed: int
+    """
+
+    def __init__(
+        self,
+        initial_poll_wait: float = 0.2,
+        backoff_factor: float = 1.5,
+        max_poll_wait_secs: float = 30,
+        max_queued_poll_wait_secs: float = 600,
+        finishing_poll_wait: float = 1,
+        jitter: float = 0.1,
+        lookup_queue_time: bool = False,
+        seed: Optional[int] = None
+    ):
+        super().__init__(
+            initial_poll_wait=initial_poll_wait,
+            backoff_factor=backoff_factor,
+            max_poll_wait_secs=max_poll_wait_secs
+        )
+        self.max_queued_poll_wait_secs = max_queued_poll_wait_secs
+        self.finishing_poll_wait = finishing_poll_wait
+        self.jitter = jitter
+        self.lookup_queue_time = lookup_queue_time
+        self._random = random.Random(seed)
+
+    def poll_waits(
+        self,
+        job: Optional["Job"],
+        max_poll_wait_secs: Optional[float] = None
+    ) -> Iterator[float]:
+        if job is None:
+            for poll_wait in super().poll_waits(job, max_poll_wait_secs):
+                yield poll_wait * (1 - self.jitter * self._random.random())
+            return
+
+        backoff_cap = self.max_poll_wait_secs if max_poll_wait_secs is None else max_poll_wait_secs
+        queued_cap = self.max_queued_poll_wait_secs if max_poll_wait_secs is None else max_poll_wait_secs
+        start_time = time.time()
+        queue_time = self._get_average_queue_time(job)
+        status = job.details.status
+        backoff = self.initial_poll_wait
+        while True:
+            if job.details.status != status:
+                status = job.details.status
+                backoff = self.initial_poll_wait
+
+            poll_wait = min(backoff, backoff_cap)
+            if status == "Waiting" and queue_time:
+                remaining = queue_time - self._get_elapsed_time(job, start_time)
+                if remaining / 2 > poll_wait:
+                    poll_wait = min(remaining / 2, queued_cap)
+            elif status == "Finishing":
+                poll_wait = min(poll_wait, self.finishing_poll_wait)
+
+            yield poll_wait * (1 - self.jitter * self._random.random())
+            backoff = min(backoff * self.backoff_factor, backoff_cap)
+
+    def _get_average_queue_time(self, job: "Job") -> Optional[float]:
+        queue_time = getattr(job, "_average_queue_time", None)
+        if queue_time is None and self.lookup_queue_time and job.details.status == "Waiting":
+            try:
+                statuses = job.workspace._get_target_status(
+                    job.details.target, job.details.provider_id
+                )
+                if statuses:
+                    queue_time = statuses[0][1].average_queue_time
+                    job._average_queue_time = queue_time
+            except Exception as e:
+                logger.debug(f"Failed to get the average queue time of target {job.details.target}: {e}")
+        return queue_time
+
+    @staticmethod
+    def _get_elapsed_time(job: "Job", start_time: float) -> float:
+        """Returns the time elapsed since the job was created, or since the wait
+        started if the creation time is unknown."""
+        creation_time = job.details.creation_time
+        if isinstance(creation_time, datetime):
+            if creation_time.tzinfo is None:
+                creation_time = creation_time.replace(tzinfo=timezone.utc)
+            return (datetime.now(timezone.utc) - creation_time).total_seconds()
+        return time.time() - start_time
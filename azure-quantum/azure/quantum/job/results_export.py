@@ -0,0 +1,220 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Columnar export of job results to Parquet, Arrow IPC or NumPy .npz files"""
+
+import logging
+import os
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+
+from azure.quantum.job.shots_array import ShotsArray
+from azure.quantum.job._tuple_converter import convert_all
+
+if TYPE_CHECKING:
+    from azure.quantum.job.job import Job
+
+__all__ = ["EXPORT_FORMATS", "export_job_results"]
+
+logger = logging.getLogger(__name__)
+
+# Export formats, by file extension
+EXPORT_FORMATS = ("parquet", "arrow", "npz")
+
+_V1_DATA_FORMAT = "microsoft.quantum-results.v1"
+_V2_DATA_FORMAT = "microsoft.quantum-results.v2"
+
+
+def _pyarrow_installed() -> bool:
+    try:
+        import pyarrow  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+        return True
+    except ImportError:
+        return False
+
+
+def resolve_export_format(format: Optional[str]) -> str:  # pylint: disable=redefined-builtin
+    """Returns the export format to use: the given format, or "parquet"
+    if pyarrow is installed and "npz" otherwise.
+
+    :param format: Requested format, one of EXPORT_FORMATS, or None
+    :type format: Optional[str]
+    :return: Export format
+    :rtype: str
+    """
+    if format is None:
+        return "parquet" if _pyarrow_installed() else "npz"
+
+    format = format.lower().lstrip(".")
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format \"{format}\", expected one of {', '.join(EXPORT_FORMATS)}.")
+    if format != "npz" and not _pyarrow_installed():
+        raise ImportError(
+            "Missing optional 'arrow' dependencies. \
+To install run: pip install azure-quantum[arrow]"
+        )
+    return format
+
+
+def export_job_results(
+    job: "Job",
+    directory: str,
+    format: str,  # pylint: disable=redefined-builtin
+    payload: Optional[bytes] = None
+) -> List[str]:
+    """Writes the results of a finished job to `directory`:
+
+    - `histogram.<format>`, with the columns job_id, entry_point,
+      result_index, outcome, probability and, for
+      "microsoft.quantum-results.v2" outputs, count;
+    - for "microsoft.quantum-results.v2" outputs, `shots_<result_index>.<format>`
+      for each result, with the columns job_id, entry_point, result_index, shot
+      and one `register_<i>` column per register of the shots
+      (uint8 bits, as fixed size lists for registers of several bits).
+      The layout of the shots (see :class:`ShotsArray`) is stored in the
+      "layout" metadata (or array, for .npz files). Shots that contain
+      values other than bits (e.g. integers or doubles) are written as an
+      `outcome` column of their Python representations instead, with an
+      empty layout.
+
+    :param job: Finished job
+    :type job: Job
+    :param directory: Directory to write to, created if it does not exist
+    :type directory: str
+    :param format: Export format, one of EXPORT_FORMATS
+    :type format: str
+    :param payload: Output data of the job, defaults to downloading it
+    :type payload: bytes
+    :return: Paths of the written files
+    :rtype: List[str]
+    """
+    output_data_format = job.details.output_data_format
+    if output_data_format not in (_V1_DATA_FORMAT, _V2_DATA_FORMAT):
+        raise ValueError(f"Exporting results is not supported for jobs using the \"{output_data_format}\" output format.")
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    if payload is None:
+        payload = job._download_output_data()
+
+    if output_data_format == _V1_DATA_FORMAT:
+        histogram = job._decode_results(payload)
+        if not isinstance(histogram, dict):
+            raise ValueError(f"Results of job {job.id} could not be decoded.")
+        entry_point = _entry_point_names(job, 1)[0]
+        columns = _constant_columns(job.id, entry_point, 0, len(histogram))
+        columns["outcome"] = np.array(list(histogram.keys()), dtype=str)
+        columns["probability"] = np.array(list(histogram.values()), dtype=np.float64)
+        paths.append(_write_table(directory, "histogram", columns, {}, format))
+        return paths
+
+    results = job._parse_output(payload).get("Results")
+    if not results:
+        raise ValueError("\"Results\" array was expected to contain at least one item")
+    entry_points = _entry_point_names(job, len(results))
+
+    histogram_columns = []
+    for result_index, (result, entry_point) in enumerate(zip(results, entry_points)):
+        histogram = result.get("Histogram", [])
+        counts = np.array([outcome["Count"] for outcome in histogram], dtype=np.int64)
+        total_count = len(result.get("Shots", [])) or counts.sum()
+        columns = _constant_columns(job.id, entry_point, result_index, len(histogram))
+        columns["outcome"] = np.array([outcome["Display"] for outcome in histogram], dtype=str)
+        columns["count"] = counts
+        columns["probability"] = counts / total_count if total_count else counts.astype(np.float64)
+        histogram_columns.append(columns)
+    paths.append(_write_table(directory, "histogram", _concat_columns(histogram_columns), {}, format))
+
+    for result_index, (result, entry_point) in enumerate(zip(results, entry_points)):
+        if "Shots" not in result:
+            logger.warning(f"Result {result_index} of job {job.id} has no shots, they are not exported.")
+            continue
+        shots = result["Shots"]
+        columns = _constant_columns(job.id, entry_point, result_index, len(shots))
+        columns["shot"] = np.arange(len(shots), dtype=np.int64)
+        try:
+            shots_array = ShotsArray.from_shots(shots)
+        except ValueError:
+            # Shots of values other than bits are not packed
+            columns["outcome"] = np.array([repr(shot) for shot in convert_all(shots)], dtype=str)
+            metadata = {"layout": "", "num_bits": "0"}
+        else:
+            bits = shots_array.unpack()
+            for i, register in enumerate(shots_array.register_slices()):
+                register_bits = bits[:, register]
+                columns[f"register_{i}"] = register_bits[:, 0] if register_bits.shape[1] == 1 else register_bits
+            metadata = {"layout": repr(shots_array.layout), "num_bits": str(shots_array.num_bits)}
+        paths.append(_write_table(directory, f"shots_{result_index}", columns, metadata, format))
+
+    return paths
+
+
+def _entry_point_names(job: "Job", count: int) -> List[str]:
+    """Returns the names of the entry points of the job's results, if known."""
+    input_params = job.details.input_params or {}
+    names = []
+    if isinstance(input_params, dict):
+        items = input_params.get("items")
+        if isinstance(items, list):
+            names = [item.get("entryPoint", "") if isinstance(item, dict) else "" for item in items]
+        elif "entryPoint" in input_params:
+            names = [input_params["entryPoint"]]
+    return [names[i] if i < len(names) else "" for i in range(count)]
+
+
+def _constant_columns(job_id: str, entry_point: str, result_index: int, length: int) -> Dict[str, np.ndarray]:
+    return {
+        "job_id": np.repeat(np.array(job_id), length),
+        "entry_point": np.repeat(np.array(entry_point), length),
+        "result_index": np.full(length, result_index, dtype=np.int32),
+    }
+
+
+def _concat_columns(tables: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    return {name: np.concatenate([table[name] for table in tables]) for name in tables[0]}
+
+
+def _write_table(
+    directory: str,
+    name: str,
+    columns: Dict[str, np.ndarray],
+    metadata: Dict[str, str],
+    format: str  # pylint: disable=redefined-builtin
+) -> str:
+    """Writes the given columns as a table, returns the path of the file."""
+    path = os.path.join(directory, f"{name}.{format}")
+    if format == "npz":
+        arrays: Dict[str, Any] = dict(columns)
+        for key, value in metadata.items():
+            arrays[key] = np.array(value)
+        np.savez(path, **arrays)
+        return path
+
+    # pylint: disable=import-outside-toplevel
+    import pyarrow as pa
+
+    arrow_columns = {}
+    for column_name, values in columns.items():
+        if values.ndim == 2:
+            arrow_columns[column_name] = pa.FixedSizeListArray.from_arrays(
+                pa.array(values.reshape(-1)), values.shape[1]
+            )
+        elif values.dtype.kind == "U":
+            arrow_columns[column_name] = pa.array(values, type=pa.string()).dictionary_encode()
+        else:
+            arrow_columns[column_name] = pa.array(values)
+    table = pa.table(arrow_columns, metadata=metadata or None)
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, path)
+    else:
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    logger.debug(f"Exported {name} to {path}")
+    return path
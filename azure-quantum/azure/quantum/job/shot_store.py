@@ -0,0 +1,193 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Disk-backed store of the per shot measurement results of a job"""
+
+import logging
+import os
+import tempfile
+
+from typing import Any, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from azure.quantum.job.shots_array import Layout, ShotsArray
+
+__all__ = ["ShotStore"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 65536
+
+
+class ShotStore:
+    """Shots of a job result stored bit-packed in a file, and accessed
+    through a read-only memory map, so that outputs larger than memory
+    can be analysed.
+
+    The store is a lazy array-like view of the shots:
+
+    - `store[i]` returns the unpacked bits of shot `i`,
+    - `store[start:stop:step]` returns a :class:`ShotsArray` whose `bits`
+      are a view of the memory map,
+    - :meth:`register` returns the bits of one register of the shots,
+    - iterating yields the unpacked bits of each shot, and
+      :meth:`iter_blocks` yields blocks of shots as :class:`ShotsArray`.
+
+    Stores are created with :meth:`Job.get_results_shots_store`. A store
+    created in a temporary file deletes it when closed.
+
+    :param path: Path of the file of packed bits
+    :type path: str
+    :param num_shots: Number of shots
+    :type num_shots: int
+    :param num_bits: Number of measured bits per shot
+    :type num_bits: int
+    :param layout: Layout of the shots, see :class:`ShotsArray`
+    :type layout: Layout
+    :param delete: Delete the file when the store is closed, defaults to False
+    :type delete: bool
+    """
+
+    def __init__(self, path: str, num_shots: int, num_bits: int, layout: Layout, delete: bool = False):
+        self.path = path
+        self.num_bits = num_bits
+        self.layout = layout
+        self._delete = delete
+        row_size = (num_bits + 7) // 8
+        if num_shots == 0 or row_size == 0:
+            self._bits = np.zeros((num_shots, row_size), dtype=np.uint8)
+        else:
+            self._bits = np.memmap(path, dtype=np.uint8, mode="r", shape=(num_shots, row_size))
+
+    def __len__(self) -> int:
+        return self._bits.shape[0]
+
+    def __repr__(self) -> str:
+        return f"ShotStore(path={self.path!r}, num_shots={len(self)}, num_bits={self.num_bits}, layout={self.layout!r})"
+
+    def __enter__(self) -> "ShotStore":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def num_shots(self) -> int:
+        """Number of shots"""
+        return len(self)
+
+    @property
+    def bits(self) -> np.ndarray:
+        """Packed bits, read-only memory map of shape (num_shots, ceil(num_bits / 8))"""
+        return self._bits
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[np.ndarray, ShotsArray]:
+        if isinstance(key, slice):
+            return ShotsArray(self._bits[key], self.num_bits, self.layout)
+        return self[key:key + 1 if key != -1 else None].unpack()[0]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for block in self.iter_blocks():
+            yield from block.unpack()
+
+    def iter_blocks(self, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[ShotsArray]:
+        """Iterates over blocks of consecutive shots.
+
+        :param block_size: Number of shots per block, defaults to 65536
+        :type block_size: int
+        :return: Iterator of blocks of shots
+        :rtype: Iterator[ShotsArray]
+        """
+        for start in range(0, len(self), block_size):
+            yield self[start:start + block_size]
+
+    def register(self, index: int, block_size: int = DEFAULT_BLOCK_SIZE) -> np.ndarray:
+        """Returns the bits of one register (or single bit) of all the shots,
+        unpacking the shots block by block.
+
+        :param index: Index of the register in :meth:`ShotsArray.register_slices`
+        :type index: int
+        :param block_size: Number of shots unpacked at once, defaults to 65536
+        :type block_size: int
+        :return: `uint8` array of shape (num_shots, register width)
+        :rtype: numpy.ndarray
+        """
+        columns = ShotsArray(self._bits[:0], self.num_bits, self.layout).register_slices()[index]
+        register = np.empty((len(self), columns.stop - columns.start), dtype=np.uint8)
+        for start in range(0, len(self), block_size):
+            register[start:start + block_size] = self[start:start + block_size].unpack()[:, columns]
+        return register
+
+    def close(self) -> None:
+        """Releases the memory map, and deletes the file if the store is temporary.
+        Views of the shots remain valid as long as they are referenced."""
+        self._bits = np.zeros((0, self._bits.shape[1]), dtype=np.uint8)
+        if self._delete:
+            self._delete = False
+            try:
+                os.remove(self.path)
+            except OSError as e:
+                logger.warning(f"Failed to delete shot store {self.path}: {e}")
+
+    @classmethod
+    def from_shots(
+        cls,
+        shots: Iterable[Any],
+        path: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> "ShotStore":
+        """Writes shots of a "microsoft.quantum-results.v2" output to a store,
+        block by block, so that only one block of decoded shots is in memory.
+
+        Raises :class:`ValueError` if the shots contain values other than bits
+        or do not all have the same layout.
+
+        :param shots: Shots of a result, e.g. streamed from the output data
+        :type shots: Iterable[Any]
+        :param path: Path of the file to write, defaults to a temporary file
+            deleted when the store is closed
+        :type path: str
+        :param block_size: Number of shots decoded at once, defaults to 65536
+        :type block_size: int
+        :return: Shot store
+        :rtype: ShotStore
+        """
+        delete = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="azure-quantum-shots-", suffix=".bin")
+            f = os.fdopen(fd, "wb")
+        else:
+            f = open(path, "wb")  # pylint: disable=consider-using-with
+
+        num_shots = 0
+        num_bits = 0
+        layout = None
+        try:
+            with f:
+                block = []
+
+                def write_block():
+                    nonlocal num_shots, num_bits, layout
+                    shots_array = ShotsArray.from_shots(block)
+                    if num_shots == 0:
+                        num_bits, layout = shots_array.num_bits, shots_array.layout
+                    elif shots_array.layout != layout:
+                        raise ValueError(f"Shot {num_shots} does not have the layout {layout!r} of the first shot.")
+                    f.write(shots_array.bits.tobytes())
+                    num_shots += len(shots_array)
+                    block.clear()
+
+                for shot in shots:
+                    block.append(shot)
+                    if len(block) == block_size:
+                        write_block()
+                if block:
+                    write_block()
+        except BaseException:
+            os.remove(path)
+            raise
+
+        return cls(path, num_shots, num_bits, layout, delete=delete)
@@ -0,0 +1,192 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Bit-packed matrix of the per shot measurement results of a job"""
+
+from typing import Any, List, Sequence, Tuple, Union
+
+import numpy as np
+
+__all__ = ["ShotsArray"]
+
+# Layout of a shot: None for a single bit, an int for a register (array)
+# of that many bits, a tuple of layouts for a tuple and a list of layouts
+# for an array of tuples or nested arrays.
+Layout = Union[None, int, Tuple["Layout", ...], List["Layout"]]
+
+
+class ShotsArray:
+    """Measurement results of the shots of a job, as a bit-packed matrix
+    with one row per shot and one column per measured bit.
+
+    The bits of a shot are stored in the order they appear in the shot,
+    tuples and registers being flattened depth first. `layout` describes
+    the structure of the shots, so that the columns can be mapped back to
+    registers and tuple items:
+
+    - `None` is a single bit,
+    - an int is a register of that many bits,
+    - a tuple is a tuple of the given layouts,
+    - a list is an array of the given layouts (arrays of tuples or arrays).
+
+    For example, shots such as `([1, 0], 1)` have the layout `(2, None)`.
+
+    :param bits: Packed bits, `uint8` array of shape (num_shots, ceil(num_bits / 8))
+    :type bits: numpy.ndarray
+    :param num_bits: Number of measured bits per shot
+    :type num_bits: int
+    :param layout: Layout of the shots
+    :type layout: Layout
+    """
+
+    def __init__(self, bits: np.ndarray, num_bits: int, layout: Layout):
+        self.bits = bits
+        self.num_bits = num_bits
+        self.layout = layout
+
+    def __len__(self) -> int:
+        return self.bits.shape[0]
+
+    def __repr__(self) -> str:
+        return f"ShotsArray(num_shots={len(self)}, num_bits={self.num_bits}, layout={self.layout!r})"
+
+    @property
+    def num_shots(self) -> int:
+        """Number of shots"""
+        return len(self)
+
+    def unpack(self) -> np.ndarray:
+        """Returns the unpacked bits, as a `uint8` array of shape
+        (num_shots, num_bits) of zeros and ones.
+
+        :return: Unpacked bits
+        :rtype: numpy.ndarray
+        """
+        if self.num_bits == 0:
+            return np.zeros((len(self), 0), dtype=np.uint8)
+        return np.unpackbits(self.bits, axis=1, count=self.num_bits)
+
+    def register_slices(self) -> List[slice]:
+        """Returns the columns of each register (and single bit) of the shots,
+        in the order they appear in the layout.
+
+        :return: Column slices
+        :rtype: List[slice]
+        """
+        slices = []
+
+        def visit(layout: Layout, offset: int) -> int:
+            if layout is None:
+                slices.append(slice(offset, offset + 1))
+                return offset + 1
+            if isinstance(layout, int):
+                slices.append(slice(offset, offset + layout))
+                return offset + layout
+            for item in layout:
+                offset = visit(item, offset)
+            return offset
+
+        visit(self.layout, 0)
+        return slices
+
+    @classmethod
+    def from_shots(cls, shots: Sequence[Any]) -> "ShotsArray":
+        """Builds the array from the shots of a "microsoft.quantum-results.v2"
+        output, where tuples are encoded as `{"Item1": ..., "Item2": ...}` objects.
+
+        Raises :class:`ValueError` if the shots contain values other than bits
+        or do not all have the same layout.
+
+        :param shots: Shots of a result
+        :type shots: Sequence[Any]
+        :return: Shots array
+        :rtype: ShotsArray
+        """
+        if len(shots) == 0:
+            return cls(np.zeros((0, 0), dtype=np.uint8), 0, None)
+
+        layout = _layout(shots[0])
+        num_bits = _num_bits(layout)
+
+        rows = None
+        if isinstance(layout, int):
+            # Shots are flat registers, converted at once
+            try:
+                rows = np.asarray(shots)
+            except ValueError:
+                # Ragged shots
+                rows = np.empty(0)
+            if rows.shape != (len(shots), num_bits) or rows.dtype.kind not in "biu":
+                rows = None
+            elif rows.size and (rows.min() < 0 or rows.max() > 1):
+                raise ValueError("Shots were expected to contain only bits (0 or 1).")
+
+        if rows is None:
+            rows = np.empty((len(shots), num_bits), dtype=np.uint8)
+            for i, shot in enumerate(shots):
+                bits = []
+                if not _flatten(shot, layout, bits):
+                    raise ValueError(f"Shot {i} does not have the layout {layout!r} of the first shot.")
+                rows[i] = bits
+
+        return cls(np.packbits(rows.astype(np.uint8, copy=False), axis=1), num_bits, layout)
+
+
+def _is_bit(value: Any) -> bool:
+    return (value is True or value is False
+            or (type(value) is int and 0 <= value <= 1))
+
+
+def _is_tuple(value: Any) -> bool:
+    return isinstance(value, dict) and all(
+        isinstance(k, str) and k.startswith("Item") for k in value.keys()
+    )
+
+
+def _layout(shot: Any) -> Layout:
+    """Returns the layout of a shot."""
+    if _is_bit(shot):
+        return None
+    if _is_tuple(shot):
+        return tuple(_layout(shot[f"Item{i+1}"]) for i in range(len(shot)))
+    if isinstance(shot, list):
+        if all(_is_bit(item) for item in shot):
+            return len(shot)
+        return [_layout(item) for item in shot]
+    raise ValueError(f"Shots were expected to contain only bits (0 or 1), found {shot!r}.")
+
+
+def _num_bits(layout: Layout) -> int:
+    if layout is None:
+        return 1
+    if isinstance(layout, int):
+        return layout
+    return sum(_num_bits(item) for item in layout)
+
+
+def _flatten(shot: Any, layout: Layout, bits: List[int]) -> bool:
+    """Appends the bits of a shot, returns False if it does not have the given layout."""
+    if layout is None:
+        if not _is_bit(shot):
+            return False
+        bits.append(shot)
+    elif isinstance(layout, int):
+        if not isinstance(shot, list) or len(shot) != layout or not all(_is_bit(b) for b in shot):
+            return False
+        bits.extend(shot)
+    elif isinstance(layout, tuple):
+        if not _is_tuple(shot) or len(shot) != len(layout):
+            return False
+        for i, item_layout in enumerate(layout):
+            item = shot.get(f"Item{i+1}")
+            if not _flatten(item, item_layout, bits):
+                return False
+    else:
+        if not isinstance(shot, list) or len(shot) != len(layout):
+            return False
+        for item, item_layout in zip(shot, layout):
+            if not _flatten(item, item_layout, bits):
+                return False
+    return True
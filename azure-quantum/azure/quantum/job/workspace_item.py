@@ -29,6 +29,8 @@ class WorkspaceItem(abc.ABC):
         self._workspace = workspace
         self._details = details
         self._item_type = details.item_type
+        # Validators of the response the details were refreshed from
+        self._details_validator = None
 
     @property
     def workspace(self) -> "Workspace":
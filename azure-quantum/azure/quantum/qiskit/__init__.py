@@ -6,10 +6,12 @@
 """Azure Quantum Qiskit Provider"""
 
 from .provider import AzureQuantumProvider, AzureQuantumJob
+from .qir_cache import QirCache
 from azure.quantum import __version__
 
 __all__ = [
     "AzureQuantumProvider",
     "AzureQuantumJob",
+    "QirCache",
     "__version__"
 ]
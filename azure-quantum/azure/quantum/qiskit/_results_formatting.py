@@ -0,0 +1,293 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+
+"""Vectorised formatting of job results into the Qiskit `counts`,
+`probabilities` and `memory` dictionaries.
+
+Outcomes are formatted as arrays of bitstrings, converting only the
+distinct outcomes from the provider's representation, and are then
+counted or summed with `np.unique` and `np.bincount`. The dictionaries
+keep the order in which the outcomes first occur.
+
+Display strings of outcomes, such as "([0, 1], 1)", are parsed by a
+tokenizer of the Q# and QIR display grammar, and their bitstrings are
+memoised since the shots of a job repeat few distinct outcomes.
+"""
+
+import re
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from azure.quantum.job.shots_array import ShotsArray
+
+# Maximum number of display strings whose bitstrings are memoised
+DISPLAY_CACHE_SIZE = 65536
+
+_BITSTRING = re.compile(r"[\d\s]+$")
+_TOKEN = re.compile(r"\s*(?:([\[\](),])|([^\s\[\](),]+))")
+
+
+def qiskit_bitstring(obj: Any) -> str:
+    """Formats an outcome as a Qiskit bitstring: the items of a tuple are
+    classical registers separated by spaces, and the bits of an array are
+    concatenated. Display strings of outcomes are parsed, unless they are
+    already bitstrings.
+
+    :param obj: Outcome, or display string of an outcome
+    :type obj: Any
+    :return: Bitstring
+    :rtype: str
+    """
+    if isinstance(obj, str):
+        return display_to_bitstring(obj)
+    if isinstance(obj, tuple):
+        return " ".join([qiskit_bitstring(term) for term in obj])
+    if isinstance(obj, list):
+        return "".join([str(bit) for bit in obj])
+    return str(obj)
+
+
+@lru_cache(maxsize=DISPLAY_CACHE_SIZE)
+def display_to_bitstring(display: str) -> str:
+    """Formats the display string of an outcome as a Qiskit bitstring,
+    memoising the most recent display strings.
+
+    :param display: Display string, such as "([0, 1], 1)"
+    :type display: str
+    :return: Bitstring
+    :rtype: str
+    """
+    if _BITSTRING.match(display):
+        return display
+    return qiskit_bitstring(parse_display(display))
+
+
+def parse_display(display: str) -> Any:
+    """Parses the display string of a Q# or QIR outcome: tuples, arrays,
+    integers, floats and booleans.
+
+    :param display: Display string, such as "([0, 1], 1)"
+    :type display: str
+    :return: Outcome, tuples and arrays being Python tuples and lists
+    :rtype: Any
+    """
+    tokens = []
+    position = 0
+    display = display.rstrip()
+    while position < len(display):
+        match = _TOKEN.match(display, position)
+        if match is None:
+            raise ValueError(f"Invalid outcome display string \"{display}\".")
+        tokens.append(match.group(1) or match.group(2))
+        position = match.end()
+
+    if not tokens:
+        raise ValueError("Empty outcome display string.")
+    # Values separated by commas at the top level are an implied tuple
+    tokens.append(")")
+    try:
+        items, index, trailing_comma = _parse_items(tokens, 0, ")")
+    except IndexError:
+        raise ValueError(f"Invalid outcome display string \"{display}\".") from None
+    if index != len(tokens):
+        raise ValueError(f"Invalid outcome display string \"{display}\".")
+    return tuple(items) if len(items) != 1 or trailing_comma else items[0]
+
+
+def _parse_value(tokens: List[str], index: int) -> Tuple[Any, int]:
+    """Parses the value starting at a token, returns it and the index of the next token."""
+    token = tokens[index]
+    if token == "[":
+        items, index, _ = _parse_items(tokens, index + 1, "]")
+        return items, index
+    if token == "(":
+        items, index, trailing_comma = _parse_items(tokens, index + 1, ")")
+        # Parentheses around a single value without a comma are not a tuple
+        return (tuple(items) if len(items) != 1 or trailing_comma else items[0]), index
+    if token in ("]", ")", ","):
+        raise ValueError(f"Unexpected \"{token}\" in outcome display string.")
+    return _parse_literal(token), index + 1
+
+
+def _parse_items(tokens: List[str], index: int, close: str) -> Tuple[List[Any], int, bool]:
+    items = []
+    trailing_comma = False
+    while tokens[index] != close:
+        value, index = _parse_value(tokens, index)
+        items.append(value)
+        trailing_comma = tokens[index] == ","
+        if trailing_comma:
+            index += 1
+        elif tokens[index] != close:
+            raise ValueError(f"Expected \",\" or \"{close}\" in outcome display string.")
+    return items, index + 1, trailing_comma
+
+
+def _parse_literal(token: str) -> Any:
+    if token == "True":
+        return True
+    if token == "False":
+        return False
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        raise ValueError(f"Unsupported value \"{token}\" in outcome display string.") from None
+
+
+def bits_to_bitstrings(bits: np.ndarray) -> np.ndarray:
+    """Returns the rows of a 2-D array of bits as an array of bitstrings.
+
+    :param bits: Array of shape (num_outcomes, num_bits) of zeros and ones
+    :type bits: numpy.ndarray
+    :return: Bitstrings, character `i` being column `i` of the bits
+    :rtype: numpy.ndarray
+    """
+    num_outcomes, num_bits = bits.shape
+    if num_bits == 0:
+        return np.full(num_outcomes, "", dtype=str)
+    chars = np.ascontiguousarray(bits.astype(np.uint8) + ord("0"))
+    return chars.view(f"S{num_bits}").reshape(num_outcomes).astype(str)
+
+
+def ionq_bitstrings(keys: Sequence[str], meas_map: List[int]) -> np.ndarray:
+    """Returns the bitstrings of IonQ histogram keys, the integer outcomes
+    of the measured qubits in little-endian order, with the bits of `meas_map`
+    in big-endian order.
+
+    :param keys: Histogram keys
+    :type keys: Sequence[str]
+    :param meas_map: Qubit measured into each classical bit
+    :type meas_map: List[int]
+    :return: Bitstrings
+    :rtype: numpy.ndarray
+    """
+    outcomes = np.asarray(list(keys), dtype=str)
+    if len(outcomes) == 0:
+        return outcomes
+    if meas_map and max(meas_map) > 62:
+        outcomes = [int(key) for key in outcomes.tolist()]
+        return np.array(
+            ["".join(str((outcome >> n) & 1) for n in reversed(meas_map)) for outcome in outcomes],
+            dtype=str,
+        )
+    outcomes = outcomes.astype(np.int64)
+    shifts = np.array(meas_map[::-1], dtype=np.int64)
+    return bits_to_bitstrings((outcomes[:, np.newaxis] >> shifts[np.newaxis, :]) & 1)
+
+
+def concatenate_registers(registers: List[Sequence[str]]) -> np.ndarray:
+    """Returns the bitstrings of Quantinuum shots, the bitstrings of the
+    classical registers being concatenated in order.
+
+    :param registers: Bitstrings of each register
+    :type registers: List[Sequence[str]]
+    :return: Bitstrings of the shots
+    :rtype: numpy.ndarray
+    """
+    if not registers:
+        return np.zeros(0, dtype=str)
+    num_shots = min(len(register) for register in registers)
+    bitstrings = np.asarray(registers[0][:num_shots], dtype=str)
+    for register in registers[1:]:
+        bitstrings = np.char.add(bitstrings, np.asarray(register[:num_shots], dtype=str))
+    return bitstrings
+
+
+def _unique(bitstrings: np.ndarray):
+    """Returns the distinct bitstrings in order of first occurrence,
+    and the index of the distinct bitstring of each bitstring."""
+    unique, first, inverse = np.unique(bitstrings, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return unique[order], rank[inverse.reshape(-1)]
+
+
+def count_bitstrings(bitstrings: np.ndarray) -> Dict[str, int]:
+    """Counts the occurrences of each bitstring.
+
+    :param bitstrings: Bitstrings
+    :type bitstrings: numpy.ndarray
+    :return: Counts by bitstring
+    :rtype: Dict[str, int]
+    """
+    if len(bitstrings) == 0:
+        return {}
+    unique, inverse = _unique(bitstrings)
+    return dict(zip(unique.tolist(), np.bincount(inverse, minlength=len(unique)).tolist()))
+
+
+def sum_by_bitstring(bitstrings: np.ndarray, values: Sequence[float]) -> Dict[str, Any]:
+    """Sums the values of equal bitstrings.
+
+    :param bitstrings: Bitstrings
+    :type bitstrings: numpy.ndarray
+    :param values: Values of the bitstrings
+    :type values: Sequence[float]
+    :return: Sums by bitstring
+    :rtype: Dict[str, Any]
+    """
+    if len(bitstrings) == 0:
+        return {}
+    unique, inverse = _unique(bitstrings)
+    if len(unique) == len(bitstrings):
+        # Distinct bitstrings: keep the values as they are
+        return dict(zip(bitstrings.tolist(), values))
+    return dict(zip(unique.tolist(), np.bincount(inverse, weights=values, minlength=len(unique)).tolist()))
+
+
+def format_outcomes(outcomes: Sequence[Any], to_bitstring: Callable[[Any], str]) -> np.ndarray:
+    """Formats the outcomes of the shots of a job as bitstrings, formatting
+    each distinct outcome once.
+
+    Outcomes made of bits only are deduplicated with NumPy, others by value.
+
+    :param outcomes: Outcomes of the shots
+    :type outcomes: Sequence[Any]
+    :param to_bitstring: Formats an outcome
+    :type to_bitstring: Callable[[Any], str]
+    :return: Bitstrings of the shots
+    :rtype: numpy.ndarray
+    """
+    if len(outcomes) == 0:
+        return np.zeros(0, dtype=str)
+    shots_array = _shots_array(outcomes)
+    if shots_array is not None:
+        _, first, inverse = np.unique(shots_array.bits, axis=0, return_index=True, return_inverse=True)
+        formatted = np.array([to_bitstring(outcomes[index]) for index in first.tolist()], dtype=str)
+        return formatted[inverse.reshape(-1)]
+
+    memo: Dict[str, str] = {}
+    formatted = []
+    for outcome in outcomes:
+        key = repr(outcome)
+        if key not in memo:
+            memo[key] = to_bitstring(outcome)
+        formatted.append(memo[key])
+    return np.array(formatted, dtype=str)
+
+
+def _shots_array(outcomes: Sequence[Any]) -> Optional[ShotsArray]:
+    """Packs outcomes made of bits only with the same layout, else returns None."""
+    if any(isinstance(item, bool) for item in _first_items(outcomes[0])):
+        # Booleans are formatted differently from 0 and 1
+        return None
+    try:
+        return ShotsArray.from_shots(outcomes)
+    except (ValueError, TypeError):
+        return None
+
+
+def _first_items(outcome: Any) -> List[Any]:
+    if isinstance(outcome, (list, tuple)):
+        return [bit for item in outcome for bit in _first_items(item)]
+    return [outcome]
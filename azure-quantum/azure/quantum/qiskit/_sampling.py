@@ -0,0 +1,146 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+
+"""Synthesis of counts and per shot samples from the probabilities
+returned by simulators.
+
+Counts are drawn at once from a multinomial distribution, in time and
+memory proportional to the number of distinct outcomes rather than to
+the number of shots. Per shot samples ("memory") are drawn block by
+block from the drawn counts, so they are consistent with the counts.
+"""
+
+import hashlib
+
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+DEFAULT_MEMORY_BLOCK_SIZE = 65536
+
+
+def job_sampler_seed(job_id: str) -> int:
+    """Returns the seed derived from a job id, so that the samples of a job
+    are deterministic.
+
+    :param job_id: Job id
+    :type job_id: str
+    :return: Seed
+    :rtype: int
+    """
+    return int(hashlib.sha256(job_id.encode("utf-8")).hexdigest(), 16) % (2**32 - 1)
+
+
+def _normalized(probabilities: Mapping[str, float]) -> np.ndarray:
+    values = np.array(list(probabilities.values()), dtype=np.float64)
+    norm = values.sum()
+    if norm != 1 and not np.isclose(norm, 1.0, rtol=1e-4):
+        raise ValueError(f"Probabilities do not add up to 1: {probabilities}")
+    return values / norm
+
+
+class MultinomialSampler:
+    """Draws counts and per shot samples of outcomes from their probabilities.
+
+    :param seed: Seed of the random generator
+    :type seed: int
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
+
+    def counts(self, probabilities: Mapping[str, float], shots: int) -> Dict[str, int]:
+        """Draws the counts of the outcomes of `shots` shots.
+
+        Raises :class:`ValueError` if the probabilities do not add up to 1.
+
+        :param probabilities: Probabilities of the outcomes
+        :type probabilities: Mapping[str, float]
+        :param shots: Number of shots
+        :type shots: int
+        :return: Counts of the outcomes drawn at least once
+        :rtype: Dict[str, int]
+        """
+        if not probabilities:
+            return {}
+        samples = self._rng.multinomial(shots, _normalized(probabilities))
+        return {outcome: count for outcome, count in zip(probabilities.keys(), samples.tolist()) if count}
+
+    def batch_counts(
+        self,
+        probabilities: Sequence[Mapping[str, float]],
+        shots: Union[int, Sequence[int]]
+    ) -> List[Dict[str, int]]:
+        """Draws the counts of the outcomes of many experiments at once.
+
+        :param probabilities: Probabilities of the outcomes of each experiment
+        :type probabilities: Sequence[Mapping[str, float]]
+        :param shots: Number of shots, of all or of each experiment
+        :type shots: Union[int, Sequence[int]]
+        :return: Counts of the outcomes drawn at least once, for each experiment
+        :rtype: List[Dict[str, int]]
+        """
+        if not probabilities:
+            return []
+        width = max(len(experiment) for experiment in probabilities)
+        if width == 0:
+            return [{} for _ in probabilities]
+        # Experiments with fewer outcomes are padded with outcomes of probability 0
+        pvals = np.zeros((len(probabilities), width))
+        for i, experiment in enumerate(probabilities):
+            if experiment:
+                pvals[i, :len(experiment)] = _normalized(experiment)
+            else:
+                pvals[i, 0] = 1.0
+        shots = np.broadcast_to(np.asarray(shots, dtype=np.int64), len(probabilities))
+        samples = self._rng.multinomial(shots, pvals)
+        return [
+            {outcome: count for outcome, count in zip(experiment.keys(), row) if count}
+            for experiment, row in zip(probabilities, samples.tolist())
+        ]
+
+    def iter_memory(
+        self,
+        counts: Mapping[str, int],
+        block_size: int = DEFAULT_MEMORY_BLOCK_SIZE
+    ) -> Iterator[List[str]]:
+        """Iterates over blocks of per shot samples in random order, whose
+        outcomes occur as many times as in `counts`.
+
+        The counts of each block are drawn from the remaining counts with a
+        multivariate hypergeometric distribution, so only one block of
+        samples is in memory at once.
+
+        :param counts: Counts of the outcomes
+        :type counts: Mapping[str, int]
+        :param block_size: Number of samples per block, defaults to 65536
+        :type block_size: int
+        :return: Iterator of blocks of samples
+        :rtype: Iterator[List[str]]
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1.")
+        outcomes = list(counts.keys())
+        remaining = np.array(list(counts.values()), dtype=np.int64)
+        total = int(remaining.sum())
+        while total > 0:
+            size = min(block_size, total)
+            block_counts = remaining.copy() if size == total else self._rng.multivariate_hypergeometric(remaining, size)
+            remaining -= block_counts
+            total -= size
+            indices = np.repeat(np.arange(len(outcomes)), block_counts)
+            self._rng.shuffle(indices)
+            yield [outcomes[index] for index in indices.tolist()]
+
+    def memory(self, counts: Mapping[str, int]) -> List[str]:
+        """Returns per shot samples in random order, whose outcomes occur
+        as many times as in `counts` (see :meth:`iter_memory`).
+
+        :param counts: Counts of the outcomes
+        :type counts: Mapping[str, int]
+        :return: Samples
+        :rtype: List[str]
+        """
+        return [sample for block in self.iter_memory(counts) for sample in block]
@@ -6,7 +6,13 @@ import os
 import json
 
 import logging
+import multiprocessing
+import threading
 import warnings
+import weakref
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +36,7 @@ try:
     import pyqir as pyqir
     from qsharp.interop.qiskit import QSharpBackend
     from qsharp import TargetProfile
+    from azure.quantum.qiskit.qir_cache import QirCache, qir_cache_key
 
 except ImportError:
     raise ImportError(
@@ -70,6 +77,40 @@ QIR_BASIS_GATES = [
     "ch",
 ]
 
+# Backend option setting the number of worker processes generating the QIR
+# of the circuits of a batch; 1 generates it in the calling process.
+QIR_WORKERS_OPTION = "qir_workers"
+DEFAULT_QIR_WORKERS = 1
+
+# Backend option setting the QirCache of the QIR generated for the circuits,
+# None disables the cache.
+QIR_CACHE_OPTION = "qir_cache"
+
+# Guards the creation of the QIR generation process pools of the backends
+_qir_executor_lock = threading.Lock()
+
+# Arguments and QSharpBackend of a QIR generation worker process, the
+# backend being reused while the arguments do not change
+_worker_backend_kwargs: Optional[Dict[str, Any]] = None
+_worker_backend: Optional["QSharpBackend"] = None
+
+
+def _qir_mp_context() -> multiprocessing.context.BaseContext:
+    """Returns the context of the QIR generation worker processes. They are
+    not forked, since forking a process running other threads (e.g. job
+    polling) can deadlock the children."""
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(start_method)
+
+
+def _circuit_qir(backend_kwargs: Dict[str, Any], circuit: "QuantumCircuit") -> str:
+    """Generates the QIR of a circuit in a QIR generation worker process."""
+    global _worker_backend, _worker_backend_kwargs
+    if _worker_backend is None or _worker_backend_kwargs != backend_kwargs:
+        _worker_backend = QSharpBackend(**backend_kwargs)
+        _worker_backend_kwargs = backend_kwargs
+    return _worker_backend.qir(circuit)
+
 
 class AzureBackendBase(Backend, SessionHost):
 
@@ -306,7 +347,12 @@ class AzureQirBackend(AzureBackendBase):
     def __init__(
         self, configuration: BackendConfiguration, provider: Provider = None, **fields
     ):
+        qir_workers = fields.pop(QIR_WORKERS_OPTION, DEFAULT_QIR_WORKERS)
+        qir_cache = fields.pop(QIR_CACHE_OPTION, None)
         super().__init__(configuration, provider, **fields)
+        # Common to all QIR backends, so they are not part of their default options
+        if self.options is not None:
+            self.options.update_options(**{QIR_WORKERS_OPTION: qir_workers, QIR_CACHE_OPTION: qir_cache})
 
     def _azure_config(self) -> Dict[str, str]:
         return {
@@ -406,7 +452,12 @@ class AzureQirBackend(AzureBackendBase):
         return {}
 
     def _generate_qir(
-        self, circuits: List[QuantumCircuit], target_profile: TargetProfile, **kwargs
+        self,
+        circuits: List[QuantumCircuit],
+        target_profile: TargetProfile,
+        qir_workers: Optional[int] = None,
+        qir_cache: Optional[QirCache] = None,
+        **kwargs
     ) -> pyqir.Module:
 
         if len(circuits) == 0:
@@ -417,7 +468,7 @@ class AzureQirBackend(AzureBackendBase):
         supports_barrier = "barrier" in config.basis_gates
         skip_transpilation = kwargs.pop("skip_transpilation", False)
 
-        backend = QSharpBackend(
+        backend_kwargs = dict(
             qiskit_pass_options={"supports_barrier": supports_barrier},
             target_profile=target_profile,
             skip_transpilation=skip_transpilation,
@@ -435,10 +486,24 @@ class AzureQirBackend(AzureBackendBase):
         else:
             raise ValueError("Input must be List[QuantumCircuit]")
 
+        if qir_cache is None and self.options is not None:
+            qir_cache = self.options.get(QIR_CACHE_OPTION, None)
+        cache_key = None
+        if qir_cache is not None:
+            cache_key = qir_cache_key(circuits, backend_kwargs, basis_gates=config.basis_gates)
+            llvm_module = qir_cache.get(cache_key)
+            if llvm_module is not None:
+                logger.info(f"Using the cached QIR of {len(circuits)} circuits.")
+                return llvm_module
+
+        if qir_workers is None and self.options is not None:
+            qir_workers = self.options.get(QIR_WORKERS_OPTION, DEFAULT_QIR_WORKERS)
+        qir_strs = self._generate_circuits_qir(circuits, backend_kwargs, qir_workers)
+
+        # Modules are linked in the order of the circuits, however the QIR was generated
         context = pyqir.Context()
         llvm_module = pyqir.qir_module(context, name)
-        for circuit in circuits:
-            qir_str = backend.qir(circuit)
+        for circuit, qir_str in zip(circuits, qir_strs):
             module = pyqir.Module.from_ir(context, qir_str)
             entry_point = next(filter(pyqir.is_entry_point, module.functions))
             entry_point.name = circuit.name
@@ -447,8 +512,45 @@ class AzureQirBackend(AzureBackendBase):
         if err is not None:
             raise Exception(err)
 
+        if qir_cache is not None:
+            qir_cache.put(cache_key, llvm_module, name)
         return llvm_module
 
+    def _generate_circuits_qir(
+        self,
+        circuits: List[QuantumCircuit],
+        backend_kwargs: Dict[str, Any],
+        qir_workers: int
+    ) -> List[str]:
+        """Generates the QIR of each circuit, in `qir_workers` worker processes
+        for batches of several circuits."""
+        qir_workers = int(qir_workers or 1)
+        if qir_workers <= 1 or len(circuits) <= 1:
+            backend = QSharpBackend(**backend_kwargs)
+            return [backend.qir(circuit) for circuit in circuits]
+
+        logger.info(f"Generating the QIR of {len(circuits)} circuits in {min(qir_workers, len(circuits))} processes.")
+        # The pool is sized by the option, not by the batch, so that batches
+        # of different sizes reuse it
+        executor = self._get_qir_executor(qir_workers)
+        # Results are returned in the order of the circuits
+        return list(executor.map(partial(_circuit_qir, backend_kwargs), circuits))
+
+    def _get_qir_executor(self, qir_workers: int) -> ProcessPoolExecutor:
+        """Returns the pool of QIR generation worker processes of the backend,
+        created on first use and reused by the next submissions. The pool is
+        shut down when the backend is garbage collected or at exit."""
+        with _qir_executor_lock:
+            executor, max_workers, finalizer = getattr(self, "_qir_executor", (None, 0, None))
+            if executor is not None and max_workers == qir_workers:
+                return executor
+            if finalizer is not None:
+                # The number of workers changed
+                finalizer()
+            executor = ProcessPoolExecutor(max_workers=qir_workers, mp_context=_qir_mp_context())
+            self._qir_executor = (executor, qir_workers, weakref.finalize(self, executor.shutdown))
+            return executor
+
     def _get_qir_str(
         self,
         circuits: List[QuantumCircuit],
@@ -467,16 +569,25 @@ class AzureQirBackend(AzureBackendBase):
             circuits = [circuits]
 
         target_profile = self._get_target_profile(input_params)
+        # The options of the QIR generation are not job parameters
+        qir_workers = input_params.pop(QIR_WORKERS_OPTION, None)
+        qir_cache = input_params.pop(QIR_CACHE_OPTION, None)
 
         if logger.isEnabledFor(logging.DEBUG):
-            qir = self._get_qir_str(circuits, target_profile, skip_transpilation=True)
+            qir = self._get_qir_str(
+                circuits, target_profile, skip_transpilation=True, qir_workers=qir_workers, qir_cache=qir_cache
+            )
             logger.debug(f"QIR:\n{qir}")
 
         # We'll transpile automatically to the supported gates in QIR unless explicitly skipped.
         skip_transpilation = input_params.pop("skipTranspile", False)
 
         module = self._generate_qir(
-            circuits, target_profile, skip_transpilation=skip_transpilation
+            circuits,
+            target_profile,
+            skip_transpilation=skip_transpilation,
+            qir_workers=qir_workers,
+            qir_cache=qir_cache,
         )
 
         def get_func_name(func: pyqir.Function) -> str:
@@ -2,7 +2,6 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 ##
-from collections import defaultdict
 from typing import Any, Dict, List, Union
 import numpy as np
 
@@ -15,10 +14,17 @@ except ImportError:
 To install run: pip install azure-quantum[qiskit]"
     )
 
-import ast
 import json
-import re
 from azure.quantum import Job
+from azure.quantum.qiskit._sampling import MultinomialSampler, job_sampler_seed
+from azure.quantum.qiskit._results_formatting import (
+    concatenate_registers,
+    count_bitstrings,
+    format_outcomes,
+    ionq_bitstrings,
+    qiskit_bitstring,
+    sum_by_bitstring,
+)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -77,12 +83,16 @@ class AzureQuantumJob(JobV1):
         self._azure_job.submit()
         return
 
-    def result(self, timeout=None, sampler_seed=None):
-        """Return the results of the job."""
+    def result(self, timeout=None, sampler_seed=None, memory=False):
+        """Return the results of the job.
+
+        For simulators returning probabilities, counts are sampled with a seed derived
+        from the job id unless `sampler_seed` is given, and per shot samples are added
+        to the results if `memory` is True."""
         self._azure_job.wait_until_completed(timeout_secs=timeout)
 
         success = self._azure_job.details.status == "Succeeded"
-        results = self._format_results(sampler_seed=sampler_seed)
+        results = self._format_results(sampler_seed=sampler_seed, memory=memory)
 
         result_dict = {
             "results" : results if isinstance(results, list) else [results],
@@ -110,6 +120,11 @@ class AzureQuantumJob(JobV1):
         """Return the position of the job in the queue. Currently not supported."""
         return None
 
+    def as_future(self):
+        """Return a ``concurrent.futures.Future`` that resolves to this job
+        once it reaches a finished status."""
+        return self._azure_job.as_future(result_factory=lambda _: self)
+
     def _shots_count(self):
         # Some providers use 'count', some other 'shots', give preference to 'count':
         input_params = self._azure_job.details.input_params
@@ -122,7 +137,7 @@ class AzureQuantumJob(JobV1):
 
         return shots
 
-    def _format_results(self, sampler_seed=None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    def _format_results(self, sampler_seed=None, memory=False) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """ Populates the results datastructures in a format that is compatible with qiskit libraries. """
 
         if (self._azure_job.details.output_data_format == MICROSOFT_OUTPUT_DATA_FORMAT_V2):
@@ -138,10 +153,10 @@ class AzureQuantumJob(JobV1):
 
         if success:
             if (self._azure_job.details.output_data_format == MICROSOFT_OUTPUT_DATA_FORMAT):
-                job_result["data"] = self._format_microsoft_results(sampler_seed=sampler_seed)
+                job_result["data"] = self._format_microsoft_results(sampler_seed=sampler_seed, memory=memory)
                 
             elif (self._azure_job.details.output_data_format == IONQ_OUTPUT_DATA_FORMAT):
-                job_result["data"] = self._format_ionq_results(sampler_seed=sampler_seed)
+                job_result["data"] = self._format_ionq_results(sampler_seed=sampler_seed, memory=memory)
 
             elif (self._azure_job.details.output_data_format == QUANTINUUM_OUTPUT_DATA_FORMAT):
                 job_result["data"] = self._format_quantinuum_results()
@@ -156,29 +171,20 @@ class AzureQuantumJob(JobV1):
         job_result["shots"] = self._shots_count()
         return job_result
 
-    def _draw_random_sample(self, sampler_seed, probabilities, shots):
-        _norm = sum(probabilities.values())
-        if _norm != 1:
-            if np.isclose(_norm, 1.0, rtol=1e-4):
-                probabilities = {k: v/_norm for k, v in probabilities.items()}
-            else:
-                raise ValueError(f"Probabilities do not add up to 1: {probabilities}")
-        if not sampler_seed:
-            import hashlib
-            id = self.job_id()
-            sampler_seed = int(hashlib.sha256(id.encode('utf-8')).hexdigest(), 16) % (2**32 - 1)
-        rand = np.random.RandomState(sampler_seed)
-        rand_values = rand.choice(list(probabilities.keys()), shots, p=list(probabilities.values()))
-        return dict(zip(*np.unique(rand_values, return_counts=True)))
+    def _sampler(self, sampler_seed=None) -> MultinomialSampler:
+        """Returns the sampler of the simulated counts, seeded from the job id by default
+        so that the results of a job are deterministic."""
+        return MultinomialSampler(sampler_seed if sampler_seed else job_sampler_seed(self.job_id()))
 
-    @staticmethod
-    def _to_bitstring(k, num_qubits, meas_map):
-        # flip bitstring to convert to little Endian
-        bitstring = format(int(k), f"0{num_qubits}b")[::-1]
-        # flip bitstring to convert back to big Endian
-        return "".join([bitstring[n] for n in meas_map])[::-1]
+    def _draw_random_sample(self, sampler_seed, probabilities, shots, memory=False):
+        """Draws the counts of the outcomes of `shots` shots, and the per shot samples if `memory` is True."""
+        sampler = self._sampler(sampler_seed)
+        counts = sampler.counts(probabilities, shots)
+        if memory:
+            return {"counts": counts, "memory": sampler.memory(counts)}
+        return {"counts": counts}
 
-    def _format_ionq_results(self, sampler_seed=None):
+    def _format_ionq_results(self, sampler_seed=None, memory=False):
         """ Translate IonQ's histogram data into a format that can be consumed by qiskit libraries. """
         az_result = self._azure_job.get_results()
         shots = self._shots_count()
@@ -187,65 +193,50 @@ class AzureQuantumJob(JobV1):
             raise ValueError(f"Job with ID {self.id()} does not have the required metadata (num_qubits) to format IonQ results.")
 
         meas_map = json.loads(self._azure_job.details.metadata.get("meas_map")) if "meas_map" in self._azure_job.details.metadata else None
-        num_qubits = self._azure_job.details.metadata.get("num_qubits")
 
         if not 'histogram' in az_result:
             raise "Histogram missing from IonQ Job results"
 
-        counts = defaultdict(int)
-        probabilities = defaultdict(int)
-        for key, value in az_result['histogram'].items():
-            bitstring = self._to_bitstring(key, num_qubits, meas_map) if meas_map else key
-            probabilities[bitstring] += value
+        histogram = az_result['histogram']
+        keys = list(histogram.keys())
+        if meas_map:
+            bitstrings = ionq_bitstrings(keys, meas_map)
+        else:
+            bitstrings = np.array(keys, dtype=str)
+        probabilities = sum_by_bitstring(bitstrings, list(histogram.values()))
 
         if self.backend().configuration().simulator:
-            counts = self._draw_random_sample(sampler_seed, probabilities, shots)
+            data = self._draw_random_sample(sampler_seed, probabilities, shots, memory=memory)
         else:
-            counts = {bitstring: np.round(shots * value) for bitstring, value in probabilities.items()}
+            data = {"counts": {bitstring: np.round(shots * value) for bitstring, value in probabilities.items()}}
 
-        return {"counts": counts, "probabilities": probabilities}
+        data["probabilities"] = probabilities
+        return data
 
     @staticmethod
     def _qir_to_qiskit_bitstring(obj):
-        """Convert the data structure from Azure into the "schema" used by Qiskit"""
-        if isinstance(obj, str) and not re.match(r"[\d\s]+$", obj):
-            obj = ast.literal_eval(obj)
-
-        if isinstance(obj, tuple):
-            # the outermost implied container is a tuple, and each item is
-            # associated with a classical register.
-            return " ".join(
-                [
-                    AzureQuantumJob._qir_to_qiskit_bitstring(term)
-                    for term in obj
-                ]
-            )
-        elif isinstance(obj, list):
-            # a list is for an individual classical register
-            return "".join([str(bit) for bit in obj])
-        else:
-            return str(obj)
+        """Convert the data structure from Azure into the "schema" used by Qiskit.
+
+        The outermost implied container is a tuple, and each item is associated
+        with a classical register; a list is for an individual classical register.
+        Display strings are tokenized and their bitstrings memoised."""
+        return qiskit_bitstring(obj)
 
-    def _format_microsoft_results(self, sampler_seed=None):
+    def _format_microsoft_results(self, sampler_seed=None, memory=False):
         """ Translate Microsoft's job results histogram into a format that can be consumed by qiskit libraries. """
         histogram = self._azure_job.get_results()
         shots = self._shots_count()
 
-        counts = {}
-        probabilities = {}
-
-        for key in histogram.keys():
-            bitstring = AzureQuantumJob._qir_to_qiskit_bitstring(key)
-
-            value = histogram[key]
-            probabilities[bitstring] = value
+        bitstrings = np.array([AzureQuantumJob._qir_to_qiskit_bitstring(key) for key in histogram.keys()], dtype=str)
+        probabilities = sum_by_bitstring(bitstrings, list(histogram.values()))
 
         if self.backend().configuration().simulator:
-            counts = self._draw_random_sample(sampler_seed, probabilities, shots)
+            data = self._draw_random_sample(sampler_seed, probabilities, shots, memory=memory)
         else:
-            counts = {bitstring: np.round(shots * value) for bitstring, value in probabilities.items()}
+            data = {"counts": {bitstring: np.round(shots * value) for bitstring, value in probabilities.items()}}
 
-        return {"counts": counts, "probabilities": probabilities}
+        data["probabilities"] = probabilities
+        return data
     
     def _format_quantinuum_results(self):
         """ Translate Quantinuum's histogram data into a format that can be consumed by qiskit libraries. """
@@ -254,12 +245,10 @@ class AzureQuantumJob(JobV1):
             bitstrings for classical_register, bitstrings 
             in az_result.items() if classical_register != "access_token"
         ]
-        counts = {}
-        combined_bitstrings = ["".join(bitstrings) for bitstrings in zip(*all_bitstrings)]
+        combined_bitstrings = concatenate_registers(all_bitstrings)
         shots = len(combined_bitstrings)
 
-        for bitstring in set(combined_bitstrings):
-            counts[bitstring] = combined_bitstrings.count(bitstring)
+        counts = count_bitstrings(combined_bitstrings)
 
         histogram = {bitstring: count/shots for bitstring, count in counts.items()}
 
@@ -283,19 +272,15 @@ class AzureQuantumJob(JobV1):
         histograms = []
         
         for (histogram, shots) in zip(az_result_histogram, az_result_shots):
-            counts = {}
-            probabilities = {}
-
             total_count = len(shots)
 
-            for (display, result) in histogram.items():
-                bitstring = AzureQuantumJob._qir_to_qiskit_bitstring(display)
-                count = result["count"]
-                probability = count / total_count
-                counts[bitstring] = count
-                probabilities[bitstring] = probability
-            
-            formatted_shots = [AzureQuantumJob._qir_to_qiskit_bitstring(shot) for shot in shots]
+            bitstrings = np.array([AzureQuantumJob._qir_to_qiskit_bitstring(display) for display in histogram.keys()], dtype=str)
+            histogram_counts = np.array([result["count"] for result in histogram.values()], dtype=np.int64)
+            counts = sum_by_bitstring(bitstrings, histogram_counts.tolist())
+            probabilities = sum_by_bitstring(bitstrings, (histogram_counts / total_count).tolist())
+
+            # Each distinct shot is formatted once
+            formatted_shots = format_outcomes(shots, AzureQuantumJob._qir_to_qiskit_bitstring).tolist()
 
             histograms.append((total_count, {"counts": counts, "probabilities": probabilities, "memory": formatted_shots}))
         return histograms
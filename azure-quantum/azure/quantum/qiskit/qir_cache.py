@@ -0,0 +1,292 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+
+"""Cache of the QIR generated for Qiskit circuits"""
+
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import threading
+
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import pyqir
+    from qiskit import ClassicalRegister, QuantumCircuit
+    from qiskit.circuit import Clbit
+    from qiskit.circuit.library import get_standard_gate_name_mapping
+except ImportError:
+    raise ImportError(
+        "Missing optional 'qiskit' dependencies. \
+To install run: pip install azure-quantum[qiskit]"
+    )
+
+__all__ = ["QirCache", "circuit_fingerprint", "qir_cache_key"]
+
+logger = logging.getLogger(__name__)
+
+# Version of the layout of the cache keys, to be incremented when it changes
+_KEY_VERSION = 1
+
+_FILE_SUFFIX = ".bc"
+
+# Entries are the length of the module name, the module name and the bitcode,
+# since the name of a module is not part of its bitcode.
+_NAME_LENGTH = struct.Struct(">I")
+
+_STANDARD_GATES = frozenset(get_standard_gate_name_mapping())
+
+
+def _package_version(package: str) -> str:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return ""
+
+
+# QIR generation depends on the versions of these packages, so a
+# cache directory shared across environments does not mix their QIR.
+_PACKAGE_VERSIONS = tuple(_package_version(package) for package in ("qiskit", "qsharp", "pyqir"))
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """Returns a fingerprint of the structure of a circuit: its registers,
+    global phase, and instructions with their parameters, qubits, clbits
+    and conditions. Structurally identical circuits have the same
+    fingerprint, whatever their name and metadata.
+
+    :param circuit: Circuit
+    :type circuit: QuantumCircuit
+    :return: Hexadecimal SHA-256 digest
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for token in _circuit_tokens(circuit):
+        digest.update(token.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _circuit_tokens(circuit: QuantumCircuit) -> Iterable[str]:
+    yield f"qubits {circuit.num_qubits} clbits {circuit.num_clbits}"
+    for register in circuit.qregs:
+        yield f"qreg {register.name} {register.size}"
+    for register in circuit.cregs:
+        yield f"creg {register.name} {register.size} {[circuit.find_bit(bit).index for bit in register]}"
+    yield f"phase {circuit.global_phase!r}"
+    for instruction in circuit.data:
+        operation = instruction.operation
+        yield (
+            f"op {operation.name} {operation.num_qubits} {operation.num_clbits} "
+            f"{[circuit.find_bit(qubit).index for qubit in instruction.qubits]} "
+            f"{[circuit.find_bit(clbit).index for clbit in instruction.clbits]}"
+        )
+        for param in operation.params:
+            if isinstance(param, QuantumCircuit):
+                # Blocks of control flow operations
+                yield f"block {circuit_fingerprint(param)}"
+            else:
+                yield f"param {param!r}"
+        condition = getattr(operation, "_condition", None)
+        if condition is not None:
+            target, value = condition
+            if isinstance(target, Clbit):
+                target = circuit.find_bit(target).index
+            elif isinstance(target, ClassicalRegister):
+                target = (target.name, target.size)
+            yield f"condition {target!r} {value!r}"
+        if operation.name not in _STANDARD_GATES:
+            # Custom gates of the same name may have different definitions
+            definition = getattr(operation, "definition", None)
+            if definition is not None:
+                yield f"definition {circuit_fingerprint(definition)}"
+
+
+def qir_cache_key(
+    circuits: List[QuantumCircuit],
+    backend_kwargs: Dict[str, Any],
+    basis_gates: Optional[List[str]] = None,
+) -> str:
+    """Returns the cache key of the QIR module of a batch of circuits,
+    made of the fingerprints and names of the circuits, the arguments of
+    the QIR generation (target profile, `skip_transpilation`, ...) and
+    the basis gates of the backend.
+
+    :param circuits: Circuits, in the order of their entry points
+    :type circuits: List[QuantumCircuit]
+    :param backend_kwargs: Arguments of the QIR generation backend
+    :type backend_kwargs: Dict[str, Any]
+    :param basis_gates: Basis gates of the backend, defaults to None
+    :type basis_gates: List[str]
+    :return: Hexadecimal SHA-256 digest
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    tokens = [
+        f"version {_KEY_VERSION} {_PACKAGE_VERSIONS}",
+        f"basis_gates {sorted(basis_gates or [])}",
+    ]
+    tokens.extend(f"{name} {backend_kwargs[name]!r}" for name in sorted(backend_kwargs))
+    # Entry points are named after the circuits
+    tokens.extend(f"circuit {circuit.name!r} {circuit_fingerprint(circuit)}" for circuit in circuits)
+    for token in tokens:
+        digest.update(token.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class QirCache:
+    """Bounded least-recently-used cache of verified QIR modules, keyed by
+    :func:`qir_cache_key`, so that re-submitting structurally identical
+    circuits skips their transpilation, QIR generation and verification.
+
+    Modules are stored as LLVM bitcode and name in memory, and optionally in a
+    directory shared by concurrent processes, where files are written
+    atomically. The directory is not bounded in size.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+       backend = provider.get_backend("ionq.simulator")
+       backend.set_options(qir_cache=QirCache(directory="~/.azure-quantum/qir"))
+
+    :param max_size: Maximum number of modules cached in memory, 0 disables the in-memory tier
+    :type max_size: int
+    :param directory: Directory of the on-disk tier, created if it does not exist, defaults to None
+    :type directory: str
+    """
+
+    def __init__(self, max_size: int = 128, directory: Optional[str] = None):
+        self.max_size = max_size
+        self._directory = None
+        if directory is not None:
+            self._directory = os.path.abspath(os.path.expanduser(directory))
+            os.makedirs(self._directory, exist_ok=True)
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self) -> Optional[str]:
+        """Directory of the on-disk tier, if any"""
+        return self._directory
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[pyqir.Module]:
+        """Returns the cached module, loaded in a new context, if any.
+
+        :param key: Cache key
+        :type key: str
+        :return: Module
+        :rtype: Optional[pyqir.Module]
+        """
+        entry = self._get_entry(key)
+        if entry is not None:
+            try:
+                name_length, = _NAME_LENGTH.unpack_from(entry)
+                offset = _NAME_LENGTH.size + name_length
+                name = entry[_NAME_LENGTH.size:offset].decode("utf-8")
+                module = pyqir.Module.from_bitcode(pyqir.Context(), entry[offset:], name)
+            except Exception as e:
+                logger.warning(f"Failed to load cached QIR module {key}: {e}")
+                self.remove(key)
+            else:
+                with self._lock:
+                    self.hits += 1
+                return module
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, module: pyqir.Module, name: str = "") -> None:
+        """Caches a verified module.
+
+        :param key: Cache key
+        :type key: str
+        :param module: Module
+        :type module: pyqir.Module
+        :param name: Name of the module, defaults to ""
+        :type name: str
+        """
+        name = name.encode("utf-8")
+        entry = _NAME_LENGTH.pack(len(name)) + name + module.bitcode
+        self._put_memory(key, entry)
+        if self._directory is None:
+            return
+        path = self._path(key)
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(entry)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to store QIR module {key}: {e}")
+
+    def remove(self, key: str) -> None:
+        """Removes a module from the cache.
+
+        :param key: Cache key
+        :type key: str
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._directory is not None:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Removes all the cached modules."""
+        with self._lock:
+            self._entries.clear()
+        if self._directory is not None:
+            for entry in os.scandir(self._directory):
+                if entry.name.endswith(_FILE_SUFFIX):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def _get_entry(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self._directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = f.read()
+        except OSError:
+            return None
+        self._put_memory(key, entry)
+        return entry
+
+    def _put_memory(self, key: str, entry: bytes) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}{_FILE_SUFFIX}")
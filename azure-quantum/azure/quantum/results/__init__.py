@@ -0,0 +1,39 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Post-processing of the results of Azure Quantum jobs"""
+
+from .aggregation import CountsVector, job_counts, job_shots, merge_counts, merge_histograms
+from .histogram import Histogram
+from .marginals import marginalize, register_bits
+from .observables import (
+    ExpectationValues,
+    HamiltonianExpectation,
+    pauli_z_masks,
+    expectation_values,
+    hamiltonian_expectation,
+)
+from .sketch import CountMinSketch, TopK, TopKSketch, job_top_k, merge_top_k
+
+__all__ = [
+    "CountsVector",
+    "job_counts",
+    "job_shots",
+    "merge_counts",
+    "merge_histograms",
+    "Histogram",
+    "marginalize",
+    "register_bits",
+    "ExpectationValues",
+    "HamiltonianExpectation",
+    "pauli_z_masks",
+    "expectation_values",
+    "hamiltonian_expectation",
+    "CountMinSketch",
+    "TopK",
+    "TopKSketch",
+    "job_top_k",
+    "merge_top_k",
+]
@@ -0,0 +1,353 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Aggregation of the histograms of many jobs.
+
+The results of each job are normalised into a :class:`CountsVector`: the
+measured outcomes as integers, bit `i` of an outcome being the `i`-th
+measured bit, and their counts. Vectors are merged with NumPy.
+
+With several classical registers, the bits of the first register are the
+lowest bits of the outcome, then come the bits of the second register, and
+so on, whatever the output format: a v2 outcome `([1, 0], [1])` and
+Quantinuum registers `{"c": ["01"], "d": ["1"]}` are both `0b101`.
+
+Supported output formats:
+
+- "microsoft.quantum-results.v2": counts of the histogram, the bits of an
+  outcome are its registers and tuple items flattened in order;
+- "microsoft.quantum-results.v1" and "ionq.quantum-results.v1": probabilities
+  of the histogram scaled by the number of shots of the job; IonQ outcomes
+  are integers indexed by qubit, remapped to the measured bits by the
+  `meas_map` metadata of the job (the qubit measured into each bit) if any;
+- "honeywell.quantum-results.v1" (Quantinuum): counts of the shots, the
+  bitstring of a register being big-endian (its bit 0 last), as in
+  OpenQASM.
+"""
+
+import ast
+import json
+import logging
+
+from concurrent.futures import as_completed
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+from azure.quantum.job.base_job import DEFAULT_TIMEOUT
+from azure.quantum.job.shots_array import ShotsArray
+
+if TYPE_CHECKING:
+    from azure.quantum.job.job import Job
+
+__all__ = ["CountsVector", "job_counts", "job_shots", "merge_counts", "merge_histograms"]
+
+logger = logging.getLogger(__name__)
+
+# Number of vectors merged at once
+_MERGE_BATCH_SIZE = 32
+
+
+class CountsVector(NamedTuple):
+    """Histogram as vectors of integer outcomes and counts.
+
+    :param outcomes: Distinct outcomes, sorted. `int64`, or `object`
+        (Python ints) for outcomes of more than 63 bits
+    :param counts: Counts of the outcomes, `float64` since the counts of
+        probability based histograms and weighted counts are not integers
+    """
+    outcomes: np.ndarray
+    counts: np.ndarray
+
+    @property
+    def total(self) -> float:
+        """Total count"""
+        return float(self.counts.sum())
+
+    def probabilities(self) -> np.ndarray:
+        """Returns the probabilities of the outcomes.
+
+        :return: Probabilities, in the order of `outcomes`
+        :rtype: numpy.ndarray
+        """
+        total = self.total
+        return self.counts / total if total else np.zeros_like(self.counts)
+
+    def to_dict(self) -> Dict[int, float]:
+        """Returns the counts keyed by outcome.
+
+        :return: Counts
+        :rtype: Dict[int, float]
+        """
+        return dict(zip(self.outcomes.tolist(), self.counts.tolist()))
+
+    @classmethod
+    def from_counts(cls, outcomes: Iterable[int], counts: Iterable[float]) -> "CountsVector":
+        """Builds a vector from outcomes and counts, summing the counts
+        of repeated outcomes.
+
+        :param outcomes: Outcomes
+        :type outcomes: Iterable[int]
+        :param counts: Counts of the outcomes
+        :type counts: Iterable[float]
+        :return: Counts vector
+        :rtype: CountsVector
+        """
+        outcomes = _outcome_array(list(outcomes))
+        counts = np.asarray(list(counts), dtype=np.float64)
+        return _reduce(outcomes, counts)
+
+    @classmethod
+    def from_shots(cls, shots_array: ShotsArray) -> "CountsVector":
+        """Builds a vector from the shots of a job, counting the distinct
+        shots; bit `i` of an outcome is column `i` of the shots.
+
+        :param shots_array: Shots
+        :type shots_array: ShotsArray
+        :return: Counts vector
+        :rtype: CountsVector
+        """
+        if len(shots_array) == 0:
+            return cls.from_counts([], [])
+        if shots_array.num_bits == 0:
+            return cls.from_counts([0], [len(shots_array)])
+
+        # Count the distinct packed rows, then convert those only
+        rows, counts = np.unique(shots_array.bits, axis=0, return_counts=True)
+        bits = np.unpackbits(rows, axis=1, count=shots_array.num_bits)
+        if shots_array.num_bits <= 63:
+            weights = np.int64(1) << np.arange(shots_array.num_bits, dtype=np.int64)
+            return _reduce(bits.astype(np.int64) @ weights, counts.astype(np.float64))
+        return cls.from_counts((_bits_to_int(row) for row in bits.tolist()), counts)
+
+
+def _outcome_array(outcomes: List[int]) -> np.ndarray:
+    if not outcomes:
+        return np.zeros(0, dtype=np.int64)
+    if max(outcomes).bit_length() > 63:
+        return np.array(outcomes, dtype=object)
+    return np.array(outcomes, dtype=np.int64)
+
+
+def _reduce(outcomes: np.ndarray, counts: np.ndarray) -> CountsVector:
+    """Sorts the outcomes and sums the counts of repeated outcomes."""
+    unique, inverse = np.unique(outcomes, return_inverse=True)
+    return CountsVector(unique, np.bincount(inverse.reshape(-1), weights=counts, minlength=len(unique)))
+
+
+def _bits_to_int(bits: Iterable[Any]) -> int:
+    value = 0
+    for i, bit in enumerate(bits):
+        if bit is True or bit == 1:
+            value |= 1 << i
+        elif not (bit is False or bit == 0):
+            raise ValueError(f"Outcomes were expected to contain only bits (0 or 1), found {bit!r}.")
+    return value
+
+
+def _flatten_outcome(outcome: Any) -> List[Any]:
+    """Flattens the registers and tuple items of an outcome, in order."""
+    if isinstance(outcome, (list, tuple)):
+        return [bit for item in outcome for bit in _flatten_outcome(item)]
+    return [outcome]
+
+
+def _ionq_outcomes(keys: List[str], meas_map: List[int]) -> List[int]:
+    """Returns the outcomes of IonQ histogram keys, bit `i` of an outcome
+    being the qubit `meas_map[i]` of the key."""
+    if not keys:
+        return []
+    if max(meas_map) > 62 or len(meas_map) > 63:
+        return [sum(((int(key) >> qubit) & 1) << i for i, qubit in enumerate(meas_map)) for key in keys]
+    qubits = (np.asarray(keys, dtype=np.int64)[:, np.newaxis] >> np.asarray(meas_map, dtype=np.int64)) & 1
+    return (qubits @ (np.int64(1) << np.arange(len(meas_map), dtype=np.int64))).tolist()
+
+
+def job_shots(job: "Job") -> Optional[int]:
+    """Returns the number of shots requested for a job, if known.
+
+    :param job: Job
+    :type job: Job
+    :return: Number of shots
+    :rtype: Optional[int]
+    """
+    input_params = job.details.input_params or {}
+    return input_params.get("count", input_params.get("shots"))
+
+
+def job_counts(job: "Job", timeout_secs: float = DEFAULT_TIMEOUT, shots: Optional[int] = None) -> CountsVector:
+    """Returns the histogram of a job as a counts vector, using
+    `get_results` or `get_results_histogram` depending on its output format.
+
+    Raises :class:`ValueError` if the output format is not supported, or
+    if the job has several results (batch results).
+
+    :param job: Job
+    :type job: Job
+    :param timeout_secs: Timeout in seconds to wait for the job, defaults to 300
+    :type timeout_secs: float
+    :param shots: Number of shots probability based histograms are scaled by,
+        defaults to the number of shots of the job
+    :type shots: int
+    :return: Counts vector
+    :rtype: CountsVector
+    """
+    output_data_format = job.details.output_data_format
+
+    def scale() -> int:
+        if shots is not None:
+            return shots
+        job_shots_count = job_shots(job)
+        if job_shots_count is None:
+            raise ValueError(f"The number of shots of job {job.id} is unknown, its histogram cannot be converted to counts.")
+        return job_shots_count
+
+    if output_data_format == "microsoft.quantum-results.v2":
+        histogram = job.get_results_histogram(timeout_secs=timeout_secs)
+        if isinstance(histogram, list):
+            raise ValueError(f"Job {job.id} has several results, they cannot be merged into one histogram.")
+        return CountsVector.from_counts(
+            (_bits_to_int(_flatten_outcome(value["outcome"])) for value in histogram.values()),
+            (value["count"] for value in histogram.values()),
+        )
+
+    if output_data_format == "microsoft.quantum-results.v1":
+        histogram = job.get_results(timeout_secs=timeout_secs)
+        scale_factor = scale()
+        return CountsVector.from_counts(
+            (_bits_to_int(_flatten_outcome(ast.literal_eval(display))) for display in histogram.keys()),
+            (probability * scale_factor for probability in histogram.values()),
+        )
+
+    if output_data_format == "ionq.quantum-results.v1":
+        histogram = job.get_results(timeout_secs=timeout_secs)["histogram"]
+        scale_factor = scale()
+        metadata = job.details.metadata or {}
+        meas_map = json.loads(metadata["meas_map"]) if "meas_map" in metadata else None
+        if meas_map:
+            outcomes = _ionq_outcomes(list(histogram.keys()), meas_map)
+        else:
+            outcomes = (int(key) for key in histogram.keys())
+        return CountsVector.from_counts(
+            outcomes,
+            (probability * scale_factor for probability in histogram.values()),
+        )
+
+    if output_data_format == "honeywell.quantum-results.v1":
+        results = job.get_results(timeout_secs=timeout_secs)
+        registers = [
+            np.asarray(bitstrings, dtype=str)
+            for register, bitstrings in results.items() if register != "access_token"
+        ]
+        if not registers:
+            return CountsVector.from_counts([], [])
+        # The first register is in the lowest bits, so its bitstring comes last
+        bitstrings = registers[-1]
+        for register in reversed(registers[:-1]):
+            bitstrings = np.char.add(bitstrings, register)
+        # Convert the distinct bitstrings only
+        unique, counts = np.unique(bitstrings, return_counts=True)
+        return CountsVector.from_counts(
+            (int(bitstring, 2) if bitstring else 0 for bitstring in unique.tolist()),
+            counts,
+        )
+
+    raise ValueError(f"Merging histograms is not supported for jobs using the \"{output_data_format}\" output format.")
+
+
+def merge_counts(
+    vectors: Iterable[CountsVector],
+    weights: Optional[Iterable[float]] = None
+) -> CountsVector:
+    """Merges counts vectors, summing the (weighted) counts of each outcome.
+    The vectors are consumed as they are iterated, a few at a time.
+
+    :param vectors: Counts vectors
+    :type vectors: Iterable[CountsVector]
+    :param weights: Weights of the vectors, defaults to 1 for all
+    :type weights: Iterable[float]
+    :return: Merged counts vector
+    :rtype: CountsVector
+    """
+    weights = iter(weights) if weights is not None else None
+    merged = CountsVector.from_counts([], [])
+    batch = []
+    for vector in vectors:
+        if weights is not None:
+            vector = CountsVector(vector.outcomes, vector.counts * next(weights))
+        batch.append(vector)
+        if len(batch) == _MERGE_BATCH_SIZE:
+            merged = _merge([merged] + batch)
+            batch = []
+    return _merge([merged] + batch) if batch else merged
+
+
+def _merge(vectors: List[CountsVector]) -> CountsVector:
+    return _reduce(
+        np.concatenate([vector.outcomes for vector in vectors]),
+        np.concatenate([vector.counts for vector in vectors]),
+    )
+
+
+def _finished_jobs(jobs: Iterable["Job"], timeout_secs: Optional[float]) -> Iterator["Job"]:
+    """Yields the finished jobs, then the others in the order they complete."""
+    futures = []
+    for job in jobs:
+        if job.has_completed():
+            yield job
+        else:
+            futures.append(job.as_future())
+    for future in as_completed(futures, timeout=timeout_secs):
+        yield future.result()
+
+
+def merge_histograms(
+    jobs: Iterable["Job"],
+    weights: Optional[Mapping[str, float]] = None,
+    weight_by_shots: bool = True,
+    timeout_secs: Optional[float] = None
+) -> CountsVector:
+    """Merges the histograms of jobs, e.g. the shards of one experiment run
+    on several targets, into one counts vector (see :func:`job_counts`).
+
+    Finished jobs are merged first, then the others in the order they
+    complete, so only the merged histogram is kept in memory.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+        from azure.quantum.results import merge_histograms
+
+        merged = merge_histograms(jobs)
+        probabilities = dict(zip(merged.outcomes.tolist(), merged.probabilities()))
+
+    :param jobs: Jobs to merge the histograms of
+    :type jobs: Iterable[Job]
+    :param weights: Weights of the jobs by job id, defaults to 1 for all
+    :type weights: Mapping[str, float]
+    :param weight_by_shots: If True, the counts of the jobs are summed, so jobs
+        with more shots weigh more. If False, the histograms of the jobs are
+        normalised to probabilities before being summed. Defaults to True
+    :type weight_by_shots: bool
+    :param timeout_secs: Timeout in seconds to wait for the unfinished jobs, defaults to None (no timeout)
+    :type timeout_secs: float
+    :return: Merged counts vector
+    :rtype: CountsVector
+    """
+    def vectors():
+        for job in _finished_jobs(jobs, timeout_secs):
+            vector = job_counts(job)
+            weight = weights.get(job.id, 1.0) if weights is not None else 1.0
+            if not weight_by_shots:
+                total = vector.total
+                weight = weight / total if total else 0.0
+            if weight != 1.0:
+                vector = CountsVector(vector.outcomes, vector.counts * weight)
+            logger.debug(f"Merging the histogram of job {job.id}")
+            yield vector
+
+    return merge_counts(vectors())
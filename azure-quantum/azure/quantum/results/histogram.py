@@ -0,0 +1,179 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Compact histogram of integer-encoded outcomes"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from azure.quantum.results.aggregation import CountsVector, _bits_to_int, _outcome_array
+
+__all__ = ["Histogram"]
+
+COUNTS = "counts"
+PROBABILITIES = "probabilities"
+
+
+class Histogram(Mapping):
+    """Histogram of the outcomes of a job, backed by parallel NumPy arrays
+    of integer outcome codes and their counts or probabilities.
+
+    Bit `i` of an outcome code is the `i`-th measured bit of the outcome,
+    registers and tuple items being flattened in order (see
+    :class:`azure.quantum.results.CountsVector`).
+
+    For backward compatibility the histogram is also a read-only mapping
+    with the keys and values returned by the accessor it was created by,
+    e.g. `{"[0, 1]": 0.5, ...}` for :meth:`Job.get_results`. The mapping is
+    only built when first accessed, see :meth:`to_dict`.
+
+    :param outcomes: Outcome codes, in the order of the job results
+    :type outcomes: numpy.ndarray
+    :param values: Counts or probabilities of the outcomes
+    :type values: numpy.ndarray
+    :param kind: "counts" or "probabilities"
+    :type kind: str
+    :param num_bits: Number of measured bits per outcome, if known
+    :type num_bits: Optional[int]
+    :param dict_factory: Builds the mapping form of the histogram,
+        defaults to mapping outcome codes to values
+    :type dict_factory: Callable[[], Dict[Any, Any]]
+    """
+
+    def __init__(
+        self,
+        outcomes: np.ndarray,
+        values: np.ndarray,
+        kind: str = COUNTS,
+        num_bits: Optional[int] = None,
+        dict_factory: Optional[Callable[[], Dict[Any, Any]]] = None
+    ):
+        if kind not in (COUNTS, PROBABILITIES):
+            raise ValueError(f"Histogram kind must be \"{COUNTS}\" or \"{PROBABILITIES}\".")
+        if len(outcomes) != len(values):
+            raise ValueError("Outcomes and values must have the same length.")
+        self.outcomes = outcomes
+        self.values = values
+        self.kind = kind
+        self.num_bits = num_bits
+        self._dict_factory = dict_factory
+        self._dict: Optional[Dict[Any, Any]] = None
+
+    def __repr__(self) -> str:
+        return f"Histogram(kind={self.kind!r}, num_outcomes={len(self.outcomes)}, num_bits={self.num_bits})"
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.to_dict()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def to_dict(self) -> Dict[Any, Any]:
+        """Returns the mapping form of the histogram, built once.
+
+        :return: Histogram as a dict
+        :rtype: Dict[Any, Any]
+        """
+        if self._dict is None:
+            if self._dict_factory is not None:
+                self._dict = self._dict_factory()
+                self._dict_factory = None
+            else:
+                self._dict = dict(zip(self.outcomes.tolist(), self.values.tolist()))
+        return self._dict
+
+    @property
+    def total(self) -> float:
+        """Total count (or probability)"""
+        return float(self.values.sum())
+
+    def probabilities(self) -> np.ndarray:
+        """Returns the probabilities of the outcomes.
+
+        :return: Probabilities, in the order of `outcomes`
+        :rtype: numpy.ndarray
+        """
+        if self.kind == PROBABILITIES:
+            return self.values.astype(np.float64, copy=False)
+        total = self.total
+        return self.values / total if total else np.zeros(len(self.values))
+
+    def counts_vector(self, shots: Optional[float] = None) -> CountsVector:
+        """Returns the histogram as a sorted counts vector, for aggregation,
+        marginalisation and expectation values (see :mod:`azure.quantum.results`).
+
+        :param shots: Number of shots probabilities are scaled by, defaults to 1
+        :type shots: float
+        :return: Counts vector
+        :rtype: CountsVector
+        """
+        values = self.values.astype(np.float64)
+        if self.kind == PROBABILITIES and shots is not None:
+            values = values * shots
+        return CountsVector.from_counts(self.outcomes.tolist(), values)
+
+    def outcome_bits(self) -> np.ndarray:
+        """Returns the bits of the outcomes, as a `uint8` array of shape
+        (num_outcomes, num_bits).
+
+        :return: Bits of the outcomes
+        :rtype: numpy.ndarray
+        """
+        if self.num_bits is None:
+            raise ValueError("The number of bits of the outcomes is unknown.")
+        if self.outcomes.dtype != object:
+            return ((self.outcomes[:, np.newaxis] >> np.arange(self.num_bits)) & 1).astype(np.uint8)
+        return np.array(
+            [[(outcome >> i) & 1 for i in range(self.num_bits)] for outcome in self.outcomes.tolist()],
+            dtype=np.uint8,
+        ).reshape(len(self.outcomes), self.num_bits)
+
+    @classmethod
+    def from_outcomes(
+        cls,
+        outcomes: Iterable[Any],
+        values: Iterable[float],
+        kind: str = COUNTS,
+        dict_factory: Optional[Callable[[], Dict[Any, Any]]] = None
+    ) -> "Histogram":
+        """Builds a histogram from "microsoft.quantum-results.v2" outcomes, where
+        tuples are encoded as `{"Item1": ..., "Item2": ...}` objects, or from
+        converted outcomes (lists and tuples).
+
+        Raises :class:`ValueError` if the outcomes contain values other than bits.
+
+        :param outcomes: Outcomes
+        :type outcomes: Iterable[Any]
+        :param values: Counts or probabilities of the outcomes
+        :type values: Iterable[float]
+        :param kind: "counts" or "probabilities", defaults to "counts"
+        :type kind: str
+        :param dict_factory: Builds the mapping form of the histogram
+        :type dict_factory: Callable[[], Dict[Any, Any]]
+        :return: Histogram
+        :rtype: Histogram
+        """
+        codes = []
+        num_bits = None
+        for outcome in outcomes:
+            bits = _flatten_bits(outcome)
+            num_bits = len(bits) if num_bits is None else max(num_bits, len(bits))
+            codes.append(_bits_to_int(bits))
+        values = np.array(list(values), dtype=np.int64 if kind == COUNTS else np.float64)
+        return cls(_outcome_array(codes), values, kind, num_bits, dict_factory)
+
+
+def _flatten_bits(outcome: Any) -> List[Any]:
+    """Flattens the registers and tuple items of an outcome, in order."""
+    if isinstance(outcome, dict):
+        return [bit for i in range(len(outcome)) for bit in _flatten_bits(outcome[f"Item{i+1}"])]
+    if isinstance(outcome, (list, tuple)):
+        return [bit for item in outcome for bit in _flatten_bits(item)]
+    return [outcome]
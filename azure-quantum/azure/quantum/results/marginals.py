@@ -0,0 +1,209 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Marginalisation of histograms onto subsets of the measured bits.
+
+Outcomes are integer-encoded (see :class:`CountsVector`), so the bits of
+a marginal are extracted from all the outcomes at once with shifts and
+masks, and the counts of the outcomes that become equal are summed with
+`np.bincount`. Dense histograms (arrays of 2^n counts indexed by outcome)
+are marginalised by summing over the axes of the other bits.
+"""
+
+import ast
+
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+from azure.quantum.job.base_job import DEFAULT_TIMEOUT
+from azure.quantum.job.shots_array import ShotsArray
+from azure.quantum.results.aggregation import CountsVector, job_counts, job_shots
+from azure.quantum.results.histogram import Histogram
+
+if TYPE_CHECKING:
+    from azure.quantum.job.job import Job
+
+__all__ = ["marginalize", "register_bits"]
+
+Source = Union["Job", CountsVector, Histogram, ShotsArray, np.ndarray]
+
+# Histograms of marginals of up to 2^_MAX_DENSE_BITS outcomes may be counted densely
+_MAX_DENSE_BITS = 24
+
+
+def marginalize(
+    source: Source,
+    bits: Optional[Sequence[int]] = None,
+    register: Optional[Union[int, str]] = None,
+    timeout_secs: float = DEFAULT_TIMEOUT
+) -> Union[CountsVector, np.ndarray]:
+    """Marginalises a histogram onto a subset of the measured bits, or onto
+    one register of the results of a job.
+
+    Bit `j` of a marginal outcome is bit `bits[j]` of the original outcome.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+        from azure.quantum.results import marginalize
+
+        # Counts of the first register of a job
+        counts = marginalize(job, register=0).to_dict()
+        # Counts of bits 0 and 3 of a dense histogram of 2^n counts
+        dense_counts = marginalize(dense_histogram, bits=[0, 3])
+
+    :param source: Job, counts vector, compact histogram, shots, or dense
+        histogram (1-D array of 2^n counts or probabilities indexed by outcome)
+    :type source: Union[Job, CountsVector, Histogram, ShotsArray, numpy.ndarray]
+    :param bits: Bits to keep
+    :type bits: Sequence[int]
+    :param register: Register to keep, for jobs only (see :func:`register_bits`)
+    :type register: Union[int, str]
+    :param timeout_secs: Timeout in seconds to wait for a job, defaults to 300
+    :type timeout_secs: float
+    :return: Marginal histogram, dense for a dense source
+    :rtype: Union[CountsVector, numpy.ndarray]
+    """
+    if (bits is None) == (register is None):
+        raise ValueError("Exactly one of bits and register must be given.")
+    if register is not None:
+        if isinstance(source, (CountsVector, Histogram, ShotsArray, np.ndarray)):
+            raise ValueError("Registers can only be selected for jobs, use bits instead.")
+        bits = register_bits(source, register, timeout_secs=timeout_secs)
+    bits = [int(bit) for bit in bits]
+    if any(bit < 0 for bit in bits) or len(set(bits)) != len(bits):
+        raise ValueError(f"Bits must be distinct non-negative indices, got {bits}.")
+
+    if isinstance(source, np.ndarray):
+        return _marginalize_dense(source, bits)
+
+    if isinstance(source, CountsVector):
+        vector = source
+    elif isinstance(source, Histogram):
+        vector = source.counts_vector()
+    elif isinstance(source, ShotsArray):
+        vector = CountsVector.from_shots(source)
+    else:
+        shots = job_shots(source)
+        vector = job_counts(source, timeout_secs=timeout_secs, shots=shots if shots is not None else 1)
+    return _marginalize_vector(vector, bits)
+
+
+def _extract_bits(outcomes: np.ndarray, bits: List[int]) -> np.ndarray:
+    """Returns the marginal outcomes, bit `j` being bit `bits[j]` of the outcomes."""
+    if len(bits) > 63 or outcomes.dtype == object or (bits and max(bits) > 62):
+        marginal = [0] * len(outcomes)
+        for i, outcome in enumerate(outcomes.tolist()):
+            value = 0
+            for j, bit in enumerate(bits):
+                value |= ((outcome >> bit) & 1) << j
+            marginal[i] = value
+        return np.array(marginal, dtype=object if len(bits) > 63 else np.int64)
+
+    if not bits:
+        return np.zeros_like(outcomes)
+    if bits == list(range(bits[0], bits[0] + len(bits))):
+        # Contiguous bits: a single shift and mask
+        return (outcomes >> bits[0]) & ((1 << len(bits)) - 1)
+
+    marginal = np.zeros_like(outcomes)
+    for j, bit in enumerate(bits):
+        marginal |= ((outcomes >> bit) & 1) << j
+    return marginal
+
+
+def _marginalize_vector(vector: CountsVector, bits: List[int]) -> CountsVector:
+    marginal = _extract_bits(vector.outcomes, bits)
+    if marginal.dtype != object and len(bits) <= _MAX_DENSE_BITS and (1 << len(bits)) <= 4 * len(marginal) + 1024:
+        # Count densely, then keep the outcomes that occurred
+        counts = np.bincount(marginal, weights=vector.counts, minlength=1 << len(bits))
+        present = np.bincount(marginal, minlength=1 << len(bits)) > 0
+        outcomes = np.flatnonzero(present).astype(np.int64)
+        return CountsVector(outcomes, counts[present])
+    return CountsVector.from_counts(marginal.tolist(), vector.counts)
+
+
+def _marginalize_dense(histogram: np.ndarray, bits: List[int]) -> np.ndarray:
+    if histogram.ndim != 1:
+        raise ValueError("Dense histograms must be 1-D arrays of 2^n counts.")
+    num_bits = len(histogram).bit_length() - 1
+    if len(histogram) != 1 << num_bits:
+        raise ValueError(f"Dense histograms must have 2^n counts, got {len(histogram)}.")
+    if bits and max(bits) >= num_bits:
+        raise ValueError(f"Bit {max(bits)} is out of range for a histogram of {num_bits} bits.")
+
+    # Axis a of the tensor is bit num_bits - 1 - a
+    tensor = histogram.reshape((2,) * num_bits)
+    other_axes = tuple(num_bits - 1 - bit for bit in range(num_bits) if bit not in bits)
+    marginal = tensor.sum(axis=other_axes) if other_axes else tensor
+    # Remaining axes are in decreasing bit order, put bits[-1] first
+    kept = sorted(bits, reverse=True)
+    marginal = np.transpose(marginal, [kept.index(bit) for bit in reversed(bits)])
+    return np.ascontiguousarray(marginal).reshape(-1)
+
+
+def register_bits(job: "Job", register: Union[int, str], timeout_secs: float = DEFAULT_TIMEOUT) -> List[int]:
+    """Returns the bits of a register in the outcomes of a job
+    (see :func:`azure.quantum.results.job_counts`).
+
+    Registers are the arrays, single bits and tuple items of the outcomes for
+    Microsoft output formats, indexed in order, and the classical registers,
+    by name, for Quantinuum.
+
+    :param job: Job
+    :type job: Job
+    :param register: Index or name of the register
+    :type register: Union[int, str]
+    :param timeout_secs: Timeout in seconds to wait for the job, defaults to 300
+    :type timeout_secs: float
+    :return: Bits of the register
+    :rtype: List[int]
+    """
+    output_data_format = job.details.output_data_format
+
+    if output_data_format == "honeywell.quantum-results.v1":
+        results = job.get_results(timeout_secs=timeout_secs)
+        names = [name for name in results.keys() if name != "access_token"]
+        if register not in names:
+            raise ValueError(f"Register {register!r} not found, the registers are {names}.")
+        widths = [len(results[name][0]) if results[name] else 0 for name in names]
+        # The first register is in the lowest bits
+        index = names.index(register)
+        offset = sum(widths[:index])
+        return list(range(offset, offset + widths[index]))
+
+    if output_data_format == "microsoft.quantum-results.v2":
+        histogram = job.get_results_histogram(timeout_secs=timeout_secs)
+        if isinstance(histogram, list) or not histogram:
+            raise ValueError(f"The registers of job {job.id} cannot be determined.")
+        outcome = next(iter(histogram.values()))["outcome"]
+    elif output_data_format == "microsoft.quantum-results.v1":
+        histogram = job.get_results(timeout_secs=timeout_secs)
+        if not histogram:
+            raise ValueError(f"The registers of job {job.id} cannot be determined.")
+        outcome = ast.literal_eval(next(iter(histogram.keys())))
+    else:
+        raise ValueError(f"Registers are not supported for jobs using the \"{output_data_format}\" output format.")
+
+    if not isinstance(register, int):
+        raise ValueError("Registers of Microsoft output formats are selected by index.")
+    widths = _register_widths(outcome)
+    if not -len(widths) <= register < len(widths):
+        raise ValueError(f"Register {register} not found, the outcomes have {len(widths)} registers.")
+    register = register % len(widths)
+    offset = sum(widths[:register])
+    return list(range(offset, offset + widths[register]))
+
+
+def _register_widths(outcome: Any) -> List[int]:
+    """Returns the widths of the registers of an outcome, in order."""
+    if isinstance(outcome, list) and all(not isinstance(item, (list, tuple)) for item in outcome):
+        return [len(outcome)]
+    if isinstance(outcome, (list, tuple)):
+        return [width for item in outcome for width in _register_widths(item)]
+    return [1]
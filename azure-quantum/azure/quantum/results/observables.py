@@ -0,0 +1,238 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Expectation values of Pauli-Z observables over measured outcomes.
+
+A Pauli-Z string is diagonal in the computational basis: its eigenvalue
+for an outcome is (-1) to the parity of the outcome's bits it acts on. The
+expectation values of all the terms are computed at once, from the parity
+of the integer-encoded outcomes (see :class:`CountsVector`) masked by the
+bit mask of each term.
+
+Terms are given as:
+
+- Pauli strings such as "ZII", in the Qiskit and OpenQASM label order: the
+  rightmost character acts on bit 0, so "ZII" acts on bit 2,
+- sparse strings such as "Z0 Z2",
+- sequences of the indices of the bits the term acts on, such as `[0, 2]`.
+"""
+
+import re
+
+from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from azure.quantum.job.base_job import DEFAULT_TIMEOUT
+from azure.quantum.job.shots_array import ShotsArray
+from azure.quantum.results.aggregation import CountsVector, job_counts, job_shots
+from azure.quantum.results.histogram import Histogram
+
+if TYPE_CHECKING:
+    from azure.quantum.job.job import Job
+
+__all__ = [
+    "ExpectationValues",
+    "HamiltonianExpectation",
+    "pauli_z_masks",
+    "expectation_values",
+    "hamiltonian_expectation",
+]
+
+PauliTerm = Union[str, Sequence[int]]
+
+# Histogram sources: a job, its shots or a histogram keyed by integer outcome
+Source = Union["Job", CountsVector, Histogram, ShotsArray, Mapping[int, float]]
+
+# Output formats whose histograms are counts rather than probabilities
+_COUNTS_BASED_FORMATS = ("microsoft.quantum-results.v2", "honeywell.quantum-results.v1")
+
+_SPARSE_TERM = re.compile(r"^\s*([IZ]\d+\s*)*$")
+
+
+class ExpectationValues(NamedTuple):
+    """Expectation values of Pauli-Z terms.
+
+    :param values: Expectation values of the terms
+    :param variances: Variances of the terms' eigenvalue over the outcomes,
+        `1 - value ** 2`
+    :param shots: Number of shots (total count of the histogram) the values
+        were estimated from, None if unknown
+    """
+    values: np.ndarray
+    variances: np.ndarray
+    shots: Optional[float]
+
+    def standard_errors(self) -> np.ndarray:
+        """Returns the standard errors of the expectation values estimated
+        from `shots` shots.
+
+        :return: Standard errors
+        :rtype: numpy.ndarray
+        """
+        if not self.shots:
+            raise ValueError("The number of shots is unknown.")
+        return np.sqrt(self.variances / self.shots)
+
+
+class HamiltonianExpectation(NamedTuple):
+    """Expectation value of a diagonal Hamiltonian (weighted sum of Pauli-Z terms).
+
+    :param energy: Expectation value of the Hamiltonian
+    :param variance: Variance of the Hamiltonian over the outcomes,
+        including the covariances of the terms
+    :param terms: Expectation values of the terms
+    """
+    energy: float
+    variance: float
+    terms: ExpectationValues
+
+
+def pauli_z_masks(terms: Iterable[PauliTerm]) -> List[int]:
+    """Returns the bit mask of each Pauli-Z term. The rightmost character
+    of a Pauli string acts on bit 0, as in Qiskit labels: "ZI" acts on bit 1.
+
+    :param terms: Pauli-Z terms
+    :type terms: Iterable[PauliTerm]
+    :return: Bit masks, bit `i` being set if the term acts on bit `i`
+    :rtype: List[int]
+    """
+    masks = []
+    for term in terms:
+        mask = 0
+        if isinstance(term, str):
+            if re.search(r"\d", term):
+                if not _SPARSE_TERM.match(term):
+                    raise ValueError(f"Invalid Pauli-Z term \"{term}\".")
+                for pauli, index in re.findall(r"([IZ])(\d+)", term):
+                    if pauli == "Z":
+                        mask ^= 1 << int(index)
+            else:
+                for i, pauli in enumerate(reversed(term)):
+                    if pauli == "Z":
+                        mask |= 1 << i
+                    elif pauli != "I":
+                        raise ValueError(f"Invalid Pauli-Z term \"{term}\": only I and Z are diagonal in the measurement basis.")
+        else:
+            for index in term:
+                mask ^= 1 << int(index)
+        masks.append(mask)
+    return masks
+
+
+def _parities(outcomes: np.ndarray, masks: List[int]) -> np.ndarray:
+    """Returns the parities of the outcomes masked by each mask,
+    as a (outcomes x masks) array of zeros and ones."""
+    if outcomes.dtype != object and all(mask < (1 << 63) for mask in masks):
+        # Fold the bits of each masked outcome onto the lowest bit
+        x = outcomes[:, np.newaxis] & np.array(masks, dtype=np.int64)[np.newaxis, :]
+        for shift in (32, 16, 8, 4, 2, 1):
+            x ^= x >> shift
+        return (x & 1).astype(np.int8)
+
+    return np.array(
+        [[bin(int(outcome) & mask).count("1") & 1 for mask in masks] for outcome in outcomes],
+        dtype=np.int8,
+    ).reshape(len(outcomes), len(masks))
+
+
+def _counts_vector(source: Source, timeout_secs: float) -> Tuple[CountsVector, Optional[float]]:
+    """Returns the counts vector of a source, and its number of shots if known."""
+    if isinstance(source, CountsVector):
+        return source, source.total
+    if isinstance(source, ShotsArray):
+        return CountsVector.from_shots(source), len(source)
+    if isinstance(source, Histogram):
+        vector = source.counts_vector()
+        return vector, vector.total if source.kind == "counts" else None
+    if isinstance(source, Mapping):
+        vector = CountsVector.from_counts(source.keys(), source.values())
+        return vector, vector.total
+
+    # Job: probability based histograms are used as is if the shots are unknown
+    shots = job_shots(source)
+    counts_based = source.details.output_data_format in _COUNTS_BASED_FORMATS
+    vector = job_counts(source, timeout_secs=timeout_secs, shots=shots if shots is not None else 1)
+    return vector, vector.total if counts_based or shots is not None else None
+
+
+def expectation_values(
+    source: Source,
+    terms: Iterable[PauliTerm],
+    timeout_secs: float = DEFAULT_TIMEOUT
+) -> ExpectationValues:
+    """Computes the expectation values of Pauli-Z terms, and their variances,
+    over the outcomes of a job.
+
+    The histogram of a job is taken from `get_results` or
+    `get_results_histogram` depending on its output format (see
+    :func:`azure.quantum.results.job_counts`).
+
+    :param source: Job, counts vector, compact histogram, shots, or histogram
+        (counts or probabilities) keyed by integer outcome
+    :type source: Union[Job, CountsVector, Histogram, ShotsArray, Mapping[int, float]]
+    :param terms: Pauli-Z terms: Pauli strings, whose rightmost character
+        acts on bit 0 (e.g. "IZ" acts on bit 0), sparse strings such as
+        "Z0 Z2", or sequences of bit indices
+    :type terms: Iterable[PauliTerm]
+    :param timeout_secs: Timeout in seconds to wait for a job, defaults to 300
+    :type timeout_secs: float
+    :return: Expectation values and variances of the terms
+    :rtype: ExpectationValues
+    """
+    vector, shots = _counts_vector(source, timeout_secs)
+    values = _term_signs(vector, pauli_z_masks(terms)).T @ vector.probabilities()
+    return ExpectationValues(values, 1.0 - values ** 2, shots)
+
+
+def _term_signs(vector: CountsVector, masks: List[int]) -> np.ndarray:
+    """Returns the eigenvalues (+1 or -1) of the terms for each outcome."""
+    return 1.0 - 2.0 * _parities(vector.outcomes, masks)
+
+
+def hamiltonian_expectation(
+    source: Source,
+    hamiltonian: Union[Mapping[Any, float], Iterable[Tuple[PauliTerm, float]]],
+    timeout_secs: float = DEFAULT_TIMEOUT
+) -> HamiltonianExpectation:
+    """Computes the expectation value and the variance of a diagonal
+    Hamiltonian, given as a weighted sum of Pauli-Z terms, over the outcomes of a job.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+        from azure.quantum.results import hamiltonian_expectation
+
+        result = hamiltonian_expectation(job, {"ZZI": 0.5, "IZZ": 0.5, "ZIZ": -1.0})
+        print(result.energy, result.variance)
+
+    :param source: Job, counts vector, compact histogram, shots, or histogram
+        (counts or probabilities) keyed by integer outcome
+    :type source: Union[Job, CountsVector, Histogram, ShotsArray, Mapping[int, float]]
+    :param hamiltonian: Coefficients by Pauli-Z term (sequence terms must be
+        given as tuples to be used as keys), or (term, coefficient) pairs.
+        The rightmost character of a Pauli string acts on bit 0
+    :type hamiltonian: Union[Mapping[PauliTerm, float], Iterable[Tuple[PauliTerm, float]]]
+    :param timeout_secs: Timeout in seconds to wait for a job, defaults to 300
+    :type timeout_secs: float
+    :return: Expectation value and variance of the Hamiltonian, and of its terms
+    :rtype: HamiltonianExpectation
+    """
+    items = list(hamiltonian.items()) if isinstance(hamiltonian, Mapping) else list(hamiltonian)
+    masks = pauli_z_masks(term for term, _ in items)
+    coefficients = np.array([coefficient for _, coefficient in items], dtype=np.float64)
+
+    vector, shots = _counts_vector(source, timeout_secs)
+    probabilities = vector.probabilities()
+    signs = _term_signs(vector, masks)
+    values = signs.T @ probabilities
+
+    # Energy of each outcome
+    energies = signs @ coefficients
+    energy = float(energies @ probabilities)
+    variance = max(float((energies ** 2) @ probabilities) - energy ** 2, 0.0)
+    return HamiltonianExpectation(energy, variance, ExpectationValues(values, 1.0 - values ** 2, shots))
@@ -0,0 +1,426 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Streaming top-k summaries of histograms too large to materialise.
+
+On wide devices almost every shot is a distinct outcome, so the full
+histogram of a job is about as large as its shots. A :class:`TopKSketch`
+instead counts the integer-encoded outcomes (see :class:`CountsVector`)
+in a count-min sketch of fixed size, and only keeps a bounded set of
+candidate outcomes with the largest estimated counts.
+
+The count of an outcome estimated by the sketch is never below its true
+count, and exceeds it by at most `epsilon * total` with probability
+`confidence`, where `epsilon = e / width` and `confidence = 1 - exp(-depth)`.
+Sketches with the same parameters can be merged, e.g. across the jobs of
+one experiment.
+"""
+
+import itertools
+import logging
+import math
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from azure.quantum.job.base_job import DEFAULT_TIMEOUT
+from azure.quantum.job.shots_array import ShotsArray
+from azure.quantum.results.aggregation import CountsVector, _finished_jobs, _outcome_array, _reduce, job_counts
+
+if TYPE_CHECKING:
+    from azure.quantum.job.job import Job
+
+__all__ = ["CountMinSketch", "TopK", "TopKSketch", "job_top_k", "merge_top_k"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WIDTH = 16384
+DEFAULT_DEPTH = 5
+DEFAULT_BLOCK_SIZE = 65536
+
+_MASK_64 = (1 << 64) - 1
+
+
+class CountMinSketch:
+    """Count-min sketch of the counts of integer outcomes.
+
+    :param width: Number of counters per row, defaults to 16384
+    :type width: int
+    :param depth: Number of rows (hash functions), defaults to 5
+    :type depth: int
+    :param seed: Seed of the hash functions, sketches can only be merged
+        if they have the same width, depth and seed. Defaults to 0
+    :type seed: int
+    """
+
+    def __init__(self, width: int = DEFAULT_WIDTH, depth: int = DEFAULT_DEPTH, seed: int = 0):
+        if width < 1 or depth < 1:
+            raise ValueError("The width and depth of a sketch must be at least 1.")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hash functions, with odd multipliers
+        self._a = rng.integers(0, 1 << 63, depth, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, depth, dtype=np.uint64)
+        self.table = np.zeros((depth, width), dtype=np.float64)
+        self.total = 0.0
+
+    def __repr__(self) -> str:
+        return f"CountMinSketch(width={self.width}, depth={self.depth}, seed={self.seed}, total={self.total})"
+
+    @property
+    def epsilon(self) -> float:
+        """Relative error of the estimates, as a fraction of the total count"""
+        return math.e / self.width
+
+    @property
+    def confidence(self) -> float:
+        """Probability that an estimate is within `epsilon * total` of the true count"""
+        return 1.0 - math.exp(-self.depth)
+
+    def _indices(self, outcomes: np.ndarray) -> np.ndarray:
+        """Returns the counter of each outcome in each row, as a (depth x outcomes) array."""
+        if outcomes.dtype == object:
+            # Fold outcomes wider than 64 bits onto 64 bits
+            keys = []
+            for outcome in outcomes.tolist():
+                key = 0
+                while outcome:
+                    key ^= outcome & _MASK_64
+                    outcome >>= 64
+                keys.append(key)
+            keys = np.array(keys, dtype=np.uint64)
+        else:
+            keys = outcomes.astype(np.uint64)
+        hashes = self._a[:, np.newaxis] * keys[np.newaxis, :] + self._b[:, np.newaxis]
+        return ((hashes >> np.uint64(32)) % np.uint64(self.width)).astype(np.intp)
+
+    def update(self, outcomes: np.ndarray, counts: np.ndarray) -> None:
+        """Adds counts of outcomes to the sketch.
+
+        :param outcomes: Outcomes
+        :type outcomes: numpy.ndarray
+        :param counts: Counts of the outcomes
+        :type counts: numpy.ndarray
+        """
+        if len(outcomes) == 0:
+            return
+        counts = np.asarray(counts, dtype=np.float64)
+        for row, indices in enumerate(self._indices(outcomes)):
+            self.table[row] += np.bincount(indices, weights=counts, minlength=self.width)
+        self.total += float(counts.sum())
+
+    def estimate(self, outcomes: np.ndarray) -> np.ndarray:
+        """Returns the estimated counts of outcomes, never below their true counts.
+
+        :param outcomes: Outcomes
+        :type outcomes: numpy.ndarray
+        :return: Estimated counts
+        :rtype: numpy.ndarray
+        """
+        if len(outcomes) == 0:
+            return np.zeros(0)
+        indices = self._indices(outcomes)
+        return self.table[np.arange(self.depth)[:, np.newaxis], indices].min(axis=0)
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Adds the counts of another sketch with the same parameters.
+
+        :param other: Sketch to merge
+        :type other: CountMinSketch
+        """
+        if (other.width, other.depth, other.seed) != (self.width, self.depth, self.seed):
+            raise ValueError("Only sketches with the same width, depth and seed can be merged.")
+        self.table += other.table
+        self.total += other.total
+
+
+class TopK(NamedTuple):
+    """Most frequent outcomes of a histogram, estimated by a :class:`TopKSketch`.
+
+    :param outcomes: Outcomes, by decreasing estimated count
+    :param counts: Estimated counts of the outcomes, never below the true counts
+    :param error: Bound of the overestimation of the counts, `epsilon * total`
+    :param confidence: Probability that each count is within `error` of the true count
+    :param total: Total count of the histogram
+    """
+    outcomes: np.ndarray
+    counts: np.ndarray
+    error: float
+    confidence: float
+    total: float
+
+    def lower_bounds(self) -> np.ndarray:
+        """Returns the lower bounds of the true counts, with probability `confidence`.
+
+        :return: Lower bounds of the counts
+        :rtype: numpy.ndarray
+        """
+        return np.maximum(self.counts - self.error, 0.0)
+
+    def to_dict(self) -> Dict[int, float]:
+        """Returns the estimated counts keyed by outcome.
+
+        :return: Estimated counts
+        :rtype: Dict[int, float]
+        """
+        return dict(zip(self.outcomes.tolist(), self.counts.tolist()))
+
+
+class TopKSketch:
+    """Streaming summary of the `k` most frequent outcomes of histograms.
+
+    Outcomes are counted in a :class:`CountMinSketch`, and at most
+    `capacity` candidate outcomes with the largest estimated counts are
+    kept, so the memory used does not depend on the number of distinct
+    outcomes.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+        from azure.quantum.results import TopKSketch
+
+        sketch = TopKSketch(k=10)
+        for job in jobs:
+            sketch.update_job(job)
+        top = sketch.top_k()
+        print(top.to_dict(), top.error)
+
+    :param k: Number of outcomes to summarise
+    :type k: int
+    :param width: Number of counters per row of the sketch, defaults to 16384
+    :type width: int
+    :param depth: Number of rows of the sketch, defaults to 5
+    :type depth: int
+    :param seed: Seed of the hash functions of the sketch, defaults to 0
+    :type seed: int
+    :param capacity: Number of candidate outcomes kept, defaults to `max(4 * k, 64)`
+    :type capacity: int
+    """
+
+    def __init__(
+        self,
+        k: int,
+        width: int = DEFAULT_WIDTH,
+        depth: int = DEFAULT_DEPTH,
+        seed: int = 0,
+        capacity: Optional[int] = None
+    ):
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        self.capacity = max(capacity if capacity is not None else max(4 * k, 64), k)
+        self.sketch = CountMinSketch(width, depth, seed)
+        self._candidates = np.zeros(0, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"TopKSketch(k={self.k}, capacity={self.capacity}, sketch={self.sketch!r})"
+
+    @property
+    def total(self) -> float:
+        """Total count of the summarised histograms"""
+        return self.sketch.total
+
+    def update(self, outcomes: Iterable[int], counts: Optional[Iterable[float]] = None) -> None:
+        """Adds outcomes to the summary.
+
+        :param outcomes: Outcomes, repeated or not
+        :type outcomes: Iterable[int]
+        :param counts: Counts of the outcomes, defaults to 1 for each
+        :type counts: Iterable[float]
+        """
+        if not isinstance(outcomes, np.ndarray):
+            outcomes = _outcome_array([int(outcome) for outcome in outcomes])
+        counts = np.ones(len(outcomes)) if counts is None else np.asarray(list(counts), dtype=np.float64)
+        self.update_counts(_reduce(outcomes, counts))
+
+    def update_counts(self, vector: CountsVector) -> None:
+        """Adds a counts vector to the summary.
+
+        :param vector: Counts vector
+        :type vector: CountsVector
+        """
+        self.sketch.update(vector.outcomes, vector.counts)
+        self._add_candidates(vector.outcomes)
+
+    def update_shots(self, shots_array: ShotsArray) -> None:
+        """Adds shots to the summary, bit `i` of an outcome being column `i` of the shots.
+
+        :param shots_array: Shots
+        :type shots_array: ShotsArray
+        """
+        self.update_counts(CountsVector.from_shots(shots_array))
+
+    def update_job(
+        self,
+        job: "Job",
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> None:
+        """Adds the outcomes of a job to the summary, without building its histogram.
+
+        The shots of "microsoft.quantum-results.v2" outputs are streamed from
+        the output data, and the shots of "honeywell.quantum-results.v1"
+        (Quantinuum) outputs are counted block by block. Other output
+        formats are counted from their histogram (see
+        :func:`azure.quantum.results.job_counts`).
+
+        :param job: Job
+        :type job: Job
+        :param block_size: Number of shots decoded at once, defaults to 65536
+        :type block_size: int
+        :param timeout_secs: Timeout in seconds to wait for the job, defaults to 300
+        :type timeout_secs: float
+        """
+        output_data_format = job.details.output_data_format
+
+        if output_data_format == "microsoft.quantum-results.v2":
+            # The raw shots are packed, tuples being encoded as {"Item1": ...} objects
+            shots = job._iter_v2_results("Shots", 0, timeout_secs)
+            for block in iter(lambda: list(itertools.islice(shots, block_size)), []):
+                self.update_shots(ShotsArray.from_shots(block))
+
+        elif output_data_format == "honeywell.quantum-results.v1":
+            results = job.get_results(timeout_secs=timeout_secs)
+            registers = [bitstrings for register, bitstrings in results.items() if register != "access_token"]
+            num_shots = len(registers[0]) if registers else 0
+            for start in range(0, num_shots, block_size):
+                block = [register[start:start + block_size] for register in registers]
+                self.update(_bitstrings_to_outcomes(block))
+
+        else:
+            self.update_counts(job_counts(job, timeout_secs=timeout_secs))
+
+        logger.debug(f"Summarised the outcomes of job {job.id}")
+
+    def merge(self, other: "TopKSketch") -> None:
+        """Adds the outcomes summarised by another sketch with the same parameters.
+
+        :param other: Sketch to merge
+        :type other: TopKSketch
+        """
+        self.sketch.merge(other.sketch)
+        self._add_candidates(other._candidates)
+
+    def top_k(self, k: Optional[int] = None) -> TopK:
+        """Returns the most frequent outcomes and their estimated counts.
+
+        :param k: Number of outcomes, defaults to the `k` of the sketch
+        :type k: int
+        :return: Most frequent outcomes
+        :rtype: TopK
+        """
+        k = self.k if k is None else k
+        estimates = self.sketch.estimate(self._candidates)
+        order = np.argsort(-estimates, kind="stable")[:k]
+        return TopK(
+            self._candidates[order],
+            estimates[order],
+            self.sketch.epsilon * self.sketch.total,
+            self.sketch.confidence,
+            self.sketch.total,
+        )
+
+    def _add_candidates(self, outcomes: np.ndarray) -> None:
+        """Adds outcomes to the candidates, keeping the `capacity` ones with the largest estimates."""
+        if len(outcomes) == 0:
+            return
+        if (outcomes.dtype == object) != (self._candidates.dtype == object):
+            outcomes = outcomes.astype(object)
+            self._candidates = self._candidates.astype(object)
+        candidates = np.unique(np.concatenate([self._candidates, outcomes]))
+        if len(candidates) > self.capacity:
+            estimates = self.sketch.estimate(candidates)
+            candidates = candidates[np.argpartition(-estimates, self.capacity - 1)[:self.capacity]]
+        self._candidates = candidates
+
+
+def _bitstrings_to_outcomes(registers: List[List[str]]) -> np.ndarray:
+    """Returns the outcomes of Quantinuum shots, the first register being
+    in the lowest bits, as in :func:`azure.quantum.results.job_counts`."""
+    if not registers:
+        return np.zeros(0, dtype=np.int64)
+    bitstrings = np.asarray(registers[-1], dtype=str)
+    for register in reversed(registers[:-1]):
+        bitstrings = np.char.add(bitstrings, np.asarray(register, dtype=str))
+    if len(bitstrings) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    lengths = np.char.str_len(bitstrings)
+    width = int(lengths.max())
+    if width == 0:
+        return np.zeros(len(bitstrings), dtype=np.int64)
+    if width > 63 or int(lengths.min()) != width:
+        return _outcome_array([int(bitstring, 2) for bitstring in bitstrings.tolist()])
+
+    bits = np.frombuffer(bitstrings.astype(f"S{width}").tobytes(), dtype=np.uint8).reshape(-1, width) - ord("0")
+    if bits.max() > 1:
+        raise ValueError("Quantinuum results were expected to contain only bitstrings.")
+    weights = np.int64(1) << np.arange(width - 1, -1, -1, dtype=np.int64)
+    return bits.astype(np.int64) @ weights
+
+
+def job_top_k(
+    job: "Job",
+    k: int,
+    width: int = DEFAULT_WIDTH,
+    depth: int = DEFAULT_DEPTH,
+    timeout_secs: float = DEFAULT_TIMEOUT
+) -> TopK:
+    """Returns the `k` most frequent outcomes of a job, without building its
+    histogram (see :meth:`TopKSketch.update_job`).
+
+    :param job: Job
+    :type job: Job
+    :param k: Number of outcomes
+    :type k: int
+    :param width: Number of counters per row of the sketch, defaults to 16384
+    :type width: int
+    :param depth: Number of rows of the sketch, defaults to 5
+    :type depth: int
+    :param timeout_secs: Timeout in seconds to wait for the job, defaults to 300
+    :type timeout_secs: float
+    :return: Most frequent outcomes
+    :rtype: TopK
+    """
+    sketch = TopKSketch(k, width=width, depth=depth)
+    sketch.update_job(job, timeout_secs=timeout_secs)
+    return sketch.top_k()
+
+
+def merge_top_k(
+    jobs: Iterable["Job"],
+    k: int,
+    width: int = DEFAULT_WIDTH,
+    depth: int = DEFAULT_DEPTH,
+    timeout_secs: Optional[float] = None
+) -> TopK:
+    """Returns the `k` most frequent outcomes of the merged histograms of
+    jobs, summing their counts (see :func:`merge_histograms`).
+
+    Finished jobs are summarised first, then the others in the order
+    they complete.
+
+    :param jobs: Jobs to merge the outcomes of
+    :type jobs: Iterable[Job]
+    :param k: Number of outcomes
+    :type k: int
+    :param width: Number of counters per row of the sketch, defaults to 16384
+    :type width: int
+    :param depth: Number of rows of the sketch, defaults to 5
+    :type depth: int
+    :param timeout_secs: Timeout in seconds to wait for the unfinished jobs, defaults to None (no timeout)
+    :type timeout_secs: float
+    :return: Most frequent outcomes
+    :rtype: TopK
+    """
+    sketch = TopKSketch(k, width=width, depth=depth)
+    for job in _finished_jobs(jobs, timeout_secs):
+        sketch.update_job(job)
+    return sketch.top_k()
@@ -0,0 +1,219 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+"""Local on-disk store of job results and attachments"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+
+from typing import List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+__all__ = ["ResultsStore"]
+
+logger = logging.getLogger(__name__)
+
+# 1 GiB
+DEFAULT_MAX_SIZE = 1 << 30
+
+_FILE_SUFFIX = ".blob"
+
+# Eviction frees space down to this fraction of max_size, so that the
+# directory is not scanned again on the next writes
+_EVICTION_TARGET = 0.9
+
+
+class ResultsStore:
+    """Stores the blobs downloaded for jobs (output data and attachments)
+    in a local directory, so that re-opening a job does not download them again.
+
+    Blobs are keyed by job id, blob name and blob ETag: a stored blob is
+    only used if the blob in Azure Storage still has the same ETag,
+    which is checked with a conditional download request.
+
+    Files are written atomically, so the directory can be shared by
+    concurrent processes. The least recently used blobs are evicted
+    once the total size of the store exceeds `max_size` bytes. The size
+    is tracked as blobs are written, and the directory only scanned when
+    it crosses `max_size`, so blobs written by other processes are
+    accounted for at the next eviction.
+
+    Example:
+
+    .. highlight:: python
+    .. code-block::
+
+       workspace = Workspace(
+           resource_id="",
+           location="",
+           results_store=ResultsStore("~/.azure-quantum/results"),
+       )
+
+    :param directory: Directory of the store, created if it does not exist
+    :type directory: str
+    :param max_size: Maximum total size of the stored blobs in bytes, defaults to 1 GiB
+    :type max_size: int
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        self._directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # Total size of the stored blobs, None until the directory is scanned
+        self._size: Optional[int] = None
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        """Directory of the store"""
+        return self._directory
+
+    def get(self, job_id: str, blob_name: str) -> Optional[Tuple[str, bytes]]:
+        """Returns the ETag and content of the stored blob, if any.
+
+        :param job_id: Job id
+        :type job_id: str
+        :param blob_name: Name of the blob, including its container
+        :type blob_name: str
+        :return: ETag and content of the blob
+        :rtype: Optional[Tuple[str, bytes]]
+        """
+        for path, etag in self._find(job_id, blob_name):
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                # Mark the blob as recently used
+                os.utime(path)
+                return etag, data
+            except OSError:
+                # Evicted in the meantime
+                continue
+        return None
+
+    def put(self, job_id: str, blob_name: str, etag: str, data: bytes) -> None:
+        """Stores the content of a blob, replacing the previous version.
+
+        :param job_id: Job id
+        :type job_id: str
+        :param blob_name: Name of the blob, including its container
+        :type blob_name: str
+        :param etag: ETag of the blob
+        :type etag: str
+        :param data: Content of the blob
+        :type data: bytes
+        """
+        if not etag or len(data) > self.max_size:
+            return
+
+        job_directory = self._job_directory(job_id)
+        path = os.path.join(
+            job_directory,
+            f"{self._blob_key(blob_name)}.{quote(etag, safe='')}{_FILE_SUFFIX}"
+        )
+        try:
+            os.makedirs(job_directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=job_directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to store blob {blob_name} of job {job_id}: {e}")
+            return
+
+        freed = 0
+        for previous_path, _ in self._find(job_id, blob_name):
+            if previous_path != path:
+                freed += self._remove(previous_path)
+        with self._lock:
+            if self._size is not None:
+                self._size += len(data) - freed
+            if self._size is None or self._size > self.max_size:
+                self._evict()
+
+    def clear(self) -> None:
+        """Removes all the stored blobs."""
+        with self._lock:
+            for entry in os.scandir(self._directory):
+                if entry.is_dir():
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            self._size = None
+
+    def _job_directory(self, job_id: str) -> str:
+        return os.path.join(self._directory, quote(job_id, safe=""))
+
+    @staticmethod
+    def _blob_key(blob_name: str) -> str:
+        return hashlib.sha1(blob_name.encode("utf8")).hexdigest()
+
+    def _find(self, job_id: str, blob_name: str) -> List[Tuple[str, str]]:
+        """Returns the paths and ETags of the stored versions of a blob,
+        most recently used first."""
+        prefix = self._blob_key(blob_name) + "."
+        try:
+            entries = [
+                entry for entry in os.scandir(self._job_directory(job_id))
+                if entry.name.startswith(prefix) and entry.name.endswith(_FILE_SUFFIX)
+            ]
+        except OSError:
+            return []
+
+        entries.sort(key=self._mtime, reverse=True)
+        return [
+            (entry.path, unquote(entry.name[len(prefix):-len(_FILE_SUFFIX)]))
+            for entry in entries
+        ]
+
+    @staticmethod
+    def _mtime(entry: os.DirEntry) -> float:
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path: str) -> int:
+        """Removes a file, returning its size, 0 if it could not be removed."""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError:
+            return 0
+
+    def _evict(self) -> None:
+        """Scans the store to compute its size and, if it exceeds max_size,
+        removes the least recently used blobs. Called with the lock held."""
+        files = []
+        total_size = 0
+        for job_entry in os.scandir(self._directory):
+            if not job_entry.is_dir():
+                continue
+            for entry in os.scandir(job_entry.path):
+                if not entry.name.endswith(_FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        if total_size > self.max_size:
+            target_size = int(self.max_size * _EVICTION_TARGET)
+            files.sort()
+            for _, size, path in files:
+                self._remove(path)
+                total_size -= size
+                if total_size <= target_size:
+                    break
+        self._size = total_size
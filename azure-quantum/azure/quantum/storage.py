@@ -3,8 +3,8 @@
 # Licensed under the MIT License.
 ##
 import logging
-from typing import Any, Dict
-from azure.core import exceptions
+from typing import Any, Dict, Iterator, Optional, Tuple
+from azure.core import exceptions, MatchConditions
 from azure.storage.blob import (
     BlobServiceClient,
     ContainerClient,
@@ -197,6 +197,50 @@ def download_blob(blob_url: str) -> Any:
     return response
 
 
+def download_blob_chunks(blob_url: str) -> Iterator[bytes]:
+    """
+    Downloads the given blob from the container, chunk by chunk.
+    """
+    blob_client = BlobClient.from_blob_url(blob_url)
+    logger.info(
+        f"Downloading blob '{blob_client.blob_name}'"
+        + f"from container '{blob_client.container_name}'"
+        + f"on account: '{blob_client.account_name}'"
+    )
+
+    return blob_client.download_blob().chunks()
+
+
+def download_blob_if_modified(
+    blob_client: BlobClient,
+    etag: Optional[str] = None
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Downloads the given blob, unless its ETag matches the given ETag.
+    Returns the content of the blob (None if it was not modified) and its ETag.
+    """
+    logger.info(
+        f"Downloading blob '{blob_client.blob_name}'"
+        + f"from container '{blob_client.container_name}'"
+        + f"on account: '{blob_client.account_name}'"
+    )
+
+    try:
+        if etag:
+            downloader = blob_client.download_blob(
+                etag=etag, match_condition=MatchConditions.IfModified
+            )
+        else:
+            downloader = blob_client.download_blob()
+    except exceptions.HttpResponseError as e:
+        if e.status_code == 304:
+            logger.debug(f"Blob '{blob_client.blob_name}' not modified")
+            return None, etag
+        raise
+
+    return downloader.readall(), downloader.properties.etag
+
+
 def download_blob_properties(blob_url: str) -> BlobProperties:
     """Downloads the blob properties from Azure for the given blob URI"""
     blob_client = BlobClient.from_blob_url(blob_url)
@@ -308,7 +308,7 @@ target '{self.name}' of provider '{self.provider_id}' not found."
         encoding = kwargs.pop("encoding", self.encoding)
         blob = self._encode_input_data(data=input_data)
         job_cls = type(self)._get_job_class()
-        return job_cls.from_input_data(
+        job = job_cls.from_input_data(
             workspace=self.workspace,
             name=name,
             target=self.name,
@@ -322,6 +322,9 @@ target '{self.name}' of provider '{self.provider_id}' not found."
             session_id=self.get_latest_session_id(),
             **kwargs
         )
+        # Lets the poll policy space out the refreshes of queued jobs
+        job._average_queue_time = self._average_queue_time
+        return job
 
     def make_params(self):
         """
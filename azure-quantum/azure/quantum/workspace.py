@@ -8,16 +8,20 @@ an Azure Quantum Workspace.
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
+import os
 from typing import (
     Any,
     Dict,
     Iterable,
     List,
+    NamedTuple,
     Optional,
     TYPE_CHECKING,
     Tuple,
+    Type,
     Union,
 )
 from azure.quantum._client import QuantumClient
@@ -28,13 +32,23 @@ from azure.quantum._client.operations import (
     SessionsOperations,
     TopLevelItemsOperations
 )
+from azure.quantum._client.operations._operations import (
+    build_jobs_get_request,
+    build_sessions_get_request,
+)
 from azure.quantum._client.models import (
     BlobDetails,
+    JobDetails,
     JobStatus,
     TargetStatus,
 )
 from azure.quantum import Job, Session
+from azure.quantum.job.base_job import DEFAULT_TIMEOUT
+from azure.quantum.job.results_export import resolve_export_format
 from azure.quantum.job.workspace_item_factory import WorkspaceItemFactory
+from azure.quantum._conditional_get import get_details_if_modified
+from azure.quantum._job_details_cache import JobDetailsCache
+from azure.quantum.results_store import ResultsStore
 from azure.quantum._workspace_connection_params import (
     WorkspaceConnectionParams
 )
@@ -52,7 +66,50 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["Workspace"]
+__all__ = ["Workspace", "CancelJobResult", "ExportJobResult"]
+
+
+class CancelJobResult(NamedTuple):
+    """
+    Outcome of the cancellation of one job by :meth:`Workspace.cancel_jobs`.
+
+    :param job:
+        The job with its details after the cancellation request
+        if they were refreshed, otherwise the job that was passed in.
+
+    :param error:
+        The error raised while cancelling (or refreshing) the job, `None` if none was raised.
+    """
+    job: Job
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the cancellation was requested successfully."""
+        return self.error is None
+
+
+class ExportJobResult(NamedTuple):
+    """
+    Outcome of the export of the results of one job by :meth:`Workspace.export_results`.
+
+    :param job:
+        The job whose results were exported, or its id if it could not be fetched.
+
+    :param paths:
+        Paths of the written files.
+
+    :param error:
+        The error raised while exporting the results, `None` if none was raised.
+    """
+    job: Union[Job, str]
+    paths: List[str]
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the results were exported successfully."""
+        return self.error is None
 
 # pylint: disable=line-too-long
 # pylint: disable=too-many-public-methods
@@ -107,6 +164,16 @@ class Workspace:
     :param user_agent:
         Add the specified value as a prefix to the HTTP User-Agent header
         when communicating to the Azure Quantum service.
+
+    :param job_details_cache_size:
+        Maximum number of finished jobs whose details are kept in memory,
+        so that getting them again does not call the service.
+        Defaults to 1000, 0 disables the cache.
+
+    :param results_store:
+        Local store of the job results and attachments downloaded from
+        Azure Storage, which are then only downloaded again if they changed.
+        Defaults to `None`, which disables the store.
     """
     def __init__(
         self,
@@ -118,6 +185,8 @@ class Workspace:
         location: Optional[str] = None,
         credential: Optional[object] = None,
         user_agent: Optional[str] = None,
+        job_details_cache_size: int = 1000,
+        results_store: Optional[ResultsStore] = None,
         **kwargs: Any,
     ) -> None:
         connection_params = WorkspaceConnectionParams(
@@ -139,6 +208,8 @@ class Workspace:
 
         self._connection_params = connection_params
         self._storage = storage
+        self._job_details_cache = JobDetailsCache(job_details_cache_size)
+        self._results_store = results_store
 
         # Create QuantumClient
         self._client = self._create_client()
@@ -213,6 +284,26 @@ class Workspace:
         """
         return self._storage
 
+    @property
+    def results_store(self) -> Optional[ResultsStore]:
+        """
+        Returns the local store of the job results and attachments, if any.
+
+        :return: Local results store.
+        :rtype: Optional[ResultsStore]
+        """
+        return self._results_store
+
+    @results_store.setter
+    def results_store(self, value: Optional[ResultsStore]) -> None:
+        """
+        Sets the local store of the job results and attachments.
+
+        :param value: Local results store, `None` to disable it.
+        :type value: Optional[ResultsStore]
+        """
+        self._results_store = value
+
     def _create_client(self) -> QuantumClient:
         """"
         An internal method to (re)create the underlying Azure SDK REST API client.
@@ -389,9 +480,112 @@ class Workspace:
         details = client.get(job.id)
         return Job(self, details)
 
+    def cancel_jobs(
+        self,
+        jobs: Iterable[Job],
+        max_concurrency: int = 10,
+        refresh: bool = False
+    ) -> List[CancelJobResult]:
+        """
+        Requests the Workspace to cancel the execution of many jobs.
+        The cancellation requests are sent concurrently.
+
+        :param jobs:
+            Jobs to cancel.
+
+        :param max_concurrency:
+            Maximum number of concurrent requests. Defaults to 10.
+
+        :param refresh:
+            Get the details of each job after requesting its cancellation,
+            as :meth:`cancel_job` does. Defaults to `False`.
+
+        :return: The outcome of the cancellation of each job, in the order of `jobs`.
+        :rtype: typing.List[CancelJobResult]
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        client = self._get_jobs_client()
+
+        def cancel(job: Job) -> CancelJobResult:
+            try:
+                client.cancel(job.details.id)
+                if refresh:
+                    job = Job(self, client.get(job.id))
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning(f"Failed to cancel job {job.id}: {e}")
+                return CancelJobResult(job, e)
+            return CancelJobResult(job)
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(jobs))) as executor:
+            return list(executor.map(cancel, jobs))
+
+    def export_results(
+        self,
+        jobs: Iterable[Union[Job, str]],
+        directory: str,
+        format: Optional[str] = None,  # pylint: disable=redefined-builtin
+        max_concurrency: int = 10,
+        timeout_secs: float = DEFAULT_TIMEOUT
+    ) -> List[ExportJobResult]:
+        """
+        Exports the results of many jobs as columnar tables, see :meth:`Job.export_results`.
+        The results of each job are written to `<directory>/<job id>`, so that
+        the files of all jobs can be loaded as one dataset, e.g. with
+        `pyarrow.dataset.dataset(directory)`. The jobs are exported concurrently.
+
+        :param jobs:
+            Jobs, or job ids, to export the results of.
+
+        :param directory:
+            Directory to write the files to.
+
+        :param format:
+            "parquet", "arrow" (Arrow IPC file) or "npz". Defaults to
+            "parquet" if pyarrow is installed and "npz" otherwise.
+
+        :param max_concurrency:
+            Maximum number of jobs exported concurrently. Defaults to 10.
+
+        :param timeout_secs:
+            Timeout in seconds to wait for each job to complete. Defaults to 300.
+
+        :return: The outcome of the export of each job, in the order of `jobs`.
+        :rtype: typing.List[ExportJobResult]
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        format = resolve_export_format(format)
+
+        def export(job: Union[Job, str]) -> ExportJobResult:
+            try:
+                if isinstance(job, str):
+                    job = self.get_job(job)
+                paths = job.export_results(
+                    os.path.join(directory, job.id), format=format, timeout_secs=timeout_secs
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                job_id = job if isinstance(job, str) else job.id
+                logger.warning(f"Failed to export the results of job {job_id}: {e}")
+                return ExportJobResult(job, [], e)
+            return ExportJobResult(job, paths)
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(jobs))) as executor:
+            return list(executor.map(export, jobs))
+
     def get_job(self, job_id: str) -> Job:
         """
         Returns the job corresponding to the given id.
+
+        The details of finished jobs are cached by the workspace,
+        so getting them again does not call the service.
         
         :param job_id:
             Id of a job to fetch.
@@ -399,19 +593,53 @@ class Workspace:
         :return: Azure Quantum Job.
         :rtype: Job
         """
+        entry = self._job_details_cache.get(job_id)
+        if entry is not None:
+            details, job_cls = entry
+        else:
+            client = self._get_jobs_client()
+            details = client.get(job_id)
+            job_cls = None
+
+        if job_cls is None:
+            job_cls = self._get_job_class(details)
+            self._job_details_cache.put(details, job_cls)
+        return job_cls(self, details)
+
+    def _get_job_class(self, details: JobDetails) -> Type[Job]:
+        """
+        Resolves the job class of the target of the given job.
+        """
         # pylint: disable=import-outside-toplevel
         from azure.quantum.target.target_factory import TargetFactory
         from azure.quantum.target import Target
 
-        client = self._get_jobs_client()
-        details = client.get(job_id)
         target_factory = TargetFactory(base_cls=Target, workspace=self)
         # pylint: disable=protected-access
         target_cls = target_factory._target_cls(
             details.provider_id,
             details.target)
-        job_cls = target_cls._get_job_class()
-        return job_cls(self, details)
+        return target_cls._get_job_class()
+
+    def _refresh_job(self, job: Job) -> None:
+        """
+        Updates the job details with the latest information
+        from the workspace.
+
+        :param job:
+            The job to be refreshed.
+        """
+        validator = get_details_if_modified(
+            self._get_jobs_client(),
+            build_jobs_get_request,
+            "JobDetails",
+            job.id,
+            job.details,
+            job._details_validator,
+        )
+        job._details_validator = validator
+        job.details = validator.details
+        self._job_details_cache.put(job.details)
 
     def list_jobs(
         self,
@@ -439,6 +667,7 @@ class Workspace:
 
         result = []
         for j in jobs:
+            self._job_details_cache.put(j)
             deserialized_job = Job(self, j)
             if deserialized_job.matches_filter(name_match, status, created_after):
                 result.append(deserialized_job)
@@ -607,7 +836,16 @@ class Workspace:
         :param session:
             The session to be refreshed.
         """
-        session.details = self.get_session(session_id=session.id).details
+        validator = get_details_if_modified(
+            self._get_sessions_client(),
+            build_sessions_get_request,
+            "SessionDetails",
+            session.id,
+            session.details,
+            session._details_validator,
+        )
+        session._details_validator = validator
+        session.details = validator.details
 
     def get_session(
         self,
@@ -642,8 +880,10 @@ class Workspace:
         """
         client = self._get_sessions_client()
         job_details_list = client.jobs_list(session_id=session_id)
-        result = [Job(workspace=self, job_details=job_details)
-                  for job_details in job_details_list]
+        result = []
+        for job_details in job_details_list:
+            self._job_details_cache.put(job_details)
+            result.append(Job(workspace=self, job_details=job_details))
         return result
 
     def get_container_uri(
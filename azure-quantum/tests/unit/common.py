@@ -25,6 +25,7 @@ from azure.quantum._constants import (
     GUID_REGEX_PATTERN,
 )
 from azure.quantum import Job
+from azure.quantum.job import ExponentialBackoffPollPolicy
 from azure.quantum.target import Target
 from azure.identity import ClientSecretCredential
 
@@ -249,13 +250,13 @@ class QuantumTestBase(ReplayableTest):
         # we don't allow playback repeats
         self.cassette.allow_playback_repeats = False
 
-        # modify the _default_poll_wait time to zero
+        # modify the poll wait time to zero
         # so that we don't artificially wait or delay
         # the tests when in playback mode
         self.patch_default_poll_wait = patch.object(
             Job,
-            "_default_poll_wait",
-            0.0
+            "poll_policy",
+            ExponentialBackoffPollPolicy(initial_poll_wait=0.0)
         )
         if self.is_playback:
             self.patch_default_poll_wait.start()
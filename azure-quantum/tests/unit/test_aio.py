@@ -0,0 +1,215 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import os
+import tempfile
+import unittest
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
+
+from azure.core.pipeline.transport import AsyncHttpTransport
+from azure.identity.aio import DefaultAzureCredential
+from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
+from common import SUBSCRIPTION_ID, RESOURCE_GROUP, WORKSPACE, LOCATION, API_KEY, ZERO_UID
+from azure.quantum import JobDetails
+from azure.quantum._constants import ConnectionConstants
+from azure.quantum.aio import AsyncWorkspace, AsyncJob
+from azure.quantum.aio._client import AsyncQuantumClient
+from azure.quantum.results_store import ResultsStore
+
+
+class _MockTransport(AsyncHttpTransport):
+    """Async transport that replays the given (status code, JSON body) responses."""
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, body = self.responses.pop(0)
+        response = AsyncHttpResponseImpl(
+            request=request,
+            internal_response=None,
+            status_code=status_code,
+            headers={"Content-Type": "application/json"},
+            reason="",
+            content_type="application/json",
+            stream_download_generator=None,
+        )
+        response._content = json.dumps(body).encode() if body is not None else b""
+        response._is_closed = True
+        return response
+
+
+def _job_details_json(status):
+    return {
+        "id": ZERO_UID,
+        "name": "job",
+        "containerUri": "https://mystorage.blob.core.windows.net/job-container",
+        "inputDataFormat": "microsoft.quantum-log.v1",
+        "providerId": "microsoft",
+        "target": "microsoft.estimator",
+        "status": status,
+    }
+
+
+class TestAsyncWorkspace(unittest.IsolatedAsyncioTestCase):
+    def _workspace(self, responses):
+        transport = _MockTransport(responses)
+        connection_string = ConnectionConstants.VALID_CONNECTION_STRING(
+            subscription_id=SUBSCRIPTION_ID,
+            resource_group=RESOURCE_GROUP,
+            workspace_name=WORKSPACE,
+            api_key=API_KEY,
+            quantum_endpoint=ConnectionConstants.GET_QUANTUM_PRODUCTION_ENDPOINT(LOCATION)
+        )
+        with patch(
+            "azure.quantum.aio.workspace.AsyncQuantumClient",
+            partial(AsyncQuantumClient, transport=transport)
+        ):
+            workspace = AsyncWorkspace.from_connection_string(connection_string)
+        return workspace, transport
+
+    async def test_get_and_cancel_job(self):
+        workspace, transport = self._workspace([
+            (200, _job_details_json("Executing")),
+            (204, None),
+            (200, _job_details_json("Cancelled")),
+        ])
+        async with workspace:
+            job = await workspace.get_job(ZERO_UID)
+            self.assertIsInstance(job, AsyncJob)
+            self.assertEqual(job.details.status, "Executing")
+
+            job = await workspace.cancel_job(job)
+            self.assertEqual(job.details.status, "Cancelled")
+
+        self.assertEqual([r.method for r in transport.requests], ["GET", "DELETE", "GET"])
+        self.assertIn(f"/workspaces/{WORKSPACE}/jobs/{ZERO_UID}", transport.requests[0].url)
+        self.assertEqual(transport.requests[0].headers[ConnectionConstants.QUANTUM_API_KEY_HEADER], API_KEY)
+
+    async def test_default_credential(self):
+        workspace = AsyncWorkspace(
+            subscription_id=SUBSCRIPTION_ID,
+            resource_group=RESOURCE_GROUP,
+            name=WORKSPACE,
+            location=LOCATION,
+        )
+        # Tokens are fetched without blocking the event loop
+        self.assertIsInstance(workspace._default_credential, DefaultAzureCredential)
+        with patch.object(workspace._default_credential, "close", new_callable=AsyncMock) as close:
+            await workspace.close()
+        close.assert_awaited_once()
+
+    async def test_list_jobs(self):
+        workspace, _ = self._workspace([
+            (200, {"value": [_job_details_json("Succeeded"), _job_details_json("Waiting")]}),
+        ])
+        async with workspace:
+            jobs = await workspace.list_jobs()
+        self.assertEqual([job.details.status for job in jobs], ["Succeeded", "Waiting"])
+
+
+class TestAsyncJob(unittest.IsolatedAsyncioTestCase):
+    def _job(self, output_data_format="microsoft.quantum-results.v1", status="Waiting"):
+        details = JobDetails(
+            id=ZERO_UID,
+            name="",
+            provider_id="",
+            target="",
+            container_uri="",
+            input_data_format="",
+            output_data_format=output_data_format)
+        details.status = status
+        workspace = Mock()
+        return AsyncJob(workspace=workspace, job_details=details)
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_wait_until_completed(self, sleep):
+        job = self._job()
+        statuses = iter(["Waiting", "Executing", "Succeeded"])
+
+        async def get_job(job_id):
+            return self._job(status=next(statuses))
+
+        job.workspace.get_job = get_job
+        await job.wait_until_completed()
+
+        self.assertEqual(job.details.status, "Succeeded")
+        self.assertEqual(sleep.await_count, 2)
+
+    async def test_get_results(self):
+        job = self._job(status="Succeeded")
+        job.download_data = AsyncMock(return_value=b'{"Histogram": ["[0]", 0.50, "[1]", 0.50]}')
+
+        results = await job.get_results()
+
+        self.assertEqual(results, {"[0]": 0.50, "[1]": 0.50})
+
+    async def test_results_accessors(self):
+        job = self._job(output_data_format="microsoft.quantum-results.v2", status="Succeeded")
+        job.details.output_data_uri = "https://account.blob.core.windows.net/job/rawOutputData"
+        job.download_data = AsyncMock(return_value=json.dumps({
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [{
+                "Histogram": [
+                    {"Outcome": [0], "Display": "[0]", "Count": 1},
+                    {"Outcome": [1], "Display": "[1]", "Count": 3},
+                ],
+                "Shots": [[1], [0], [1], [1]],
+            }],
+        }).encode("utf8"))
+
+        histogram = await job.get_results_histogram(as_histogram=True)
+        self.assertEqual(histogram.total, 4)
+        self.assertEqual((await job.get_results(as_histogram=True)).probabilities().tolist(), [0.25, 0.75])
+        shots_array = await job.get_results_shots_array()
+        self.assertEqual(shots_array.unpack()[:, 0].tolist(), [1, 0, 1, 1])
+        with tempfile.TemporaryDirectory() as directory:
+            paths = await job.export_results(directory, format="npz")
+            self.assertEqual([os.path.basename(path) for path in paths], ["histogram.npz", "shots_0.npz"])
+        self.assertEqual(job.download_data.await_count, 1)
+
+        # Operations that stream the results or poll in a background thread are not supported
+        for method in (job.iter_results_shots, job.iter_results_histogram, job.get_results_shots_store, job.as_future):
+            with self.assertRaises(TypeError):
+                method()
+
+    @patch("azure.quantum.aio.job.download_blob_if_modified", new_callable=AsyncMock)
+    async def test_download_data_uses_results_store(self, download_blob_if_modified):
+        output_data_uri = "https://mystorage.blob.core.windows.net/job-0/outputData?se=2050-01-01T00%3A00%3A00Z&sig=PLACEHOLDER"
+        job = self._job()
+        with tempfile.TemporaryDirectory() as directory:
+            job.workspace.results_store = ResultsStore(directory)
+            download_blob_if_modified.return_value = (b"output", '"0x1"')
+            self.assertEqual(await job.download_data(output_data_uri), b"output")
+            self.assertIsNone(download_blob_if_modified.call_args.args[1])
+
+            # Not modified: served from the store
+            download_blob_if_modified.return_value = (None, '"0x1"')
+            self.assertEqual(await job.download_data(output_data_uri), b"output")
+            self.assertEqual(download_blob_if_modified.call_args.args[1], '"0x1"')
+
+    async def test_get_results_failed_job(self):
+        job = self._job(status="Failed")
+        with self.assertRaises(RuntimeError):
+            await job.get_results()
+
+
+if __name__ == "__main__":
+    unittest.main()
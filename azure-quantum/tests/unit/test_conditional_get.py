@@ -0,0 +1,171 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import unittest
+from functools import partial
+from unittest.mock import patch
+
+from azure.core.pipeline.transport import HttpTransport
+from azure.core.rest._http_response_impl import HttpResponseImpl
+from common import SUBSCRIPTION_ID, RESOURCE_GROUP, WORKSPACE, LOCATION, API_KEY, ZERO_UID
+from azure.quantum import Job, JobDetails, Workspace
+from azure.quantum._client import QuantumClient
+from azure.quantum._constants import ConnectionConstants
+
+
+class _MockTransport(HttpTransport):
+    """Transport that replays the given (status code, headers, JSON body) responses."""
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, headers, body = self.responses.pop(0)
+        response = HttpResponseImpl(
+            request=request,
+            internal_response=None,
+            status_code=status_code,
+            headers={"Content-Type": "application/json", **headers},
+            reason="",
+            content_type="application/json",
+            stream_download_generator=None,
+        )
+        response._content = json.dumps(body).encode() if body is not None else b""
+        response._is_closed = True
+        return response
+
+
+def _job_details_json(status, sig="sig1"):
+    return {
+        "id": ZERO_UID,
+        "name": "job",
+        "containerUri": f"https://mystorage.blob.core.windows.net/job-container?sv=2&se=2050-01-01&sig={sig}",
+        "inputDataFormat": "microsoft.quantum-log.v1",
+        "providerId": "microsoft",
+        "target": "microsoft.estimator",
+        "status": status,
+    }
+
+
+class TestConditionalGet(unittest.TestCase):
+    def _workspace(self, responses):
+        transport = _MockTransport(responses)
+        connection_string = ConnectionConstants.VALID_CONNECTION_STRING(
+            subscription_id=SUBSCRIPTION_ID,
+            resource_group=RESOURCE_GROUP,
+            workspace_name=WORKSPACE,
+            api_key=API_KEY,
+            quantum_endpoint=ConnectionConstants.GET_QUANTUM_PRODUCTION_ENDPOINT(LOCATION)
+        )
+        with patch(
+            "azure.quantum.workspace.QuantumClient",
+            partial(QuantumClient, transport=transport)
+        ):
+            workspace = Workspace.from_connection_string(connection_string)
+        return workspace, transport
+
+    def _job(self, workspace):
+        return Job(workspace, JobDetails(
+            id=ZERO_UID,
+            name="job",
+            provider_id="microsoft",
+            target="microsoft.estimator",
+            container_uri="",
+            input_data_format=""))
+
+    def test_refresh_with_etag(self):
+        workspace, transport = self._workspace([
+            (200, {"ETag": '"1"'}, _job_details_json("Executing")),
+            (304, {}, None),
+            (200, {"ETag": '"2"'}, _job_details_json("Succeeded")),
+        ])
+        job = self._job(workspace)
+
+        job.refresh()
+        details = job.details
+        self.assertEqual(details.status, "Executing")
+        self.assertNotIn("If-None-Match", transport.requests[0].headers)
+
+        job.refresh()
+        self.assertIs(job.details, details)
+        self.assertEqual(transport.requests[1].headers["If-None-Match"], '"1"')
+
+        job.refresh()
+        self.assertEqual(job.details.status, "Succeeded")
+        self.assertEqual(transport.requests[2].headers["If-None-Match"], '"1"')
+
+    def test_refresh_with_body_hash(self):
+        workspace, transport = self._workspace([
+            (200, {}, _job_details_json("Executing")),
+            (200, {}, _job_details_json("Executing", sig="sig2")),
+            (200, {}, _job_details_json("Succeeded")),
+        ])
+        job = self._job(workspace)
+
+        job.refresh()
+        details = job.details
+
+        deserializer_cls = type(workspace._client.jobs._deserialize)
+        with patch.object(deserializer_cls, "__call__") as deserialize:
+            job.refresh()
+            deserialize.assert_not_called()
+        self.assertIs(job.details, details)
+        self.assertNotIn("If-None-Match", transport.requests[1].headers)
+
+        job.refresh()
+        self.assertIsNot(job.details, details)
+        self.assertEqual(job.details.status, "Succeeded")
+
+    def test_replaced_details_are_refreshed(self):
+        workspace, _ = self._workspace([
+            (200, {}, _job_details_json("Executing")),
+            (200, {}, _job_details_json("Executing")),
+        ])
+        job = self._job(workspace)
+
+        job.refresh()
+        job.details = JobDetails(
+            id=ZERO_UID, name="job", provider_id="microsoft", target="microsoft.estimator",
+            container_uri="", input_data_format="", status="Waiting")
+
+        job.refresh()
+        self.assertEqual(job.details.status, "Executing")
+
+    def test_refresh_session(self):
+        session_json = {
+            "id": "session", "name": "session", "providerId": "microsoft",
+            "target": "microsoft.estimator", "status": "Executing",
+            "jobFailurePolicy": "Abort", "itemType": "Session",
+        }
+        workspace, _ = self._workspace([
+            (200, {}, session_json),
+            (200, {}, session_json),
+            (200, {}, session_json),
+        ])
+        session = workspace.get_session("session")
+        workspace.refresh_session(session)
+        details = session.details
+
+        workspace.refresh_session(session)
+        self.assertIs(session.details, details)
+        self.assertEqual(session.details.status, "Executing")
+
+
+if __name__ == "__main__":
+    unittest.main()
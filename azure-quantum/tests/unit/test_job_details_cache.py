@@ -0,0 +1,125 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import unittest
+from unittest.mock import Mock, patch
+
+from common import SUBSCRIPTION_ID, RESOURCE_GROUP, WORKSPACE, LOCATION, API_KEY
+from azure.quantum import Job, JobDetails, Workspace
+from azure.quantum._constants import ConnectionConstants
+from azure.quantum._job_details_cache import JobDetailsCache
+from azure.quantum.target.microsoft.elements.dft import MicrosoftElementsDftJob
+
+
+def _job_details(job_id, status):
+    details = JobDetails(
+        id=job_id,
+        name=job_id,
+        provider_id="microsoft-elements",
+        target="microsoft.dft",
+        container_uri="",
+        input_data_format="")
+    details.status = status
+    return details
+
+
+class TestJobDetailsCache(unittest.TestCase):
+    def _workspace(self, **kwargs):
+        connection_string = ConnectionConstants.VALID_CONNECTION_STRING(
+            subscription_id=SUBSCRIPTION_ID,
+            resource_group=RESOURCE_GROUP,
+            workspace_name=WORKSPACE,
+            api_key=API_KEY,
+            quantum_endpoint=ConnectionConstants.GET_QUANTUM_PRODUCTION_ENDPOINT(LOCATION)
+        )
+        workspace = Workspace.from_connection_string(connection_string, **kwargs)
+        client = Mock()
+        workspace._get_jobs_client = Mock(return_value=client)
+        workspace._get_sessions_client = Mock(return_value=client)
+        return workspace, client
+
+    def test_lru_eviction(self):
+        cache = JobDetailsCache(max_size=2)
+        for job_id in ["a", "b"]:
+            cache.put(_job_details(job_id, "Succeeded"))
+        cache.get("a")
+        cache.put(_job_details("c", "Failed"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(len(cache), 2)
+
+    def test_only_terminal_jobs_are_cached(self):
+        cache = JobDetailsCache(max_size=10)
+        for status in ["Waiting", "Executing"]:
+            cache.put(_job_details(status, status))
+        self.assertEqual(len(cache), 0)
+
+    def test_get_job_finished(self):
+        workspace, client = self._workspace()
+        client.get = Mock(return_value=_job_details("a", "Succeeded"))
+
+        with patch.object(workspace, "_get_job_class", wraps=workspace._get_job_class) as get_job_class:
+            job1 = workspace.get_job("a")
+            job2 = workspace.get_job("a")
+
+        client.get.assert_called_once_with("a")
+        get_job_class.assert_called_once()
+        self.assertIsInstance(job2, MicrosoftElementsDftJob)
+        self.assertIsNot(job1.details, job2.details)
+        self.assertEqual(job1.details.as_dict(), job2.details.as_dict())
+
+    def test_get_job_copies_details(self):
+        workspace, client = self._workspace()
+        details = _job_details("a", "Succeeded")
+        details.metadata = {"qiskit": "True", "metadata": "{}"}
+        client.get = Mock(return_value=details)
+
+        # Jobs may modify their details, e.g. when formatting their results
+        job1 = workspace.get_job("a")
+        del job1.details.metadata["qiskit"]
+        job1.details.metadata["metadata"] = {}
+        job2 = workspace.get_job("a")
+        job2.details.status = "Failed"
+
+        self.assertEqual(job2.details.metadata, {"qiskit": "True", "metadata": "{}"})
+        self.assertEqual(workspace.get_job("a").details.status, "Succeeded")
+
+    def test_get_job_running(self):
+        workspace, client = self._workspace()
+        client.get = Mock(return_value=_job_details("a", "Executing"))
+
+        workspace.get_job("a")
+        workspace.get_job("a")
+
+        self.assertEqual(client.get.call_count, 2)
+
+    def test_list_jobs_fills_cache(self):
+        workspace, client = self._workspace()
+        client.list = Mock(return_value=[_job_details("a", "Failed"), _job_details("b", "Waiting")])
+        client.jobs_list = Mock(return_value=[_job_details("a", "Failed")])
+        client.get = Mock(return_value=_job_details("b", "Waiting"))
+
+        jobs = workspace.list_jobs()
+        session_jobs = workspace.list_session_jobs("session")
+        self.assertEqual(session_jobs[0].details.as_dict(), jobs[0].details.as_dict())
+
+        self.assertEqual(workspace.get_job("a").details.status, "Failed")
+        self.assertEqual(workspace.get_job("b").details.status, "Waiting")
+        client.get.assert_called_once_with("b")
+
+    def test_disabled_cache(self):
+        workspace, client = self._workspace(job_details_cache_size=0)
+        client.get = Mock(return_value=_job_details("a", "Succeeded"))
+
+        workspace.get_job("a")
+        workspace.get_job("a")
+
+        self.assertEqual(client.get.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import concurrent.futures
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from azure.core.exceptions import ResourceNotFoundError, ServiceRequestError
+from azure.core.paging import ItemPaged
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.job import ExponentialBackoffPollPolicy, JobFuture
+
+
+def _job_details(job_id, status):
+    details = JobDetails(
+        id=job_id,
+        name=job_id,
+        provider_id="microsoft",
+        target="microsoft.estimator",
+        container_uri="",
+        input_data_format="",
+        output_data_format="")
+    details.status = status
+    return details
+
+
+@patch.object(Job, "poll_policy", ExponentialBackoffPollPolicy(initial_poll_wait=0.01))
+class TestJobFuture(unittest.TestCase):
+    """TestJobFuture
+
+    Tests the azure.quantum.job.job_future module.
+    """
+
+    def _mock_workspace(self, statuses):
+        """Returns a workspace whose jobs list reports the given statuses,
+        one list of (job_id, status) tuples per call. The last listing
+        is repeated once all of them have been returned."""
+        listings = list(statuses)
+
+        def list_jobs(*args, **kwargs):
+            listing = listings.pop(0) if len(listings) > 1 else listings[0]
+            return ItemPaged(
+                lambda continuation_token: [_job_details(job_id, status) for job_id, status in listing],
+                lambda page: (None, iter(page)),
+            )
+
+        workspace = Mock()
+        client = Mock()
+        client.list = Mock(side_effect=list_jobs)
+        workspace._get_jobs_client = Mock(return_value=client)
+        return workspace
+
+    def test_as_completed(self):
+        workspace = self._mock_workspace([
+            [("job1", "Executing"), ("job2", "Waiting")],
+            [("job1", "Executing"), ("job2", "Succeeded")],
+            [("job1", "Failed"), ("job2", "Succeeded")],
+        ])
+        jobs = [Job(workspace, _job_details(job_id, "Waiting")) for job_id in ("job1", "job2")]
+
+        futures = [job.as_future() for job in jobs]
+        self.assertTrue(all(isinstance(f, JobFuture) for f in futures))
+
+        completed = [f.result() for f in concurrent.futures.as_completed(futures, timeout=10)]
+
+        self.assertEqual([job.id for job in completed], ["job2", "job1"])
+        self.assertEqual(jobs[0].details.status, "Failed")
+        self.assertEqual(jobs[1].details.status, "Succeeded")
+
+    def test_completed_job(self):
+        workspace = self._mock_workspace([[]])
+        job = Job(workspace, _job_details("job1", "Succeeded"))
+
+        future = job.as_future()
+
+        self.assertTrue(future.done())
+        self.assertIs(future.result(), job)
+        workspace._get_jobs_client.assert_not_called()
+
+    def test_result_factory_and_callback(self):
+        workspace = self._mock_workspace([
+            [("job1", "Executing")],
+            [("job1", "Succeeded")],
+        ])
+        job = Job(workspace, _job_details("job1", "Waiting"))
+        callback = Mock()
+
+        future = job.as_future(result_factory=lambda j: j.details.status)
+        future.add_done_callback(callback)
+        done, _ = concurrent.futures.wait([future], timeout=10)
+
+        self.assertEqual(done, {future})
+        self.assertEqual(future.result(), "Succeeded")
+        callback.assert_called_once_with(future)
+
+    def test_slow_result_factory(self):
+        workspace = self._mock_workspace([[("job1", "Succeeded"), ("job2", "Executing")], [("job2", "Succeeded")]])
+        job1, job2 = [Job(workspace, _job_details(job_id, "Waiting")) for job_id in ("job1", "job2")]
+        release = threading.Event()
+
+        def result_factory(job):
+            release.wait(10)
+            return job.id
+
+        # The factory of job1 does not hold up the completion of job2
+        future1 = job1.as_future(result_factory=result_factory)
+        future2 = job2.as_future()
+        self.assertIs(future2.result(timeout=10), job2)
+        self.assertFalse(future1.done())
+
+        release.set()
+        self.assertEqual(future1.result(timeout=10), "job1")
+
+    def test_result_factory_error(self):
+        workspace = self._mock_workspace([[("job1", "Succeeded")]])
+        job = Job(workspace, _job_details("job1", "Waiting"))
+
+        def result_factory(job):
+            raise ValueError("no results")
+
+        future = job.as_future(result_factory=result_factory)
+
+        with self.assertRaises(ValueError):
+            future.result(timeout=10)
+
+    def test_refresh_error(self):
+        workspace = self._mock_workspace([[("a", "Succeeded")]])
+        not_found = ResourceNotFoundError(response=Mock(status_code=404, reason="Not Found"))
+        workspace._refresh_job = Mock(side_effect=[ServiceRequestError("timeout"), not_found])
+        job_a, job_b = [Job(workspace, _job_details(job_id, "Waiting")) for job_id in ("a", "b")]
+
+        future_a, future_b = job_a.as_future(), job_b.as_future()
+
+        self.assertIs(future_a.result(timeout=10), job_a)
+        with self.assertRaises(ResourceNotFoundError):
+            future_b.result(timeout=10)
+        self.assertEqual(workspace._refresh_job.call_count, 2)
+
+    def test_cancel(self):
+        workspace = self._mock_workspace([[("job1", "Executing")]])
+        job = Job(workspace, _job_details("job1", "Waiting"))
+
+        future = job.as_future()
+
+        self.assertTrue(future.cancel())
+        self.assertTrue(future.cancelled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,13 @@
 # Licensed under the MIT License.
 ##
 
+import json
+import os
 import re
+import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+import numpy as np
 import pytest
 from common import QuantumTestBase, RegexScrubbingPatterns
 from azure.quantum import Job, JobDetails
@@ -257,6 +261,257 @@ class TestJobResults(QuantumTestBase):
         except:
             self.assertTrue(True)
 
+    def test_job_results_share_output_data(self):
+        payload = b'{"DataFormat": "microsoft.quantum-results.v2", "Results": [{"Histogram": [{"Outcome": [0], "Display": "[0]", "Count": 1}, {"Outcome": [1], "Display": "[1]", "Count": 1}], "Shots": [[0], [1]]}]}'
+        job = self._mock_job("microsoft.quantum-results.v2", "")
+        job.details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData"
+        job.download_data = Mock(return_value=payload)
+
+        with patch("json.loads", wraps=json.loads) as loads:
+            self.assertEqual(job.get_results(), {"[0]": 0.5, "[1]": 0.5})
+            self.assertEqual(list(job.get_results_histogram()), ["[0]", "[1]"])
+            self.assertEqual(job.get_results_shots(), [[0], [1]])
+        job.download_data.assert_called_once()
+        loads.assert_called_once()
+
+        # A different output data URI invalidates the cached output
+        job.details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData2"
+        job.get_results_shots()
+        self.assertEqual(job.download_data.call_count, 2)
+
+    def test_job_results_are_not_shared(self):
+        job = self._mock_job("ionq.quantum-results.v1", "")
+        job.details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData"
+        job.download_data = Mock(return_value=b'{"histogram": {"0": 0.5, "3": 0.5}}')
+
+        # Callers may modify the results they get
+        job.get_results()["histogram"].clear()
+        self.assertEqual(job.get_results(), {"histogram": {"0": 0.5, "3": 0.5}})
+        job.download_data.assert_called_once()
+
+        payload = b'{"DataFormat": "microsoft.quantum-results.v2", "Results": [{"Histogram": [{"Outcome": [0], "Display": "[0]", "Count": 1}], "Shots": [[0]]}]}'
+        job = self._mock_job("microsoft.quantum-results.v2", "")
+        job.details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData"
+        job.download_data = Mock(return_value=payload)
+        job.get_results_shots()[0].append(1)
+        job.get_results_histogram()["[0]"]["outcome"].append(1)
+        self.assertEqual(job.get_results_shots(), [[0]])
+        self.assertEqual(job.get_results_histogram()["[0]"]["outcome"], [0])
+
+    def test_job_results_shots_array(self):
+        output = json.dumps({
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [
+                {"Histogram": [], "Shots": [{"Item1": [1, 0], "Item2": 1}, {"Item1": [0, 1], "Item2": 0}]},
+                {"Histogram": [], "Shots": [[1], [0], [1]]},
+            ],
+        }).encode("utf8")
+        job = self._mock_job("microsoft.quantum-results.v2", "")
+        job.download_data = Mock(return_value=output)
+
+        shots_arrays = job.get_results_shots_array()
+        self.assertEqual(len(shots_arrays), 2)
+        self.assertEqual(shots_arrays[0].layout, (2, None))
+        self.assertEqual(shots_arrays[0].unpack().tolist(), [[1, 0, 1], [0, 1, 0]])
+        self.assertEqual(shots_arrays[1].layout, 1)
+        self.assertEqual(shots_arrays[1].unpack().tolist(), [[1], [0], [1]])
+
+        job = self._mock_job("microsoft.quantum-results.v1", "{\"Histogram\": [\"[0]\", 1.0]}")
+        with self.assertRaises(ValueError):
+            job.get_results_shots_array()
+
+    def test_job_export_results(self):
+        output = json.dumps({
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [
+                {
+                    "Histogram": [
+                        {"Outcome": {"Item1": [1, 0], "Item2": 1}, "Display": "([1, 0], 1)", "Count": 2},
+                        {"Outcome": {"Item1": [0, 1], "Item2": 0}, "Display": "([0, 1], 0)", "Count": 1},
+                    ],
+                    "Shots": [{"Item1": [1, 0], "Item2": 1}, {"Item1": [0, 1], "Item2": 0}, {"Item1": [1, 0], "Item2": 1}],
+                },
+                {"Histogram": [{"Outcome": [1], "Display": "[1]", "Count": 1}], "Shots": [[1]]},
+            ],
+        }).encode("utf8")
+        job = self._mock_job("microsoft.quantum-results.v2", "")
+        job.details.id = "job-0"
+        job.details.input_params = {"items": [{"entryPoint": "main"}, {"entryPoint": "other"}]}
+        job.download_data = Mock(return_value=output)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = job.export_results(directory, format="npz")
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                ["histogram.npz", "shots_0.npz", "shots_1.npz"])
+
+            with np.load(paths[0]) as histogram:
+                self.assertEqual(histogram["job_id"].tolist(), ["job-0"] * 3)
+                self.assertEqual(histogram["entry_point"].tolist(), ["main", "main", "other"])
+                self.assertEqual(histogram["result_index"].tolist(), [0, 0, 1])
+                self.assertEqual(histogram["outcome"].tolist(), ["([1, 0], 1)", "([0, 1], 0)", "[1]"])
+                self.assertEqual(histogram["count"].tolist(), [2, 1, 1])
+                np.testing.assert_allclose(histogram["probability"], [2 / 3, 1 / 3, 1])
+
+            with np.load(paths[1]) as shots:
+                self.assertEqual(shots["shot"].tolist(), [0, 1, 2])
+                self.assertEqual(shots["register_0"].tolist(), [[1, 0], [0, 1], [1, 0]])
+                self.assertEqual(shots["register_1"].tolist(), [1, 0, 1])
+                self.assertEqual(str(shots["layout"]), "(2, None)")
+
+            job = self._mock_job("microsoft.quantum-results.v1", "")
+            job.download_data = Mock(return_value=b"{\"Histogram\": [\"[0]\", 0.25, \"[1]\", 0.75]}")
+            paths = job.export_results(os.path.join(directory, "v1"), format="npz")
+            with np.load(paths[0]) as histogram:
+                self.assertEqual(histogram["outcome"].tolist(), ["[0]", "[1]"])
+                self.assertEqual(histogram["probability"].tolist(), [0.25, 0.75])
+
+        with self.assertRaises(ValueError):
+            job.export_results("results", format="csv")
+
+    def test_job_export_results_int_shots(self):
+        output = json.dumps({
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [
+                {
+                    "Histogram": [
+                        {"Outcome": 3, "Display": "3", "Count": 2},
+                        {"Outcome": 5, "Display": "5", "Count": 1},
+                    ],
+                    "Shots": [3, 5, 3],
+                },
+                {
+                    "Histogram": [{"Outcome": {"Item1": [1], "Item2": 2.5}, "Display": "([1], 2.5)", "Count": 1}],
+                    "Shots": [{"Item1": [1], "Item2": 2.5}],
+                },
+                {"Histogram": [{"Outcome": [1], "Display": "[1]", "Count": 1}], "Shots": [[1]]},
+            ],
+        }).encode("utf8")
+        job = self._mock_job("microsoft.quantum-results.v2", "")
+        job.download_data = Mock(return_value=output)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = job.export_results(directory, format="npz")
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                ["histogram.npz", "shots_0.npz", "shots_1.npz", "shots_2.npz"])
+
+            with np.load(paths[0]) as histogram:
+                self.assertEqual(histogram["outcome"].tolist(), ["3", "5", "([1], 2.5)", "[1]"])
+                self.assertEqual(histogram["count"].tolist(), [2, 1, 1, 1])
+
+            # Shots of values other than bits are exported as outcomes
+            with np.load(paths[1]) as shots:
+                self.assertEqual(shots["outcome"].tolist(), ["3", "5", "3"])
+                self.assertEqual(str(shots["layout"]), "")
+            with np.load(paths[2]) as shots:
+                self.assertEqual(shots["outcome"].tolist(), ["([1], 2.5)"])
+            with np.load(paths[3]) as shots:
+                self.assertEqual(shots["register_0"].tolist(), [1])
+
+    def test_job_iter_results_shots(self):
+        payload = json.dumps({
+            "Results": [
+                {"Shots": [[0, 0], [1, 1]], "Histogram": []},
+                {
+                    "Histogram": [
+                        {"Outcome": {"Item1": [1], "Item2": 2.5}, "Display": "([1], 2.5) \u00e9", "Count": 2},
+                        {"Outcome": [0], "Display": "[0]", "Count": 1},
+                    ],
+                    "Shots": [{"Item1": [1], "Item2": 2.5}, [0], {"Item1": [1], "Item2": 2.5}],
+                },
+            ],
+            "DataFormat": "microsoft.quantum-results.v2",
+        }, ensure_ascii=False).encode("utf8")
+        job = self._mock_job("microsoft.quantum-results.v2", "")
+        job.details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData"
+        job._get_blob_uri_with_sas_token = Mock(side_effect=lambda uri: uri)
+
+        # Chunks split values, numbers and UTF-8 sequences
+        chunks = lambda *_: (payload[i:i + 3] for i in range(0, len(payload), 3))
+        with patch("azure.quantum.job.job.download_blob_chunks", side_effect=chunks) as download_blob_chunks:
+            self.assertEqual(list(job.iter_results_shots()), [[0, 0], [1, 1]])
+            self.assertEqual(
+                list(job.iter_results_shots(result_index=1)),
+                [([1], 2.5), [0], ([1], 2.5)])
+            self.assertEqual(
+                list(job.iter_results_shots(result_index=1, block_size=2)),
+                [[([1], 2.5), [0]], [([1], 2.5)]])
+            # Invalid arguments are rejected before the iteration starts
+            with self.assertRaises(ValueError):
+                job.iter_results_shots(block_size=0)
+            self.assertEqual(
+                dict(job.iter_results_histogram(result_index=1)),
+                {
+                    "([1], 2.5) \u00e9": {"outcome": ([1], 2.5), "count": 2},
+                    "[0]": {"outcome": [0], "count": 1},
+                })
+            with self.assertRaises(ValueError):
+                list(job.iter_results_shots(result_index=2))
+        self.assertEqual(download_blob_chunks.call_count, 5)
+
+        # Downloaded output data is not downloaded again
+        job.download_data = Mock(return_value=payload)
+        self.assertEqual(job.get_results_shots()[0], [[0, 0], [1, 1]])
+        with patch("azure.quantum.job.job.download_blob_chunks") as download_blob_chunks:
+            self.assertEqual(list(job.iter_results_shots()), [[0, 0], [1, 1]])
+        download_blob_chunks.assert_not_called()
+
+    def test_job_iter_results_shots_malformed_output_raises_exception(self):
+        job = self._mock_job("microsoft.quantum-results.v2", "")
+        job.details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData"
+        job._get_blob_uri_with_sas_token = Mock(side_effect=lambda uri: uri)
+
+        for payload in [
+            b'{"DataFormat": "microsoft.quantum-results.v1", "Results": [{"Shots": [[0]]}]}',
+            b'{"Results": [{"Shots": [[0]]}]}',
+            b'{"DataFormat": "microsoft.quantum-results.v2", "Results": [{"Histogram": []}]}',
+            b'{"DataFormat": "microsoft.quantum-results.v2", "Results": [{"Shots": [[0], [1}]}',
+        ]:
+            with patch("azure.quantum.job.job.download_blob_chunks", return_value=[payload]):
+                with self.assertRaises(ValueError):
+                    list(job.iter_results_shots())
+
+        job = self._mock_job("microsoft.quantum-results.v1", "")
+        with self.assertRaises(ValueError):
+            list(job.iter_results_shots())
+
+    @patch("time.sleep")
+    def test_job_prefetch_results(self, _):
+        output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData?se=2050-01-01T00%3A00%3A00Z&sig=PLACEHOLDER"
+        job = self._mock_job("microsoft.quantum-results.v1", "")
+        job.details.status = "Executing"
+        # Use the actual polling of the job
+        del job.has_completed
+        del job.wait_until_completed
+        statuses = iter(["Executing", "Finishing", "Succeeded"])
+
+        def refresh_job(job):
+            job.details.status = next(statuses)
+            job.details.output_data_uri = output_data_uri
+        job._workspace = Mock()
+        job._workspace._refresh_job = Mock(side_effect=refresh_job)
+        job.download_data = Mock(return_value=b"{\"Histogram\": [\"[0]\", 0.50, \"[1]\", 0.50]}")
+
+        job.wait_until_completed(print_progress=False, prefetch_results=True)
+        job._prefetch_data.result()
+        job.download_data.assert_called_once_with(output_data_uri)
+
+        self.assertEqual(job.get_results(), {"[0]": 0.50, "[1]": 0.50})
+        job.download_data.assert_called_once()
+
+    def test_job_prefetch_results_failure_falls_back_to_download(self):
+        job = self._mock_job("microsoft.quantum-results.v1", "{\"Histogram\": [\"[0]\", 1.0]}")
+        job.details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData"
+        job._workspace = Mock()
+        job._workspace._get_linked_storage_sas_uri = Mock(side_effect=ValueError("No SAS"))
+
+        job.prefetch_results = True
+        job._prefetch_output()
+
+        self.assertEqual(job.get_results(), {"[0]": 1.0})
+        job.download_data.assert_called_once_with(job.details.output_data_uri)
+
     def _get_job_results(self, output_data_format, results_as_json_str):
         job = self._mock_job(output_data_format, results_as_json_str)
         
@@ -0,0 +1,207 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import itertools
+import unittest
+from unittest.mock import Mock, patch
+
+from azure.core.exceptions import ResourceNotFoundError, ServiceRequestError
+from azure.core.paging import ItemPaged
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.job import ExponentialBackoffPollPolicy, JobWatcher
+
+
+def _job_details(job_id, status):
+    details = JobDetails(
+        id=job_id,
+        name=job_id,
+        provider_id="microsoft",
+        target="microsoft.estimator",
+        container_uri="",
+        input_data_format="",
+        output_data_format="")
+    details.status = status
+    return details
+
+
+def _job_list(details, page_size=2):
+    """Returns a paged jobs list of the given job details."""
+    details = iter(details)
+
+    def get_next(continuation_token):
+        return list(itertools.islice(details, page_size))
+
+    def extract_data(page):
+        return ("next" if len(page) == page_size else None), iter(page)
+
+    return ItemPaged(get_next, extract_data)
+
+
+class TestJobWatcher(unittest.TestCase):
+    """TestJobWatcher
+
+    Tests the azure.quantum.job.job_watcher module.
+    """
+
+    def _mock_workspace(self, statuses):
+        """Returns a workspace whose jobs list reports the given statuses,
+        one list of (job_id, status) tuples per call."""
+        workspace = Mock()
+        client = Mock()
+        client.list = Mock(side_effect=[
+            _job_list(_job_details(job_id, status) for job_id, status in listing)
+            for listing in statuses
+        ])
+        workspace._get_jobs_client = Mock(return_value=client)
+        return workspace, client
+
+    def _jobs(self, workspace, job_ids):
+        return [Job(workspace, _job_details(job_id, "Waiting")) for job_id in job_ids]
+
+    def test_refresh_updates_details_in_place(self):
+        workspace, client = self._mock_workspace([
+            [("a", "Succeeded"), ("b", "Executing"), ("other", "Waiting")],
+        ])
+        job_a, job_b = self._jobs(workspace, ["a", "b"])
+        watcher = JobWatcher(workspace, [job_a, job_b])
+
+        completed = watcher.refresh()
+
+        self.assertEqual(completed, [job_a])
+        self.assertEqual(job_a.details.status, "Succeeded")
+        self.assertEqual(job_b.details.status, "Executing")
+        self.assertEqual(watcher.pending, [job_b])
+        self.assertEqual(client.list.call_count, 1)
+        workspace._refresh_job.assert_not_called()
+
+    def test_refresh_falls_back_to_get_for_unlisted_jobs(self):
+        workspace, _ = self._mock_workspace([[("a", "Executing")]])
+        def refresh_job(job):
+            job.details = _job_details(job.id, "Failed")
+        workspace._refresh_job = Mock(side_effect=refresh_job)
+        job_a, job_b = self._jobs(workspace, ["a", "b"])
+        watcher = JobWatcher(workspace, [job_a, job_b])
+
+        completed = watcher.refresh()
+
+        self.assertEqual(completed, [job_b])
+        workspace._refresh_job.assert_called_once_with(job_b)
+
+    def test_refresh_reads_max_list_pages(self):
+        listed = []
+        def list_jobs():
+            for i in range(10):
+                listed.append(i)
+                yield _job_details(f"other{i}", "Waiting")
+            yield _job_details("a", "Waiting")
+
+        workspace, client = self._mock_workspace([])
+        client.list.side_effect = lambda: _job_list(list_jobs())
+        def refresh_job(job):
+            job.details = _job_details(job.id, "Succeeded")
+        workspace._refresh_job = Mock(side_effect=refresh_job)
+        job_a, = self._jobs(workspace, ["a"])
+        watcher = JobWatcher(workspace, [job_a], max_list_pages=2)
+
+        # Jobs not found in the first pages are refreshed individually
+        self.assertEqual(watcher.refresh(), [job_a])
+        self.assertEqual(len(listed), 4)
+        workspace._refresh_job.assert_called_once_with(job_a)
+
+    def test_refresh_error_of_one_job(self):
+        workspace, _ = self._mock_workspace([[("a", "Succeeded")], [], []])
+        not_found = ResourceNotFoundError(response=Mock(status_code=404, reason="Not Found"))
+        workspace._refresh_job = Mock(side_effect=[ServiceRequestError("timeout"), not_found])
+        job_a, job_b = self._jobs(workspace, ["a", "b"])
+        watcher = JobWatcher(workspace, [job_a, job_b])
+
+        # Retryable errors keep the job tracked
+        self.assertEqual(watcher.refresh(), [job_a])
+        self.assertEqual(watcher.pending, [job_b])
+        self.assertEqual(watcher.pop_failures(), [])
+
+        # Other errors stop tracking the job
+        self.assertEqual(watcher.refresh(), [])
+        self.assertEqual(watcher.pop_failures(), [(job_b, not_found)])
+        self.assertEqual(watcher.jobs, [job_a])
+        self.assertEqual(watcher.pop_failures(), [])
+        self.assertEqual(watcher.refresh(), [])
+
+    def test_refresh_list_error(self):
+        def list_jobs():
+            yield _job_details("a", "Succeeded")
+            raise ServiceRequestError("connection reset")
+
+        workspace, client = self._mock_workspace([[("b", "Executing")]])
+        job_a, job_b = self._jobs(workspace, ["a", "b"])
+        watcher = JobWatcher(workspace, [job_a, job_b])
+        client.list.side_effect = [_job_list(list_jobs(), page_size=1), _job_list([_job_details("b", "Executing")])]
+
+        with self.assertRaises(ServiceRequestError):
+            watcher.refresh()
+        # Jobs refreshed before the error are returned as completed afterwards
+        self.assertEqual(watcher.refresh(), [job_a])
+
+    @patch("time.sleep")
+    def test_as_completed_raises_refresh_errors(self, _):
+        workspace, _ = self._mock_workspace([[("a", "Succeeded")]])
+        not_found = ResourceNotFoundError(response=Mock(status_code=404, reason="Not Found"))
+        workspace._refresh_job = Mock(side_effect=not_found)
+        job_a, job_b = self._jobs(workspace, ["a", "b"])
+        watcher = JobWatcher(workspace, [job_a, job_b])
+
+        completed = watcher.as_completed()
+        self.assertIs(next(completed), job_a)
+        with self.assertRaises(ResourceNotFoundError):
+            next(completed)
+
+    @patch("time.sleep")
+    def test_as_completed_yields_jobs_in_completion_order(self, _):
+        workspace, client = self._mock_workspace([
+            [("a", "Executing"), ("b", "Succeeded")],
+            [("a", "Cancelled")],
+        ])
+        job_a, job_b = self._jobs(workspace, ["a", "b"])
+        watcher = JobWatcher(workspace, [job_a, job_b])
+
+        self.assertEqual(list(watcher.as_completed()), [job_b, job_a])
+        self.assertEqual(client.list.call_count, 2)
+        self.assertEqual(watcher.pending, [])
+
+    @patch("time.sleep")
+    def test_wait_any_and_wait_all(self, _):
+        workspace, _ = self._mock_workspace([
+            [("a", "Executing"), ("b", "Succeeded")],
+            [("a", "Succeeded")],
+        ])
+        job_a, job_b = self._jobs(workspace, ["a", "b"])
+        watcher = JobWatcher(workspace, [job_a, job_b])
+
+        self.assertEqual(watcher.wait_any(print_progress=False), job_b)
+        self.assertEqual(watcher.wait_all(print_progress=False), [job_a, job_b])
+        self.assertTrue(job_a.has_completed())
+
+    @patch("time.sleep")
+    def test_poll_policy(self, sleep):
+        workspace, _ = self._mock_workspace([[("a", "Executing")]] * 3 + [[("a", "Succeeded")]])
+        policy = ExponentialBackoffPollPolicy(initial_poll_wait=1, backoff_factor=2, max_poll_wait_secs=2)
+        watcher = JobWatcher(workspace, self._jobs(workspace, ["a"]), poll_policy=policy)
+
+        self.assertIs(watcher.poll_policy, policy)
+        watcher.wait_all(print_progress=False)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1, 2, 2])
+
+    @patch("time.sleep")
+    def test_wait_all_timeout(self, _):
+        workspace, _ = self._mock_workspace([[("a", "Executing")]])
+        watcher = JobWatcher(workspace, self._jobs(workspace, ["a"]))
+
+        with self.assertRaises(TimeoutError):
+            watcher.wait_all(timeout_secs=0, print_progress=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import itertools
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.job import AdaptivePollPolicy, ExponentialBackoffPollPolicy, PollPolicy
+
+
+def _job(status, average_queue_time=None, creation_time=None):
+    details = JobDetails(
+        id="job",
+        name="job",
+        provider_id="quantinuum",
+        target="quantinuum.qpu.h1-1",
+        container_uri="",
+        input_data_format="",
+        output_data_format="")
+    details.status = status
+    details.creation_time = creation_time
+    job = Job(Mock(), details)
+    job._average_queue_time = average_queue_time
+    return job
+
+
+class TestPollPolicy(unittest.TestCase):
+    """TestPollPolicy
+
+    Tests the azure.quantum.job.poll_policy module.
+    """
+
+    def test_exponential_backoff(self):
+        policy = ExponentialBackoffPollPolicy()
+        waits = list(itertools.islice(policy.poll_waits(_job("Executing"), 1), 6))
+        for wait, expected in zip(waits, [0.2, 0.3, 0.45, 0.675, 1.0125, 1]):
+            self.assertAlmostEqual(wait, expected)
+
+    def test_poll_policy_is_abstract(self):
+        with self.assertRaises(TypeError):
+            PollPolicy()
+
+    def test_adaptive_several_jobs(self):
+        # Jobs refreshed together follow the exponential backoff, with jitter
+        policy = AdaptivePollPolicy(jitter=0.5, seed=1)
+        waits = list(itertools.islice(policy.poll_waits(None, 1), 6))
+        for wait, backoff in zip(waits, [0.2, 0.3, 0.45, 0.675, 1, 1]):
+            self.assertLessEqual(wait, backoff)
+            self.assertGreaterEqual(wait, backoff / 2)
+
+    def test_adaptive_without_queue_time(self):
+        policy = AdaptivePollPolicy(jitter=0)
+        waits = list(itertools.islice(policy.poll_waits(_job("Waiting")), 20))
+        self.assertEqual(waits[0], 0.2)
+        self.assertEqual(waits[-1], 30)
+
+    def test_adaptive_queued_job(self):
+        policy = AdaptivePollPolicy(jitter=0)
+        now = datetime.now(timezone.utc)
+        job = _job("Waiting", average_queue_time=3600, creation_time=now - timedelta(seconds=600))
+
+        waits = policy.poll_waits(job)
+        # Half of the remaining queue time, capped
+        self.assertEqual(next(waits), 600)
+
+        job.details.creation_time = now - timedelta(seconds=3400)
+        self.assertAlmostEqual(next(waits), 100, delta=1)
+
+        # Queue time exceeded: falls back to the backoff
+        job.details.creation_time = now - timedelta(seconds=7200)
+        self.assertLess(next(waits), 1)
+
+        # Explicit maximum is honored
+        job.details.creation_time = now
+        self.assertEqual(next(policy.poll_waits(job, max_poll_wait_secs=30)), 30)
+
+    def test_adaptive_status_change(self):
+        policy = AdaptivePollPolicy(jitter=0)
+        job = _job("Waiting")
+        waits = policy.poll_waits(job)
+        for _ in range(10):
+            next(waits)
+
+        job.details.status = "Executing"
+        self.assertEqual(next(waits), 0.2)
+
+        for _ in range(20):
+            next(waits)
+        job.details.status = "Finishing"
+        self.assertEqual(next(waits), 0.2)
+        for _ in range(20):
+            self.assertLessEqual(next(waits), 1)
+
+    def test_adaptive_jitter(self):
+        policy = AdaptivePollPolicy(jitter=0.5, seed=42)
+        waits = list(itertools.islice(policy.poll_waits(_job("Executing")), 30))
+        self.assertTrue(all(15 <= w <= 30 for w in waits[-5:]))
+        self.assertEqual(len(set(waits[-5:])), 5)
+
+    def test_adaptive_lookup_queue_time(self):
+        policy = AdaptivePollPolicy(jitter=0, lookup_queue_time=True)
+        job = _job("Waiting", creation_time=datetime.now(timezone.utc))
+        job.workspace._get_target_status = Mock(
+            return_value=[("quantinuum", Mock(average_queue_time=100))]
+        )
+
+        self.assertAlmostEqual(next(policy.poll_waits(job)), 50, delta=1)
+        job.workspace._get_target_status.assert_called_once_with("quantinuum.qpu.h1-1", "quantinuum")
+
+    @patch("time.sleep")
+    def test_wait_until_completed(self, sleep):
+        job = _job("Waiting")
+        statuses = iter(["Waiting", "Executing", "Succeeded"])
+        def refresh_job(job):
+            job.details = _job(next(statuses)).details
+        job.workspace._refresh_job = Mock(side_effect=refresh_job)
+        policy = Mock()
+        policy.poll_waits = Mock(return_value=iter([1, 2]))
+
+        job.wait_until_completed(poll_policy=policy, print_progress=False)
+
+        self.assertEqual(job.details.status, "Succeeded")
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,9 @@ import json
 import pytest
 import numpy as np
 import collections
+import os
+import tempfile
+from unittest.mock import patch
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.providers import JobStatus
@@ -18,6 +21,8 @@ from qiskit.providers import BackendV1 as Backend
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 from qiskit_ionq.exceptions import IonQGateError
 from qiskit_ionq import GPIGate, GPI2Gate, MSGate
+from qsharp import TargetProfile
+from azure.quantum.qiskit.qir_cache import QirCache, circuit_fingerprint
 
 from common import QuantumTestBase, DEFAULT_TIMEOUT_SECS, LOCATION
 from test_workspace import SIMPLE_RESOURCE_ID
@@ -819,6 +824,109 @@ class TestQiskit(QuantumTestBase):
         self.assertIn("entryPoint", item)
         self.assertIn("arguments", item)
 
+    @pytest.mark.ionq
+    def test_parallel_qir_generation(self):
+        provider = DummyProvider()
+        backend = provider.get_backend("ionq.simulator", input_data_format="qir.v1")
+        self.assertEqual(backend.options.get("qir_workers"), 1)
+
+        circuits = []
+        for i in range(4):
+            circuit = self._3_qubit_ghz()
+            circuit.name = f"circuit_{i}"
+            circuits.append(circuit)
+        serial_qir = backend._get_qir_str(circuits, TargetProfile.Base)
+
+        backend.set_options(qir_workers=2)
+        input_params = backend._get_input_params({})
+        payload = backend._translate_input(circuits, input_params)
+
+        # The worker count is not sent with the job, and circuits are linked in order
+        self.assertNotIn("qir_workers", input_params)
+        self.assertEqual(payload.decode("utf-8"), serial_qir)
+        self.assertEqual(
+            [item["entryPoint"] for item in input_params["items"]],
+            [circuit.name for circuit in circuits],
+        )
+
+        # The worker processes are reused by the next submissions
+        executor = backend._get_qir_executor(2)
+        input_params = backend._get_input_params({})
+        self.assertEqual(backend._translate_input(circuits, input_params), payload)
+        self.assertIs(backend._get_qir_executor(2), executor)
+
+        # Including by batches smaller than the pool
+        backend.set_options(qir_workers=4)
+        input_params = backend._get_input_params({})
+        backend._translate_input(circuits[:2], input_params)
+        executor = backend._get_qir_executor(4)
+        input_params = backend._get_input_params({})
+        self.assertEqual(backend._translate_input(circuits, input_params), payload)
+        self.assertIs(backend._get_qir_executor(4), executor)
+        self.assertIsNot(backend._get_qir_executor(3), executor)
+
+    @pytest.mark.ionq
+    def test_qir_cache(self):
+        provider = DummyProvider()
+        backend = provider.get_backend("ionq.simulator", input_data_format="qir.v1")
+        self.assertIsNone(backend.options.get("qir_cache"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = QirCache(max_size=1, directory=directory)
+            backend.set_options(qir_cache=cache)
+            circuit = self._3_qubit_ghz()
+            input_params = backend._get_input_params({})
+            payload = backend._translate_input(circuit, input_params)
+            self.assertNotIn("qir_cache", input_params)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+            # Structurally identical circuits are not compiled again
+            with patch("azure.quantum.qiskit.backends.backend.QSharpBackend") as qsharp_backend:
+                input_params = backend._get_input_params({})
+                self.assertEqual(backend._translate_input(self._3_qubit_ghz(), input_params), payload)
+                self.assertEqual(input_params["items"], [{"entryPoint": circuit.name, "arguments": []}])
+                qsharp_backend.assert_not_called()
+            self.assertEqual(cache.hits, 1)
+
+            # Different circuits, names and options are cached separately
+            other = self._3_qubit_ghz()
+            other.x(0)
+            renamed = self._3_qubit_ghz()
+            renamed.name = "renamed"
+            for circuits, profile in (
+                ([other], TargetProfile.Base),
+                ([renamed], TargetProfile.Base),
+                ([circuit], TargetProfile.Adaptive_RI),
+                ([circuit, renamed], TargetProfile.Base),
+            ):
+                self.assertEqual(
+                    backend._get_qir_str(circuits, profile),
+                    backend._get_qir_str(circuits, profile, qir_cache=QirCache(max_size=0)),
+                )
+            self.assertEqual((cache.hits, cache.misses), (1, 5))
+
+            # The on-disk tier is shared with other caches
+            shared = QirCache(directory=directory)
+            self.assertEqual(backend._get_qir_str([circuit], TargetProfile.Base, qir_cache=shared), payload.decode("utf-8"))
+            self.assertEqual(shared.hits, 1)
+            shared.clear()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_circuit_fingerprint(self):
+        circuit = self._3_qubit_ghz()
+        same = self._3_qubit_ghz()
+        same.name = "other"
+        same.metadata = {"some": "data"}
+        self.assertEqual(circuit_fingerprint(circuit), circuit_fingerprint(same))
+
+        changed = [QuantumCircuit(3, 3) for _ in range(4)]
+        changed[0].rx(0.5, 0)
+        changed[1].rx(0.25, 0)
+        changed[2].rx(0.5, 1)
+        changed[3].measure(0, 1)
+        fingerprints = {circuit_fingerprint(c) for c in changed + [circuit]}
+        self.assertEqual(len(fingerprints), 5)
+
     @pytest.mark.ionq
     @pytest.mark.live_test
     def test_qiskit_get_ionq_qpu_target(self):
@@ -0,0 +1,182 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import ast
+import json
+import random
+import unittest
+from unittest.mock import MagicMock, Mock
+
+import numpy as np
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.qiskit.job import AzureQuantumJob
+from azure.quantum.qiskit._results_formatting import (
+    bits_to_bitstrings,
+    concatenate_registers,
+    count_bitstrings,
+    display_to_bitstring,
+    format_outcomes,
+    ionq_bitstrings,
+    parse_display,
+    sum_by_bitstring,
+)
+
+
+def _qiskit_job(output_data_format, output, metadata=None, input_params=None):
+    details = JobDetails(
+        id="job", name="job", provider_id="", target="", container_uri="",
+        input_data_format="", output_data_format=output_data_format,
+        input_params=input_params or {}, metadata=metadata or {})
+    details.status = "Succeeded"
+    azure_job = Job(workspace=None, job_details=details)
+    azure_job.download_data = Mock(return_value=json.dumps(output).encode("utf8"))
+
+    job = AzureQuantumJob.__new__(AzureQuantumJob)
+    job._azure_job = azure_job
+    backend = MagicMock()
+    backend.configuration.return_value.simulator = False
+    job.backend = Mock(return_value=backend)
+    return job
+
+
+class TestQiskitResultsFormatting(unittest.TestCase):
+    """TestQiskitResultsFormatting
+
+    Tests the formatting of job results into Qiskit counts, probabilities and memory.
+    """
+
+    def test_bits_to_bitstrings(self):
+        bits = np.array([[0, 1, 1], [1, 0, 0]])
+        self.assertEqual(bits_to_bitstrings(bits).tolist(), ["011", "100"])
+        self.assertEqual(bits_to_bitstrings(np.zeros((2, 0))).tolist(), ["", ""])
+
+    def test_ionq_bitstrings(self):
+        def to_bitstring(k, num_qubits, meas_map):
+            bitstring = format(int(k), f"0{num_qubits}b")[::-1]
+            return "".join([bitstring[n] for n in meas_map])[::-1]
+
+        keys = [str(k) for k in range(32)]
+        for meas_map in ([0, 1, 2, 3, 4], [4, 0, 2], [1], [3, 3]):
+            self.assertEqual(
+                ionq_bitstrings(keys, meas_map).tolist(),
+                [to_bitstring(k, 5, meas_map) for k in keys],
+            )
+        self.assertEqual(ionq_bitstrings([str(1 << 70)], [70, 0]).tolist(), ["01"])
+
+    def test_counts_and_sums(self):
+        bitstrings = np.array(["10", "01", "10", "11", "01", "10"])
+        counts = count_bitstrings(bitstrings)
+        self.assertEqual(counts, {"10": 3, "01": 2, "11": 1})
+        # Outcomes are kept in order of first occurrence
+        self.assertEqual(list(counts), ["10", "01", "11"])
+        self.assertEqual(count_bitstrings(np.zeros(0, dtype=str)), {})
+
+        self.assertEqual(sum_by_bitstring(np.array(["1", "0", "1"]), [0.25, 0.5, 0.25]), {"1": 0.5, "0": 0.5})
+        self.assertEqual(sum_by_bitstring(np.array(["1", "0"]), [0.25, 0.75]), {"1": 0.25, "0": 0.75})
+
+        self.assertEqual(
+            concatenate_registers([["01", "11"], ["1", "0"]]).tolist(), ["011", "110"])
+        self.assertEqual(concatenate_registers([]).tolist(), [])
+
+    def test_format_outcomes(self):
+        to_bitstring = AzureQuantumJob._qir_to_qiskit_bitstring
+        shots = [random.choice([[0, 1], [1, 1], [0, 0]]) for _ in range(100)]
+        self.assertEqual(format_outcomes(shots, to_bitstring).tolist(), [to_bitstring(shot) for shot in shots])
+
+        shots = [([1, 0], 1), ([0, 0], 0), ([1, 0], 1)]
+        self.assertEqual(format_outcomes(shots, to_bitstring).tolist(), ["10 1", "00 0", "10 1"])
+
+        # Outcomes other than bits are formatted by value
+        shots = [[2, 1], [2, 1], [True, False]]
+        self.assertEqual(format_outcomes(shots, to_bitstring).tolist(), ["21", "21", "TrueFalse"])
+        shots = [[True, False], [True, True]]
+        self.assertEqual(format_outcomes(shots, to_bitstring).tolist(), ["TrueFalse", "TrueTrue"])
+
+    def test_parse_display(self):
+        for display in [
+            "[0, 1]", "[]", "()", "(0,)", "(1)", "([0, 1], 1)", "([1], ([0, 0], 1), [])",
+            "[[0, 1], [1]]", " ( [1,0] , 0 ) ", "[True, False]", "(-1, 2.5)", "[1.5e3]",
+            "[0, 1], [1]", "1,",
+        ]:
+            self.assertEqual(parse_display(display), ast.literal_eval(display), display)
+            self.assertIs(type(parse_display(display)), type(ast.literal_eval(display)))
+
+        for display in ["", "[0, 1", "[0 1]", "(0,,)", ",", "[zero]", "[0]]", ")"]:
+            with self.assertRaises(ValueError, msg=display):
+                parse_display(display)
+
+    def test_display_to_bitstring(self):
+        to_bitstring = AzureQuantumJob._qir_to_qiskit_bitstring
+        self.assertEqual(to_bitstring("([0, 1], 1, [1, 1, 0])"), "01 1 110")
+        self.assertEqual(to_bitstring("[1, 0, 1]"), "101")
+        self.assertEqual(to_bitstring("0110"), "0110")
+        self.assertEqual(to_bitstring("0 1"), "0 1")
+        self.assertEqual(to_bitstring((["1", 0], "[1]")), "10 1")
+
+        display_to_bitstring.cache_clear()
+        for _ in range(10):
+            to_bitstring("([0, 1], 0)")
+        self.assertEqual(display_to_bitstring.cache_info().hits, 9)
+
+    def test_format_quantinuum_results(self):
+        job = _qiskit_job("honeywell.quantum-results.v1", {"c0": ["0", "1", "1"], "c1": ["01", "10", "10"], "access_token": "x"})
+        self.assertEqual(job._format_quantinuum_results(), {
+            "counts": {"001": 1, "110": 2},
+            "probabilities": {"001": 1 / 3, "110": 2 / 3},
+        })
+
+    def test_format_ionq_results(self):
+        job = _qiskit_job(
+            "ionq.quantum-results.v1",
+            {"histogram": {"0": 0.25, "1": 0.25, "5": 0.5}},
+            metadata={"num_qubits": "3", "meas_map": "[0, 2]"},
+            input_params={"shots": 100},
+        )
+        self.assertEqual(job._format_ionq_results(), {
+            "counts": {"00": 25, "01": 25, "11": 50},
+            "probabilities": {"00": 0.25, "01": 0.25, "11": 0.5},
+        })
+
+        job = _qiskit_job(
+            "ionq.quantum-results.v1",
+            {"histogram": {"0": 0.25, "1": 0.25, "2": 0.5}},
+            metadata={"num_qubits": "2", "meas_map": "[1]"},
+            input_params={"shots": 100},
+        )
+        self.assertEqual(job._format_ionq_results()["probabilities"], {"0": 0.5, "1": 0.5})
+
+    def test_format_microsoft_results(self):
+        job = _qiskit_job(
+            "microsoft.quantum-results.v1",
+            {"Histogram": ["[0, 1]", 0.5, "([1], 0)", 0.5]},
+            input_params={"shots": 10},
+        )
+        self.assertEqual(job._format_microsoft_results(), {
+            "counts": {"01": 5, "1 0": 5},
+            "probabilities": {"01": 0.5, "1 0": 0.5},
+        })
+
+    def test_translate_microsoft_v2_results(self):
+        shots = [{"Item1": [0, 1], "Item2": 1}, {"Item1": [1, 1], "Item2": 0}, {"Item1": [0, 1], "Item2": 1}]
+        job = _qiskit_job("microsoft.quantum-results.v2", {
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [{
+                "Histogram": [
+                    {"Outcome": shots[0], "Display": "([0, 1], 1)", "Count": 2},
+                    {"Outcome": shots[1], "Display": "([1, 1], 0)", "Count": 1},
+                ],
+                "Shots": shots,
+            }],
+        })
+        self.assertEqual(job._translate_microsoft_v2_results(), [(3, {
+            "counts": {"01 1": 2, "11 0": 1},
+            "probabilities": {"01 1": 2 / 3, "11 0": 1 / 3},
+            "memory": ["01 1", "11 0", "01 1"],
+        })])
+
+
+if __name__ == "__main__":
+    unittest.main()
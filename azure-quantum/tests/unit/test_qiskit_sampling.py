@@ -0,0 +1,109 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock, Mock
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.qiskit.job import AzureQuantumJob
+from azure.quantum.qiskit._sampling import MultinomialSampler, job_sampler_seed
+
+
+def _simulator_job(output_data_format, output, metadata=None, input_params=None):
+    details = JobDetails(
+        id="job-id", name="job", provider_id="", target="", container_uri="",
+        input_data_format="", output_data_format=output_data_format,
+        input_params=input_params or {}, metadata=metadata or {})
+    details.status = "Succeeded"
+    azure_job = Job(workspace=None, job_details=details)
+    azure_job.download_data = Mock(return_value=json.dumps(output).encode("utf8"))
+
+    job = AzureQuantumJob.__new__(AzureQuantumJob)
+    job._azure_job = azure_job
+    backend = MagicMock()
+    backend.configuration.return_value.simulator = True
+    job.backend = Mock(return_value=backend)
+    return job
+
+
+class TestQiskitSampling(unittest.TestCase):
+    """TestQiskitSampling
+
+    Tests the synthesis of counts and per shot samples for simulator results.
+    """
+
+    def test_counts(self):
+        probabilities = {"00": 0.5, "11": 0.5, "01": 0.0}
+        counts = MultinomialSampler(1).counts(probabilities, 1000)
+        self.assertEqual(sum(counts.values()), 1000)
+        self.assertNotIn("01", counts)
+        self.assertAlmostEqual(counts["00"], 500, delta=100)
+        self.assertEqual(counts, MultinomialSampler(1).counts(probabilities, 1000))
+
+        # Probabilities are normalised within the tolerance
+        counts = MultinomialSampler(1).counts({"0": 0.50001, "1": 0.5}, 10)
+        self.assertEqual(sum(counts.values()), 10)
+        with self.assertRaises(ValueError):
+            MultinomialSampler(1).counts({"0": 0.6, "1": 0.6}, 10)
+        self.assertEqual(MultinomialSampler(1).counts({}, 10), {})
+
+        # Millions of shots are drawn at once
+        counts = MultinomialSampler(1).counts({"0": 0.25, "1": 0.75}, 10**9)
+        self.assertEqual(sum(counts.values()), 10**9)
+
+    def test_batch_counts(self):
+        experiments = [{"0": 1.0}, {"00": 0.5, "01": 0.25, "10": 0.25}, {}]
+        batch = MultinomialSampler(2).batch_counts(experiments, [10, 100, 5])
+        self.assertEqual(batch[0], {"0": 10})
+        self.assertEqual(sum(batch[1].values()), 100)
+        self.assertEqual(batch[2], {})
+        self.assertEqual(len(MultinomialSampler(2).batch_counts(experiments, 10)), 3)
+        self.assertEqual(MultinomialSampler(2).batch_counts([], 10), [])
+
+    def test_memory(self):
+        counts = {"00": 700, "11": 250, "01": 50}
+        sampler = MultinomialSampler(3)
+        blocks = list(sampler.iter_memory(counts, block_size=300))
+        self.assertEqual([len(block) for block in blocks], [300, 300, 300, 100])
+        memory = [sample for block in blocks for sample in block]
+        self.assertEqual(Counter(memory), counts)
+        # Samples are shuffled
+        self.assertNotEqual(memory, sorted(memory))
+        self.assertEqual(MultinomialSampler(3).memory({}), [])
+        with self.assertRaises(ValueError):
+            next(sampler.iter_memory(counts, block_size=0))
+
+    def test_simulator_results(self):
+        job = _simulator_job(
+            "microsoft.quantum-results.v1",
+            {"Histogram": ["[0, 0]", 0.5, "[1, 1]", 0.5]},
+            input_params={"shots": 100},
+        )
+        data = job._format_microsoft_results()
+        self.assertEqual(data["probabilities"], {"00": 0.5, "11": 0.5})
+        self.assertEqual(sum(data["counts"].values()), 100)
+        self.assertNotIn("memory", data)
+        # The seed is derived from the job id, so results are deterministic
+        self.assertEqual(data["counts"], MultinomialSampler(job_sampler_seed("job-id")).counts(data["probabilities"], 100))
+        self.assertEqual(job._format_microsoft_results()["counts"], data["counts"])
+
+        data = job._format_microsoft_results(sampler_seed=7, memory=True)
+        self.assertEqual(Counter(data["memory"]), data["counts"])
+
+        job = _simulator_job(
+            "ionq.quantum-results.v1",
+            {"histogram": {"0": 0.5, "3": 0.5}},
+            metadata={"num_qubits": "2"},
+            input_params={"shots": 10},
+        )
+        data = job._format_ionq_results(memory=True)
+        self.assertEqual(len(data["memory"]), 10)
+        self.assertEqual(Counter(data["memory"]), data["counts"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import unittest
+from concurrent.futures import Future
+from unittest.mock import Mock
+
+import numpy as np
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.results import CountsVector, job_counts, merge_counts, merge_histograms
+
+
+def _job(job_id, output_data_format, output, input_params=None, status="Succeeded"):
+    details = JobDetails(
+        id=job_id, name=job_id, provider_id="", target="", container_uri="",
+        input_data_format="", output_data_format=output_data_format,
+        input_params=input_params or {})
+    details.status = status
+    job = Job(workspace=None, job_details=details)
+    job.download_data = Mock(return_value=json.dumps(output).encode("utf8"))
+    return job
+
+
+def _v2_job(job_id, histogram, **kwargs):
+    return _job(job_id, "microsoft.quantum-results.v2", {
+        "DataFormat": "microsoft.quantum-results.v2",
+        "Results": [{
+            "Histogram": [
+                {"Outcome": outcome, "Display": str(outcome), "Count": count}
+                for outcome, count in histogram
+            ],
+            "Shots": [outcome for outcome, count in histogram for _ in range(count)],
+        }],
+    }, **kwargs)
+
+
+class TestResultsAggregation(unittest.TestCase):
+    """TestResultsAggregation
+
+    Tests the azure.quantum.results.aggregation module.
+    """
+
+    def test_job_counts(self):
+        job = _v2_job("v2", [([0, 1], 3), ({"Item1": [1, 1], "Item2": 1}, 1)])
+        self.assertEqual(job_counts(job).to_dict(), {0b10: 3, 0b111: 1})
+
+        job = _job("v1", "microsoft.quantum-results.v1", {"Histogram": ["[0, 1]", 0.25, "[1, 1]", 0.75]}, {"shots": 100})
+        self.assertEqual(job_counts(job).to_dict(), {0b10: 25, 0b11: 75})
+
+        job = _job("ionq", "ionq.quantum-results.v1", {"histogram": {"0": 0.5, "3": 0.5}}, {"shots": 10})
+        self.assertEqual(job_counts(job).to_dict(), {0: 5, 3: 5})
+
+        job = _job("quantinuum", "honeywell.quantum-results.v1", {"c": ["01", "11", "01"], "d": ["1", "0", "1"]}, {"count": 3})
+        self.assertEqual(job_counts(job).to_dict(), {0b101: 2, 0b011: 1})
+
+        job = _job("ionq", "ionq.quantum-results.v1", {"histogram": {"0": 1.0}})
+        with self.assertRaises(ValueError):
+            job_counts(job)
+
+        job = _job("dft", "microsoft.dft-results.v1", {})
+        with self.assertRaises(ValueError):
+            job_counts(job)
+
+    def test_job_counts_registers(self):
+        # The first register is in the lowest bits in every output format
+        v2 = _v2_job("v2", [(([1, 0], [1]), 2), (([0, 1], [0]), 1), (([1, 1], [0]), 1)])
+        quantinuum = _job("quantinuum", "honeywell.quantum-results.v1", {
+            "c": ["01", "01", "10", "11"],
+            "d": ["1", "1", "0", "0"],
+            "access_token": "token",
+        }, {"count": 4})
+        expected = {0b101: 2, 0b010: 1, 0b011: 1}
+        self.assertEqual(job_counts(v2).to_dict(), expected)
+        self.assertEqual(job_counts(quantinuum).to_dict(), expected)
+
+    def test_job_counts_meas_map(self):
+        # Qubit 2 is measured into bit 0 and qubit 0 into bit 1
+        job = _job("ionq", "ionq.quantum-results.v1", {"histogram": {"1": 0.5, "4": 0.25, "5": 0.25}}, {"shots": 4})
+        job.details.metadata = {"meas_map": "[2, 0]"}
+        self.assertEqual(job_counts(job).to_dict(), {0b10: 2, 0b01: 1, 0b11: 1})
+
+        job.details.metadata = {"meas_map": json.dumps([70, 0])}
+        self.assertEqual(job_counts(job).to_dict(), {0b10: 3, 0: 1})
+
+    def test_wide_outcomes(self):
+        vector = CountsVector.from_counts([1 << 70, 1, 1 << 70], [1, 2, 3])
+        self.assertEqual(vector.outcomes.dtype, object)
+        self.assertEqual(vector.to_dict(), {1: 2, 1 << 70: 4})
+        merged = merge_counts([vector, CountsVector.from_counts([1], [1])])
+        self.assertEqual(merged.to_dict(), {1: 3, 1 << 70: 4})
+
+    def test_merge_counts(self):
+        vectors = [CountsVector.from_counts([i % 5], [1]) for i in range(100)]
+        merged = merge_counts(vectors)
+        self.assertEqual(merged.outcomes.tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(merged.counts.tolist(), [20] * 5)
+        np.testing.assert_allclose(merged.probabilities(), [0.2] * 5)
+
+        merged = merge_counts(vectors[:2], weights=[2, 0.5])
+        self.assertEqual(merged.to_dict(), {0: 2, 1: 0.5})
+
+        self.assertEqual(merge_counts([]).to_dict(), {})
+
+    def test_merge_histograms(self):
+        v2 = _v2_job("v2", [([0, 0], 6), ([1, 1], 2)])
+        ionq = _job("ionq", "ionq.quantum-results.v1", {"histogram": {"0": 0.5, "3": 0.5}}, {"shots": 4})
+        quantinuum = _job("quantinuum", "honeywell.quantum-results.v1", {"c": ["11", "11"]}, {"count": 2}, status="Executing")
+        future = Future()
+
+        def as_future():
+            quantinuum.details.status = "Succeeded"
+            future.set_result(quantinuum)
+            return future
+        quantinuum.as_future = Mock(side_effect=as_future)
+
+        merged = merge_histograms([v2, ionq, quantinuum])
+        self.assertEqual(merged.to_dict(), {0: 8, 3: 6})
+        quantinuum.as_future.assert_called_once()
+
+        merged = merge_histograms([v2, ionq], weight_by_shots=False)
+        self.assertEqual(merged.to_dict(), {0: 1.25, 3: 0.75})
+
+        merged = merge_histograms([v2, ionq], weights={"ionq": 0.5})
+        self.assertEqual(merged.to_dict(), {0: 7, 3: 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
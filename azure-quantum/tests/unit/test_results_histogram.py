@@ -0,0 +1,121 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.results import Histogram, expectation_values, marginalize
+
+
+def _job(output_data_format, output, input_params=None):
+    details = JobDetails(
+        id="job", name="job", provider_id="", target="", container_uri="",
+        input_data_format="", output_data_format=output_data_format,
+        input_params=input_params or {})
+    details.status = "Succeeded"
+    job = Job(workspace=None, job_details=details)
+    job.download_data = Mock(return_value=json.dumps(output).encode("utf8"))
+    return job
+
+
+def _v2_result(shots):
+    histogram = {}
+    for shot in shots:
+        key = json.dumps(shot)
+        histogram.setdefault(key, {"Outcome": shot, "Display": str(shot), "Count": 0})["Count"] += 1
+    return {"Histogram": list(histogram.values()), "Shots": shots}
+
+
+class TestResultsHistogram(unittest.TestCase):
+    """TestResultsHistogram
+
+    Tests the azure.quantum.results.histogram module and the
+    `as_histogram` option of the job results accessors.
+    """
+
+    def test_histogram_from_outcomes(self):
+        histogram = Histogram.from_outcomes([[0, 1], {"Item1": [1], "Item2": 1}, (1, [0])], [2, 3, 5])
+        self.assertEqual(histogram.outcomes.tolist(), [2, 3, 1])
+        self.assertEqual(histogram.values.tolist(), [2, 3, 5])
+        self.assertEqual(histogram.num_bits, 2)
+        self.assertEqual(histogram.kind, "counts")
+        self.assertEqual(histogram.total, 10)
+        np.testing.assert_allclose(histogram.probabilities(), [0.2, 0.3, 0.5])
+        self.assertEqual(histogram.outcome_bits().tolist(), [[0, 1], [1, 1], [1, 0]])
+        self.assertEqual(histogram.counts_vector().to_dict(), {1: 5, 2: 2, 3: 3})
+        # Without a dict factory, the mapping is keyed by outcome code
+        self.assertEqual(dict(histogram), {2: 2, 3: 3, 1: 5})
+
+        wide = Histogram.from_outcomes([[0] * 70 + [1]], [1])
+        self.assertEqual(wide.outcomes.dtype, object)
+        self.assertEqual(wide.outcome_bits()[0].tolist(), [0] * 70 + [1])
+
+        with self.assertRaises(ValueError):
+            Histogram.from_outcomes([[0, 2]], [1])
+        with self.assertRaises(ValueError):
+            Histogram(np.zeros(2, dtype=np.int64), np.zeros(1), kind="counts")
+        with self.assertRaises(ValueError):
+            Histogram(np.zeros(1, dtype=np.int64), np.zeros(1), kind="shots")
+
+    def test_dict_is_built_lazily(self):
+        factory = Mock(return_value={"[0]": 1})
+        histogram = Histogram.from_outcomes([[0]], [1], dict_factory=factory)
+        self.assertEqual(len(histogram), 1)
+        factory.assert_not_called()
+        self.assertEqual(histogram["[0]"], 1)
+        self.assertEqual(list(histogram), ["[0]"])
+        factory.assert_called_once()
+
+    def test_get_results_histogram_as_histogram(self):
+        output = {"DataFormat": "microsoft.quantum-results.v2", "Results": [
+            _v2_result([[0, 1], [0, 1], [1, 1]]),
+            _v2_result([[{"Item1": [1], "Item2": 0}], [{"Item1": [0], "Item2": 1}]]),
+        ]}
+        job = _job("microsoft.quantum-results.v2", output)
+        histograms = job.get_results_histogram(as_histogram=True)
+        self.assertEqual(len(histograms), 2)
+        self.assertEqual(histograms[0].outcomes.tolist(), [2, 3])
+        self.assertEqual(histograms[0].values.tolist(), [2, 1])
+        self.assertEqual(histograms[1].outcomes.tolist(), [1, 2])
+        for histogram, expected in zip(histograms, job.get_results_histogram()):
+            self.assertEqual(histogram.to_dict(), expected)
+            self.assertEqual(dict(histogram.items()), expected)
+
+    def test_get_results_as_histogram(self):
+        job = _job("microsoft.quantum-results.v2", {
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [_v2_result([[0, 1], [0, 1], [1, 1], [0, 0]])],
+        })
+        histogram = job.get_results(as_histogram=True)
+        self.assertEqual(histogram.kind, "probabilities")
+        self.assertEqual(histogram.outcomes.tolist(), [2, 3, 0])
+        np.testing.assert_allclose(histogram.values, [0.5, 0.25, 0.25])
+        self.assertEqual(histogram, job.get_results())
+        self.assertEqual(histogram.counts_vector(shots=4).to_dict(), {0: 1, 2: 2, 3: 1})
+
+        job = _job("microsoft.quantum-results.v1", {"Histogram": ["[0, 0]", 0.5, "[1, 1]", 0.5]})
+        histogram = job.get_results(as_histogram=True)
+        self.assertEqual(histogram.outcomes.tolist(), [0, 3])
+        self.assertEqual(histogram.to_dict(), job.get_results())
+
+        with self.assertRaises(ValueError):
+            _job("ionq.quantum-results.v1", {"histogram": {"0": 1.0}}).get_results(as_histogram=True)
+        with self.assertRaises(ValueError):
+            _job("microsoft.quantum-results.v1", {"Histogram": ["[0]"]}).get_results(as_histogram=True)
+
+    def test_histogram_sources(self):
+        histogram = Histogram.from_outcomes([[0, 0], [1, 1], [1, 0]], [2, 1, 1])
+        self.assertEqual(marginalize(histogram, bits=[0]).to_dict(), {0: 2, 1: 2})
+        values = expectation_values(histogram, ["IZ", "ZZ"])
+        np.testing.assert_allclose(values.values, [0.0, 0.5])
+        self.assertEqual(values.shots, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
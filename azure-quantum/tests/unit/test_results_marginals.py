@@ -0,0 +1,118 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.job import ShotsArray
+from azure.quantum.results import CountsVector, marginalize, register_bits
+
+
+def _job(output_data_format, output, input_params=None):
+    details = JobDetails(
+        id="job", name="job", provider_id="", target="", container_uri="",
+        input_data_format="", output_data_format=output_data_format,
+        input_params=input_params or {})
+    details.status = "Succeeded"
+    job = Job(workspace=None, job_details=details)
+    job.download_data = Mock(return_value=json.dumps(output).encode("utf8"))
+    return job
+
+
+def _marginal_dict(histogram, bits):
+    """Marginalises a histogram outcome by outcome."""
+    marginal = {}
+    for outcome, count in histogram.items():
+        key = sum(((outcome >> bit) & 1) << j for j, bit in enumerate(bits))
+        marginal[key] = marginal.get(key, 0) + count
+    return marginal
+
+
+class TestResultsMarginals(unittest.TestCase):
+    """TestResultsMarginals
+
+    Tests the azure.quantum.results.marginals module.
+    """
+
+    def test_marginalize_counts(self):
+        rng = np.random.default_rng(0)
+        histogram = {int(outcome): float(count) for outcome, count in zip(rng.integers(0, 1 << 12, 500), rng.integers(1, 10, 500))}
+        vector = CountsVector.from_counts(histogram.keys(), histogram.values())
+        for bits in [[0], [3, 4, 5], [5, 0, 11], [], list(range(12))]:
+            self.assertEqual(marginalize(vector, bits=bits).to_dict(), _marginal_dict(vector.to_dict(), bits))
+
+        # Sparse marginals are not counted densely
+        vector = CountsVector.from_counts([1 << 40, 3], [1, 2])
+        self.assertEqual(marginalize(vector, bits=[0, 40]).to_dict(), {2: 1, 1: 2})
+        vector = CountsVector.from_counts([1 << 70, 1], [1, 2])
+        self.assertEqual(marginalize(vector, bits=[70]).to_dict(), {1: 1, 0: 2})
+
+        with self.assertRaises(ValueError):
+            marginalize(vector, bits=[0, 0])
+        with self.assertRaises(ValueError):
+            marginalize(vector)
+        with self.assertRaises(ValueError):
+            marginalize(vector, register=0)
+
+    def test_marginalize_shots(self):
+        shots = ShotsArray.from_shots([[1, 0, 1], [1, 1, 1], [0, 0, 1]])
+        self.assertEqual(marginalize(shots, bits=[0, 2]).to_dict(), {3: 2, 2: 1})
+
+    def test_marginalize_dense(self):
+        rng = np.random.default_rng(1)
+        dense = rng.random(1 << 6)
+        histogram = dict(enumerate(dense.tolist()))
+        for bits in [[0], [5, 1], [1, 3, 4], [], list(range(6)), [2, 0, 5, 1, 4, 3]]:
+            marginal = marginalize(dense, bits=bits)
+            self.assertEqual(marginal.shape, (1 << len(bits),))
+            expected = _marginal_dict(histogram, bits)
+            np.testing.assert_allclose(marginal, [expected[i] for i in range(1 << len(bits))])
+
+        with self.assertRaises(ValueError):
+            marginalize(dense[:10], bits=[0])
+        with self.assertRaises(ValueError):
+            marginalize(dense, bits=[6])
+
+    def test_marginalize_job_registers(self):
+        job = _job("microsoft.quantum-results.v2", {
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [{
+                "Histogram": [
+                    {"Outcome": {"Item1": [1, 0], "Item2": 1}, "Display": "([1, 0], 1)", "Count": 3},
+                    {"Outcome": {"Item1": [1, 1], "Item2": 0}, "Display": "([1, 1], 0)", "Count": 1},
+                ],
+                "Shots": [],
+            }],
+        })
+        self.assertEqual(register_bits(job, 0), [0, 1])
+        self.assertEqual(register_bits(job, 1), [2])
+        self.assertEqual(register_bits(job, -1), [2])
+        self.assertEqual(marginalize(job, register=0).to_dict(), {0b01: 3, 0b11: 1})
+        self.assertEqual(marginalize(job, register=1).to_dict(), {1: 3, 0: 1})
+        with self.assertRaises(ValueError):
+            register_bits(job, 2)
+
+        job = _job("microsoft.quantum-results.v1", {"Histogram": ["[0, 1]", 0.25, "[1, 1]", 0.75]})
+        self.assertEqual(marginalize(job, bits=[0]).to_dict(), {0: 0.25, 1: 0.75})
+
+        job = _job("honeywell.quantum-results.v1", {"c": ["01", "11", "01"], "d": ["1", "0", "1"]}, {"count": 3})
+        self.assertEqual(register_bits(job, "c"), [0, 1])
+        self.assertEqual(register_bits(job, "d"), [2])
+        self.assertEqual(marginalize(job, register="c").to_dict(), {0b01: 2, 0b11: 1})
+        with self.assertRaises(ValueError):
+            register_bits(job, "e")
+
+        job = _job("ionq.quantum-results.v1", {"histogram": {"0": 0.5, "5": 0.5}}, {"shots": 100})
+        self.assertEqual(marginalize(job, bits=[2]).to_dict(), {0: 50, 1: 50})
+        with self.assertRaises(ValueError):
+            register_bits(job, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
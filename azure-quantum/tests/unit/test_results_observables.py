@@ -0,0 +1,104 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.job import ShotsArray
+from azure.quantum.results import (
+    CountsVector,
+    expectation_values,
+    hamiltonian_expectation,
+    pauli_z_masks,
+)
+
+
+def _job(output_data_format, output, input_params=None):
+    details = JobDetails(
+        id="job", name="job", provider_id="", target="", container_uri="",
+        input_data_format="", output_data_format=output_data_format,
+        input_params=input_params or {})
+    details.status = "Succeeded"
+    job = Job(workspace=None, job_details=details)
+    job.download_data = Mock(return_value=json.dumps(output).encode("utf8"))
+    return job
+
+
+class TestResultsObservables(unittest.TestCase):
+    """TestResultsObservables
+
+    Tests the azure.quantum.results.observables module.
+    """
+
+    def test_pauli_z_masks(self):
+        self.assertEqual(pauli_z_masks(["ZIZ", "Z0 Z2", "Z0Z2", [0, 2], "", "III", "Z1 Z1", "Z70"]), [5, 5, 5, 5, 0, 0, 0, 1 << 70])
+        # The rightmost character acts on bit 0, as in Qiskit labels
+        self.assertEqual(pauli_z_masks(["ZII", "IIZ", "ZZI"]), [0b100, 0b001, 0b110])
+        with self.assertRaises(ValueError):
+            pauli_z_masks(["XZ"])
+        with self.assertRaises(ValueError):
+            pauli_z_masks(["X0 Z1"])
+
+    def test_expectation_values(self):
+        # 3 shots of outcome 0b01 (bit 0 set) and 1 shot of 0b11
+        histogram = {0b01: 3, 0b11: 1}
+        result = expectation_values(histogram, ["IZ", "ZI", "ZZ", "II"])
+        np.testing.assert_allclose(result.values, [-1, 0.5, -0.5, 1])
+        np.testing.assert_allclose(result.variances, [0, 0.75, 0.75, 0])
+        self.assertEqual(result.shots, 4)
+        np.testing.assert_allclose(result.standard_errors(), np.sqrt([0, 0.75, 0.75, 0]) / 2)
+
+        # Same results from shots and counts vectors
+        shots = ShotsArray.from_shots([[1, 0], [1, 0], [1, 0], [1, 1]])
+        np.testing.assert_allclose(expectation_values(shots, ["IZ", "ZI", "ZZ"]).values, [-1, 0.5, -0.5])
+        vector = CountsVector.from_counts(histogram.keys(), histogram.values())
+        np.testing.assert_allclose(expectation_values(vector, [[0], [1]]).values, [-1, 0.5])
+
+    def test_expectation_values_wide_outcomes(self):
+        histogram = {1 << 70: 1, 1: 1}
+        result = expectation_values(histogram, ["Z70", "Z0", "Z0 Z70", "Z1"])
+        np.testing.assert_allclose(result.values, [0, 0, -1, 1])
+
+    def test_expectation_values_of_jobs(self):
+        job = _job("microsoft.quantum-results.v2", {
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [{
+                "Histogram": [
+                    {"Outcome": [0, 0], "Display": "[0, 0]", "Count": 3},
+                    {"Outcome": [1, 1], "Display": "[1, 1]", "Count": 1},
+                ],
+                "Shots": [[0, 0], [0, 0], [0, 0], [1, 1]],
+            }],
+        })
+        result = expectation_values(job, ["IZ", "ZZ"])
+        np.testing.assert_allclose(result.values, [0.5, 1])
+        self.assertEqual(result.shots, 4)
+
+        job = _job("microsoft.quantum-results.v1", {"Histogram": ["[0, 0]", 0.25, "[1, 0]", 0.75]})
+        result = expectation_values(job, ["IZ", "ZI"])
+        np.testing.assert_allclose(result.values, [-0.5, 1])
+        self.assertIsNone(result.shots)
+        with self.assertRaises(ValueError):
+            result.standard_errors()
+
+    def test_hamiltonian_expectation(self):
+        histogram = {0b00: 0.5, 0b11: 0.25, 0b01: 0.25}
+        result = hamiltonian_expectation(histogram, {"IZ": 1.0, "ZZ": 0.5, (1,): -2.0})
+        # Energies: 00 -> 1 + 0.5 - 2 = -0.5, 11 -> -1 + 0.5 + 2 = 1.5, 01 -> -1 - 0.5 - 2 = -3.5
+        self.assertAlmostEqual(result.energy, 0.5 * -0.5 + 0.25 * 1.5 + 0.25 * -3.5)
+        expected_variance = 0.5 * 0.25 + 0.25 * 2.25 + 0.25 * 12.25 - result.energy ** 2
+        self.assertAlmostEqual(result.variance, expected_variance)
+        np.testing.assert_allclose(result.terms.values, [0, 0.5, 0.5])
+
+        result = hamiltonian_expectation(histogram, [("IZ", 1.0), ([1], -2.0)])
+        self.assertAlmostEqual(result.energy, -1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.results import CountMinSketch, CountsVector, TopKSketch, job_top_k, merge_top_k
+from azure.quantum.results.sketch import _bitstrings_to_outcomes
+
+
+def _job(job_id, output_data_format, output, input_params=None):
+    details = JobDetails(
+        id=job_id, name=job_id, provider_id="", target="", container_uri="",
+        input_data_format="", output_data_format=output_data_format,
+        input_params=input_params or {})
+    details.status = "Succeeded"
+    job = Job(workspace=None, job_details=details)
+    job.download_data = Mock(return_value=json.dumps(output).encode("utf8"))
+    return job
+
+
+def _v2_job(job_id, shots):
+    return _job(job_id, "microsoft.quantum-results.v2", {
+        "DataFormat": "microsoft.quantum-results.v2",
+        "Results": [{"Histogram": [], "Shots": shots}],
+    })
+
+
+class TestResultsSketch(unittest.TestCase):
+    """TestResultsSketch
+
+    Tests the azure.quantum.results.sketch module.
+    """
+
+    def test_count_min_sketch(self):
+        rng = np.random.default_rng(0)
+        outcomes = rng.integers(0, 1 << 56, 5000)
+        counts = rng.integers(1, 5, 5000).astype(np.float64)
+        sketch = CountMinSketch(width=1024, depth=4)
+        sketch.update(outcomes, counts)
+        self.assertEqual(sketch.total, counts.sum())
+
+        estimates = sketch.estimate(outcomes)
+        self.assertTrue(np.all(estimates >= counts))
+        within = estimates - counts <= sketch.epsilon * sketch.total
+        self.assertGreaterEqual(within.mean(), sketch.confidence - 0.05)
+
+        wide = CountMinSketch(width=64, depth=2)
+        wide.update(np.array([1 << 70, 1], dtype=object), np.array([3, 1]))
+        self.assertGreaterEqual(wide.estimate(np.array([1 << 70], dtype=object))[0], 3)
+
+        with self.assertRaises(ValueError):
+            sketch.merge(CountMinSketch(width=1024, depth=4, seed=1))
+
+    def test_top_k(self):
+        rng = np.random.default_rng(1)
+        # Mostly distinct outcomes, and a few heavy hitters
+        outcomes = np.concatenate([
+            rng.integers(1 << 20, 1 << 56, 20000),
+            np.repeat([5, 7, 11], [500, 300, 200]),
+        ])
+        rng.shuffle(outcomes)
+        sketch = TopKSketch(k=3, width=4096)
+        for block in np.array_split(outcomes, 10):
+            sketch.update(block)
+        top = sketch.top_k()
+        self.assertEqual(top.outcomes.tolist(), [5, 7, 11])
+        self.assertTrue(np.all(top.counts >= [500, 300, 200]))
+        self.assertTrue(np.all(top.lower_bounds() <= [500, 300, 200]))
+        self.assertEqual(top.total, len(outcomes))
+        self.assertAlmostEqual(top.error, np.e / 4096 * len(outcomes))
+        self.assertLessEqual(len(sketch._candidates), sketch.capacity)
+
+        with self.assertRaises(ValueError):
+            TopKSketch(k=0)
+
+    def test_merge(self):
+        first, second = TopKSketch(k=2), TopKSketch(k=2)
+        first.update_counts(CountsVector.from_counts([1, 2, 3], [10, 1, 4]))
+        second.update_counts(CountsVector.from_counts([2, 4], [20, 1]))
+        first.merge(second)
+        self.assertEqual(first.top_k().to_dict(), {2: 21, 1: 10})
+
+    def test_bitstrings_to_outcomes(self):
+        self.assertEqual(_bitstrings_to_outcomes([["01", "11"], ["1", "0"]]).tolist(), [0b101, 0b011])
+        self.assertEqual(_bitstrings_to_outcomes([["1" + "0" * 69]]).tolist(), [1 << 69])
+        self.assertEqual(_bitstrings_to_outcomes([["1", "10"]]).tolist(), [1, 2])
+        self.assertEqual(_bitstrings_to_outcomes([]).tolist(), [])
+        with self.assertRaises(ValueError):
+            _bitstrings_to_outcomes([["0a"]])
+
+    def test_job_top_k(self):
+        job = _v2_job("v2", [[0, 1]] * 5 + [[1, 1]] * 3 + [[0, 0]])
+        payload = job.download_data.return_value
+        job._get_blob_uri_with_sas_token = Mock(return_value="https://example/output")
+        quantinuum = _job("quantinuum", "honeywell.quantum-results.v1", {"c": ["01", "11", "01"], "d": ["1", "0", "1"], "access_token": "x"})
+        ionq = _job("ionq", "ionq.quantum-results.v1", {"histogram": {"3": 0.5, "5": 0.5}}, {"shots": 4})
+
+        # The shots of v2 outputs are streamed, not downloaded at once
+        with patch("azure.quantum.job.job.download_blob_chunks", side_effect=lambda uri: iter([payload[:20], payload[20:]])) as download:
+            top = job_top_k(job, k=2)
+            self.assertEqual(top.to_dict(), {0b10: 5, 0b11: 3})
+            job.download_data.assert_not_called()
+
+            top = merge_top_k([job, quantinuum, ionq], k=3)
+            self.assertEqual(download.call_count, 2)
+        self.assertEqual(top.to_dict(), {0b11: 6, 0b10: 5, 0b101: 4})
+        self.assertEqual(top.total, 16)
+
+    def test_job_top_k_registers(self):
+        # Shots of several registers are tuples
+        job = _v2_job("v2", [{"Item1": [1, 0], "Item2": [1]}] * 3 + [{"Item1": [0, 1], "Item2": [0]}])
+        job._get_blob_uri_with_sas_token = Mock(return_value="https://example/output")
+        payload = job.download_data.return_value
+        with patch("azure.quantum.job.job.download_blob_chunks", return_value=iter([payload])):
+            sketch = TopKSketch(k=2)
+            sketch.update_job(job, block_size=3)
+        self.assertEqual(sketch.top_k().to_dict(), {0b101: 3, 0b010: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.results_store import ResultsStore
+
+OUTPUT_DATA_URI = "https://mystorage.blob.core.windows.net/job-0/outputData?se=2050-01-01T00%3A00%3A00Z&sig=PLACEHOLDER"
+
+
+class TestResultsStore(unittest.TestCase):
+    """TestResultsStore
+
+    Tests the azure.quantum.results_store module.
+    """
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self._temp_dir.name
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_get_put(self):
+        store = ResultsStore(self.directory)
+        self.assertIsNone(store.get("job", "job-0/outputData"))
+
+        store.put("job", "job-0/outputData", '"0x1"', b"data1")
+        self.assertEqual(store.get("job", "job-0/outputData"), ('"0x1"', b"data1"))
+
+        # A new version replaces the previous one
+        store.put("job", "job-0/outputData", '"0x2"', b"data2")
+        self.assertEqual(store.get("job", "job-0/outputData"), ('"0x2"', b"data2"))
+        self.assertEqual(len(os.listdir(os.path.join(self.directory, "job"))), 1)
+
+        # Shared between instances
+        self.assertEqual(ResultsStore(self.directory).get("job", "job-0/outputData"), ('"0x2"', b"data2"))
+
+        store.clear()
+        self.assertIsNone(store.get("job", "job-0/outputData"))
+
+    def test_eviction(self):
+        store = ResultsStore(self.directory, max_size=10)
+        store.put("a", "blob", "1", b"aaaa")
+        store.put("b", "blob", "1", b"bbbb")
+        # Use "a" so that "b" is the least recently used
+        past = time.time() - 60
+        os.utime(os.path.join(self.directory, "b", os.listdir(os.path.join(self.directory, "b"))[0]), (past, past))
+        store.put("c", "blob", "1", b"cccc")
+
+        self.assertIsNotNone(store.get("a", "blob"))
+        self.assertIsNone(store.get("b", "blob"))
+        self.assertIsNotNone(store.get("c", "blob"))
+
+        # Blobs larger than the store are not stored
+        store.put("d", "blob", "1", b"d" * 11)
+        self.assertIsNone(store.get("d", "blob"))
+
+    def test_eviction_scans(self):
+        store = ResultsStore(self.directory, max_size=100)
+        with patch.object(ResultsStore, "_evict", autospec=True, side_effect=ResultsStore._evict) as evict:
+            # The directory is scanned by the first write, then only once the size crosses max_size
+            for i in range(10):
+                store.put(f"job{i}", "blob", "1", b"x" * 10)
+            self.assertEqual(evict.call_count, 1)
+
+            store.put("job10", "blob", "1", b"x" * 10)
+            self.assertEqual(evict.call_count, 2)
+            # Space is freed below max_size, so the next write does not scan again
+            self.assertEqual(store._size, 90)
+            store.put("job11", "blob", "1", b"x" * 10)
+            self.assertEqual(evict.call_count, 2)
+
+            # Replacing a blob accounts for the previous version
+            store.put("job11", "blob", "2", b"x" * 10)
+            self.assertEqual(store._size, 100)
+            self.assertEqual(evict.call_count, 2)
+
+    def _job(self):
+        details = JobDetails(
+            id="job",
+            name="job",
+            provider_id="",
+            target="",
+            container_uri="",
+            input_data_format="",
+            output_data_format="")
+        workspace = Mock()
+        workspace.results_store = ResultsStore(self.directory)
+        return Job(workspace, details)
+
+    @patch("azure.quantum.job.base_job.download_blob_if_modified")
+    def test_download_data(self, download_blob_if_modified):
+        job = self._job()
+        download_blob_if_modified.return_value = (b"output", '"0x1"')
+        self.assertEqual(job.download_data(OUTPUT_DATA_URI), b"output")
+        self.assertIsNone(download_blob_if_modified.call_args.args[1])
+
+        # Not modified: served from the store
+        download_blob_if_modified.return_value = (None, '"0x1"')
+        self.assertEqual(job.download_data(OUTPUT_DATA_URI), b"output")
+        self.assertEqual(download_blob_if_modified.call_args.args[1], '"0x1"')
+
+        # Modified: downloaded and stored again
+        download_blob_if_modified.return_value = (b"output2", '"0x2"')
+        self.assertEqual(job.download_data(OUTPUT_DATA_URI), b"output2")
+        self.assertEqual(job.workspace.results_store.get("job", "job-0/outputData"), ('"0x2"', b"output2"))
+
+    @patch("azure.quantum.job.base_job.download_blob_if_modified")
+    def test_download_attachment(self, download_blob_if_modified):
+        job = self._job()
+        download_blob_if_modified.return_value = (b"attachment", '"0x1"')
+        container_uri = "https://mystorage.blob.core.windows.net/job-0?se=2050-01-01T00%3A00%3A00Z&sig=PLACEHOLDER"
+
+        self.assertEqual(job.download_attachment("attachment", container_uri), b"attachment")
+        self.assertEqual(job.workspace.results_store.get("job", "job-0/attachment"), ('"0x1"', b"attachment"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from azure.quantum import Job, JobDetails
+from azure.quantum.job import ShotStore, ShotsArray
+
+
+class TestShotStore(unittest.TestCase):
+    """TestShotStore
+
+    Tests the azure.quantum.job.shot_store module.
+    """
+
+    shots = [
+        {"Item1": [1, 0, 0, 1, 0, 0, 0, 0, 1], "Item2": i % 2}
+        for i in range(5)
+    ]
+
+    def test_from_shots(self):
+        expected = ShotsArray.from_shots(self.shots).unpack()
+        with ShotStore.from_shots(iter(self.shots), block_size=2) as store:
+            path = store.path
+            self.assertTrue(os.path.exists(path))
+            self.assertIsInstance(store.bits, np.memmap)
+            self.assertEqual(len(store), 5)
+            self.assertEqual(store.num_bits, 10)
+            self.assertEqual(store.layout, (9, None))
+
+            np.testing.assert_array_equal(store[1], expected[1])
+            np.testing.assert_array_equal(store[-1], expected[-1])
+            np.testing.assert_array_equal(store[1:4].unpack(), expected[1:4])
+            np.testing.assert_array_equal(store[::2].unpack(), expected[::2])
+            np.testing.assert_array_equal(np.array(list(store)), expected)
+            self.assertEqual([len(block) for block in store.iter_blocks(2)], [2, 2, 1])
+            np.testing.assert_array_equal(store.register(0, block_size=2), expected[:, :9])
+            np.testing.assert_array_equal(store.register(1, block_size=2), expected[:, 9:])
+
+        # Temporary files are deleted when closed
+        self.assertFalse(os.path.exists(path))
+
+    def test_from_shots_to_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "shots.bin")
+            store = ShotStore.from_shots(self.shots, path=path)
+            store.close()
+            self.assertEqual(os.path.getsize(path), 5 * 2)
+
+            store = ShotStore(path, 5, 10, (9, None))
+            np.testing.assert_array_equal(store[:].unpack(), ShotsArray.from_shots(self.shots).unpack())
+            del store
+
+            with self.assertRaises(ValueError):
+                ShotStore.from_shots([[0, 1], [1, 1], [1]], path=path, block_size=2)
+            self.assertFalse(os.path.exists(path))
+
+    def test_empty(self):
+        with ShotStore.from_shots([]) as store:
+            self.assertEqual(len(store), 0)
+            self.assertEqual(list(store), [])
+
+    def test_job_results_shots_store(self):
+        payload = json.dumps({
+            "DataFormat": "microsoft.quantum-results.v2",
+            "Results": [{"Histogram": [], "Shots": self.shots}],
+        }).encode("utf8")
+        details = JobDetails(
+            id="job", name="job", provider_id="", target="", container_uri="",
+            input_data_format="", output_data_format="microsoft.quantum-results.v2")
+        details.status = "Succeeded"
+        details.output_data_uri = "https://mystorage.blob.core.windows.net/job/outputData"
+        job = Job(Mock(), details)
+        job._get_blob_uri_with_sas_token = Mock(side_effect=lambda uri: uri)
+
+        chunks = [payload[i:i + 16] for i in range(0, len(payload), 16)]
+        with patch("azure.quantum.job.job.download_blob_chunks", return_value=chunks):
+            with job.get_results_shots_store(block_size=3) as store:
+                np.testing.assert_array_equal(store[:].unpack(), ShotsArray.from_shots(self.shots).unpack())
+
+
+if __name__ == "__main__":
+    unittest.main()
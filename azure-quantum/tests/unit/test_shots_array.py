@@ -0,0 +1,67 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import unittest
+
+import numpy as np
+
+from azure.quantum.job import ShotsArray
+
+
+class TestShotsArray(unittest.TestCase):
+    """TestShotsArray
+
+    Tests the azure.quantum.job.shots_array module.
+    """
+
+    def test_registers(self):
+        shots = [[0, 1, 1, 0, 0, 0, 0, 0, 1], [1, 0, 0, 0, 0, 0, 0, 0, 0], [True, False, True, False, False, False, False, False, True]]
+        shots_array = ShotsArray.from_shots(shots)
+
+        self.assertEqual(len(shots_array), 3)
+        self.assertEqual(shots_array.num_bits, 9)
+        self.assertEqual(shots_array.layout, 9)
+        self.assertEqual(shots_array.bits.dtype, np.uint8)
+        self.assertEqual(shots_array.bits.shape, (3, 2))
+        self.assertEqual(shots_array.bits[0].tolist(), [0b01100000, 0b10000000])
+        np.testing.assert_array_equal(shots_array.unpack(), np.array(shots, dtype=np.uint8))
+        self.assertEqual(shots_array.register_slices(), [slice(0, 9)])
+
+    def test_tuples(self):
+        shots = [
+            {"Item1": [1, 0], "Item2": 1, "Item3": [{"Item1": 0, "Item2": [1]}]},
+            {"Item1": [0, 0], "Item2": 0, "Item3": [{"Item1": 1, "Item2": [1]}]},
+        ]
+        shots_array = ShotsArray.from_shots(shots)
+
+        self.assertEqual(shots_array.layout, (2, None, [(None, 1)]))
+        self.assertEqual(shots_array.num_bits, 5)
+        np.testing.assert_array_equal(shots_array.unpack(), [[1, 0, 1, 0, 1], [0, 0, 0, 1, 1]])
+        self.assertEqual(
+            shots_array.register_slices(),
+            [slice(0, 2), slice(2, 3), slice(3, 4), slice(4, 5)])
+
+    def test_empty(self):
+        shots_array = ShotsArray.from_shots([])
+        self.assertEqual(len(shots_array), 0)
+        self.assertEqual(shots_array.unpack().shape, (0, 0))
+
+        shots_array = ShotsArray.from_shots([[], []])
+        self.assertEqual(shots_array.unpack().shape, (2, 0))
+
+    def test_invalid_shots(self):
+        for shots in [
+            [[0, 2]],
+            [[0.5]],
+            [[0, 1], [0]],
+            [[0, 1], {"Item1": 0, "Item2": 1}],
+            [{"Item1": 0}, {"Item1": [0]}],
+        ]:
+            with self.assertRaises(ValueError):
+                ShotsArray.from_shots(shots)
+
+
+if __name__ == "__main__":
+    unittest.main()
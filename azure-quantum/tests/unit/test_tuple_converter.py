@@ -0,0 +1,71 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+
+import unittest
+
+from azure.quantum.job._tuple_converter import (
+    compile_converter,
+    convert_all,
+    convert_tuples,
+    iter_convert_all,
+)
+
+
+class TestTupleConverter(unittest.TestCase):
+    """TestTupleConverter
+
+    Tests the azure.quantum.job._tuple_converter module.
+    """
+
+    def assert_same_as_generic(self, records):
+        expected = [convert_tuples(record) for record in records]
+        self.assertEqual(convert_all(records), expected)
+        self.assertEqual(list(iter_convert_all(records)), expected)
+        # Same types, tuples and lists are not interchangeable
+        self.assertEqual(repr(convert_all(records)), repr(expected))
+
+    def test_same_layout(self):
+        self.assert_same_as_generic([[0, 1], [1, 1], [1, 0]])
+        self.assert_same_as_generic([
+            {"Item1": [1, 0], "Item2": {"Item1": -2.71, "Item2": 67}},
+            {"Item1": [0, 0], "Item2": {"Item1": 3.14, "Item2": 1}},
+        ])
+        self.assert_same_as_generic([
+            {"Item1": 1, "Item2": 0, "Item3": [{"Item1": True, "Item2": "a"}]},
+            {"Item1": 0, "Item2": 0, "Item3": [{"Item1": False, "Item2": "b"}, {"Item1": True, "Item2": None}]},
+        ])
+        self.assert_same_as_generic([[[0, 1], [1]], [[1, 1], []]])
+        self.assert_same_as_generic([1, 0, 1])
+
+    def test_different_layouts(self):
+        self.assert_same_as_generic([
+            [0, 1],
+            {"Item1": [1, 0], "Item2": 1},
+            [{"Item1": 0, "Item2": 1}],
+            [],
+            [[1], 0],
+            {"Item1": [1, 0], "Item2": {"Item1": 1, "Item2": 0}},
+            {"Item1": [1, 0], "Item2": 1, "Item3": 0},
+            1,
+        ])
+        self.assert_same_as_generic([[], [0, 1], [[0]]])
+
+    def test_converted_records_are_copies(self):
+        shot = [0, 1]
+        converted = compile_converter(shot)(shot)
+        self.assertEqual(converted, shot)
+        self.assertIsNot(converted, shot)
+
+    def test_malformed_tuples_raise(self):
+        with self.assertRaises(ValueError):
+            convert_all([{"Foo": 1}])
+        with self.assertRaises(ValueError):
+            convert_all([{"Item1": 1}, {"Item1": {"Foo": 1}}])
+        with self.assertRaises(KeyError):
+            convert_all([{"Item1": 1}, {"Item2": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
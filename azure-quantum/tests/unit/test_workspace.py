@@ -14,7 +14,7 @@ from common import (
     STORAGE,
     API_KEY,
 )
-from azure.quantum import Workspace
+from azure.quantum import Job, JobDetails, Workspace
 from azure.quantum._constants import (
     EnvironmentVariables,
     ConnectionConstants,
@@ -348,6 +348,63 @@ class TestWorkspace(QuantumTestBase):
         jobs = ws.list_jobs()
         self.assertIsInstance(jobs, list)
 
+    def test_workspace_cancel_jobs(self):
+        ws = self.create_workspace()
+        client = mock.Mock()
+        client.cancel = mock.Mock(
+            side_effect=lambda job_id: self._raise(ValueError("Bad job")) if job_id == "b" else None
+        )
+        client.get = mock.Mock(side_effect=lambda job_id: self._job_details(job_id, "Cancelled"))
+        ws._get_jobs_client = mock.Mock(return_value=client)
+        jobs = [Job(ws, self._job_details(job_id, "Waiting")) for job_id in ["a", "b", "c"]]
+
+        results = ws.cancel_jobs(jobs, max_concurrency=2)
+        self.assertEqual([r.succeeded for r in results], [True, False, True])
+        self.assertEqual([r.job for r in results], jobs)
+        self.assertIsInstance(results[1].error, ValueError)
+        client.get.assert_not_called()
+
+        results = ws.cancel_jobs(jobs, refresh=True)
+        self.assertEqual(
+            [r.job.details.status for r in results],
+            ["Cancelled", "Waiting", "Cancelled"]
+        )
+        self.assertEqual(client.get.call_count, 2)
+
+        self.assertEqual(ws.cancel_jobs([]), [])
+
+    def test_workspace_export_results(self):
+        ws = self.create_workspace()
+        jobs = [Job(ws, self._job_details(job_id, "Succeeded")) for job_id in ["a", "b"]]
+        jobs[0].export_results = mock.Mock(side_effect=lambda directory, **_: [os.path.join(directory, "histogram.npz")])
+        jobs[1].export_results = mock.Mock(side_effect=ValueError("Bad output"))
+        job_c = Job(ws, self._job_details("c", "Succeeded"))
+        job_c.export_results = mock.Mock(return_value=[])
+        ws.get_job = mock.Mock(side_effect=lambda job_id: job_c if job_id == "c" else self._raise(ValueError("Not found")))
+
+        results = ws.export_results(jobs + ["c", "d"], "results", format="npz", max_concurrency=2)
+        self.assertEqual([r.succeeded for r in results], [True, False, True, False])
+        self.assertEqual([r.job for r in results], jobs + [job_c, "d"])
+        self.assertEqual(results[0].paths, [os.path.join("results", "a", "histogram.npz")])
+        jobs[0].export_results.assert_called_once_with(os.path.join("results", "a"), format="npz", timeout_secs=300)
+        self.assertIsInstance(results[1].error, ValueError)
+
+        self.assertEqual(ws.export_results([], "results"), [])
+        with self.assertRaises(ValueError):
+            ws.export_results(jobs, "results", format="csv")
+
+    @staticmethod
+    def _raise(error):
+        raise error
+
+    @staticmethod
+    def _job_details(job_id, status):
+        details = JobDetails(
+            id=job_id, name=job_id, provider_id="ionq", target="ionq.simulator",
+            container_uri="", input_data_format="")
+        details.status = status
+        return details
+
     def test_workspace_user_agent_appid(self):
         app_id = "MyEnvVarAppId"
         user_agent = "MyUserAgent"